@@ -0,0 +1,9 @@
+"""
+Backend da API de estimativas da Mega-Sena.
+"""
+
+import time
+
+# Início da importação do pacote (antes de FastAPI e das rotas), usado por
+# app.main para medir o tempo de cold start
+IMPORT_STARTED = time.perf_counter()
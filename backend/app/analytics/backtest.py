@@ -0,0 +1,106 @@
+"""
+Backtest walk-forward da estimativa por frequência.
+Para cada concurso t, a estimativa é calculada com a janela de concursos
+anteriores a t e comparada com o resultado de t.
+
+As frequências de todas as janelas saem de uma soma acumulada da matriz
+one-hot (janela [t - w, t) = prefixo[t] - prefixo[t - w]), e os acertos
+de `popcount(aposta & sorteio)` com as dezenas em máscaras de 64 bits.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.analytics.bitmask import masks_from_indices, masks_from_one_hot, popcount
+from app.analytics.cooccurrence import MAX_NUMBER, one_hot
+from app.analytics.simulation import PICKS
+from app.utils.draw import Draw
+
+# Desempate de generate_estimates: entre frequências iguais, a menor dezena
+_TIE_BREAK = np.arange(MAX_NUMBER - 1, -1, -1, dtype=np.int64)
+
+
+def prefix_counts(matrix: np.ndarray) -> np.ndarray:
+    """Soma acumulada por dezena: linha t = frequências dos t primeiros concursos."""
+    prefix = np.zeros((len(matrix) + 1, MAX_NUMBER), dtype=np.int64)
+    np.cumsum(matrix, axis=0, out=prefix[1:])
+    return prefix
+
+
+def window_counts(prefix: np.ndarray, window: int) -> np.ndarray:
+    """
+    Frequências da janela anterior a cada concurso testado.
+
+    Args:
+        prefix: Resultado de `prefix_counts`
+        window: Tamanho da janela (0 = todo o histórico anterior)
+
+    Returns:
+        Matriz m × 60; a linha i corresponde ao concurso `first_tested(window) + i`
+    """
+    targets = np.arange(first_tested(window), len(prefix) - 1)
+    counts = prefix[targets]
+    if window:
+        counts = counts - prefix[targets - window]
+    return counts
+
+
+def first_tested(window: int) -> int:
+    """Índice do primeiro concurso com janela completa."""
+    return window if window else 1
+
+
+def estimate_indices(counts: np.ndarray, picks: int = PICKS) -> np.ndarray:
+    """
+    Dezenas (0..59) da estimativa de cada linha de frequências.
+
+    Mesmo critério de `generate_estimates`: maior frequência primeiro e,
+    no empate, a menor dezena.
+    """
+    keys = counts * (MAX_NUMBER + 4) + _TIE_BREAK
+    return np.argpartition(keys, -picks, axis=1)[:, -picks:]
+
+
+def backtest(draws: List[Draw], windows: Sequence[int]) -> List[Dict]:
+    """
+    Acertos da estimativa de 6 dezenas em cada concurso do histórico.
+
+    Args:
+        draws: Concursos ordenados pelo número
+        windows: Tamanhos de janela (0 = todo o histórico anterior)
+
+    Returns:
+        Por janela: concursos testados, distribuição de acertos, média e
+        quantidade de quadras, quinas e senas
+    """
+    matrix = one_hot(draws)
+    prefix = prefix_counts(matrix)
+    draw_masks = masks_from_one_hot(matrix)
+
+    report = []
+    for window in windows:
+        start = first_tested(window)
+        if start >= len(draws):
+            report.append(_summary(window, None, np.zeros(0, dtype=np.uint8)))
+            continue
+
+        tickets = masks_from_indices(estimate_indices(window_counts(prefix, window)))
+        hits = popcount(tickets & draw_masks[start:])
+        report.append(_summary(window, draws[start].contest, hits))
+    return report
+
+
+def _summary(window: int, first_contest, hits: np.ndarray) -> Dict:
+    counts = np.bincount(hits, minlength=PICKS + 1)
+    tested = int(len(hits))
+    return {
+        "window": window,
+        "tested": tested,
+        "first_contest": first_contest,
+        "hits": {str(k): int(counts[k]) for k in range(PICKS + 1)},
+        "mean_hits": round(float(hits.mean()), 6) if tested else 0.0,
+        "quadra": int(counts[4:].sum()),
+        "quina": int(counts[5:].sum()),
+        "sena": int(counts[6]),
+    }
@@ -0,0 +1,88 @@
+"""
+Dezenas como máscaras de 64 bits (bit n-1 = dezena n).
+Acertos entre uma aposta e um sorteio são `popcount(aposta & sorteio)`,
+vetorizado sobre todo o histórico.
+"""
+
+import threading
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from app.utils.draw import MAX_NUMBER, Draw, draws_signature
+
+# Bit de cada dezena (índice 0..59)
+BITS = np.left_shift(np.uint64(1), np.arange(MAX_NUMBER, dtype=np.uint64))
+
+# Bits ligados em cada byte (fallback sem np.bitwise_count, numpy < 2.0)
+_BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def masks_from_one_hot(matrix: np.ndarray) -> np.ndarray:
+    """Máscara de cada linha de uma matriz n × 60 de 0/1."""
+    masks: np.ndarray = np.bitwise_or.reduce(
+        np.where(matrix.astype(bool), BITS, np.uint64(0)), axis=1
+    )
+    return masks
+
+
+def masks_from_indices(indices: np.ndarray) -> np.ndarray:
+    """Máscara de cada linha de uma matriz n × k de índices de dezena (0..59)."""
+    masks: np.ndarray = np.bitwise_or.reduce(BITS[indices], axis=1)
+    return masks
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Quantidade de bits ligados em cada valor uint64."""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    counts: np.ndarray
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(values)
+    else:
+        counts = (
+            _BYTE_COUNTS[values.view(np.uint8)]
+            .reshape(*values.shape, 8)
+            .sum(axis=-1, dtype=np.uint8)
+        )
+    return counts
+
+
+class MaskIndex:
+    """
+    Máscaras de todos os concursos em um vetor uint64, na ordem dos dados.
+
+    Reconstruído apenas quando o conjunto de concursos muda; conferir uma
+    aposta é um AND e um popcount sobre o vetor inteiro.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._draws: Sequence[Draw] = ()
+        self._masks = np.zeros(0, dtype=np.uint64)
+        self._signature: Tuple[int, int, int] = (0, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def sync(self, draws: Sequence[Draw]) -> bool:
+        """Alinha o índice aos concursos; retorna True se foi reconstruído."""
+        signature = draws_signature(draws)
+        with self._lock:
+            if signature == self._signature:
+                return False
+            self._masks = np.fromiter(
+                (draw.mask for draw in draws), dtype=np.uint64, count=len(draws)
+            )
+            self._draws = list(draws)
+            self._signature = signature
+            return True
+
+    def snapshot(self) -> Tuple[Sequence[Draw], np.ndarray]:
+        """Concursos indexados e suas máscaras (substituídos, nunca alterados, a cada sync)."""
+        with self._lock:
+            return self._draws, self._masks
+
+    def hits(self, ticket_mask: int) -> Tuple[Sequence[Draw], np.ndarray]:
+        """Concursos indexados e quantos acertos a aposta teve em cada um."""
+        with self._lock:
+            return self._draws, popcount(self._masks & np.uint64(ticket_mask))
@@ -0,0 +1,198 @@
+"""
+Coocorrência de dezenas: matriz de pares 60×60 e contagens de trincas.
+As contagens são produtos de matrizes one-hot (numpy) e podem ser mantidas
+de forma incremental, somando ou subtraindo apenas os concursos que entram
+ou saem da janela.
+"""
+
+import threading
+from itertools import chain, combinations
+from math import comb
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.draw import MAX_NUMBER, Draw, draws_signature
+
+# Trincas indexadas pelo posto combinatório (ordem colexicográfica) dos
+# índices a < b < c: C(c, 3) + C(b, 2) + a, de 0 a C(60, 3) - 1
+TRIPLE_SPACE = comb(MAX_NUMBER, 3)
+
+
+def triple_rank(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Posto de cada trinca de índices de dezena (0..59) com a < b < c."""
+    rank: np.ndarray = c * (c - 1) * (c - 2) // 6 + b * (b - 1) // 2 + a
+    return rank
+
+
+def _triple_table() -> np.ndarray:
+    """Trinca de índices (a, b, c) de cada posto."""
+    combos = np.array(list(combinations(range(MAX_NUMBER), 3)), dtype=np.int64)
+    table = np.empty_like(combos)
+    table[triple_rank(combos[:, 0], combos[:, 1], combos[:, 2])] = combos
+    return table
+
+
+TRIPLE_NUMBERS = _triple_table()
+
+
+def one_hot(draws: Sequence[Draw]) -> np.ndarray:
+    """
+    Matriz concursos × dezenas (n × 60) com 1 nas dezenas sorteadas.
+
+    Dezenas fora de 1..60 são ignoradas.
+    """
+    matrix = np.zeros((len(draws), MAX_NUMBER), dtype=np.uint8)
+    if not draws:
+        return matrix
+
+    lengths = np.fromiter((len(draw.numbers) for draw in draws), dtype=np.int64, count=len(draws))
+    numbers = np.fromiter(
+        chain.from_iterable(draw.numbers for draw in draws),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    rows = np.repeat(np.arange(len(draws)), lengths)
+    valid = (numbers >= 1) & (numbers <= MAX_NUMBER)
+    matrix[rows[valid], numbers[valid] - 1] = 1
+    return matrix
+
+
+def pair_matrix(draws: Sequence[Draw]) -> np.ndarray:
+    """
+    Matriz simétrica 60×60 de pares: posição [i, j] conta os concursos com
+    as dezenas i+1 e j+1; a diagonal é a frequência simples.
+    """
+    return pairs_from_one_hot(one_hot(draws))
+
+
+def pairs_from_one_hot(matrix: np.ndarray) -> np.ndarray:
+    """Pares a partir da matriz one-hot (Xᵀ·X)."""
+    # Produto em ponto flutuante usa BLAS; as contagens são inteiros exatos
+    values = matrix.astype(np.float64)
+    return np.rint(values.T @ values).astype(np.int32)
+
+
+def triple_counts(draws: Sequence[Draw]) -> np.ndarray:
+    """Contagem de cada trinca, indexada por `triple_rank` (C(60, 3) posições)."""
+    return triples_from_one_hot(one_hot(draws))
+
+
+def triples_from_one_hot(matrix: np.ndarray) -> np.ndarray:
+    """
+    Trincas a partir da matriz one-hot.
+
+    Os concursos são agrupados pela quantidade de dezenas; em cada grupo,
+    as colunas marcadas (já em ordem crescente) formam uma matriz m × k e
+    as combinações de índices são geradas de uma vez só.
+    """
+    counts = np.zeros(TRIPLE_SPACE, dtype=np.int32)
+    lengths = matrix.sum(axis=1, dtype=np.int64)
+
+    for length in np.unique(lengths):
+        if length < 3:
+            continue
+        _, columns = np.nonzero(matrix[lengths == length])
+        numbers = columns.reshape(-1, int(length))
+        index = np.array(list(combinations(range(int(length)), 3)), dtype=np.int64)
+        a, b, c = numbers[:, index[:, 0]], numbers[:, index[:, 1]], numbers[:, index[:, 2]]
+        ranks = triple_rank(a, b, c)
+        counts += np.bincount(ranks.ravel(), minlength=TRIPLE_SPACE).astype(np.int32)
+
+    return counts
+
+
+def top_pairs(pairs: np.ndarray, k: int) -> List[Dict]:
+    """Os k pares mais frequentes (triângulo superior, sem a diagonal)."""
+    rows, cols = np.triu_indices(MAX_NUMBER, k=1)
+    values = pairs[rows, cols]
+    order = _top_indices(values, k)
+    return [
+        {"numbers": [int(rows[i]) + 1, int(cols[i]) + 1], "count": int(values[i])} for i in order
+    ]
+
+
+def top_triples(triples: np.ndarray, k: int) -> List[Dict]:
+    """As k trincas mais frequentes (apenas trincas que ocorreram)."""
+    nonzero = np.flatnonzero(triples)
+    order = _top_indices(triples[nonzero], k)
+    result = []
+    for i in order:
+        rank = int(nonzero[i])
+        result.append(
+            {"numbers": [int(n) + 1 for n in TRIPLE_NUMBERS[rank]], "count": int(triples[rank])}
+        )
+    return result
+
+
+def _top_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Índices dos k maiores valores, em ordem decrescente (empate: menor índice)."""
+    if k <= 0 or values.size == 0:
+        return np.empty(0, dtype=np.int64)
+    k = min(k, values.size)
+    candidates = np.argpartition(-values, k - 1)[:k]
+    # Ordena por contagem desc e índice asc para resultados estáveis
+    return candidates[np.lexsort((candidates, -values[candidates]))]
+
+
+def expected_count(draws: int, size: int, picks: int = 6) -> float:
+    """
+    Ocorrências esperadas de uma combinação específica de `size` dezenas
+    em `draws` sorteios uniformes de `picks` dezenas.
+    """
+    return draws * comb(MAX_NUMBER - size, picks - size) / comb(MAX_NUMBER, picks)
+
+
+class CooccurrenceIndex:
+    """
+    Pares e trincas de um conjunto de concursos, mantidos de forma
+    incremental: `sync` aplica apenas os concursos que entraram ou saíram.
+
+    As contagens são substituídas (nunca alteradas) a cada `sync`, então
+    `snapshot` devolve as próprias matrizes, sem cópia por requisição.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pairs = np.zeros((MAX_NUMBER, MAX_NUMBER), dtype=np.int32)
+        self.triples = np.zeros(TRIPLE_SPACE, dtype=np.int32)
+        self._draws: Dict[int, Draw] = {}
+        self._signature: Tuple[int, int, int] = (0, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self._draws)
+
+    def sync(self, draws: Sequence[Draw]) -> Tuple[int, int]:
+        """
+        Alinha o índice ao conjunto de concursos informado.
+
+        Returns:
+            (concursos adicionados, concursos removidos)
+        """
+        signature = draws_signature(draws)
+        with self._lock:
+            if signature == self._signature:
+                return 0, 0
+
+            current = {draw.contest: draw for draw in draws}
+            added = [draw for contest, draw in current.items() if contest not in self._draws]
+            removed = [draw for contest, draw in self._draws.items() if contest not in current]
+
+            self._apply(added, 1)
+            self._apply(removed, -1)
+            self._draws = current
+            self._signature = signature
+            return len(added), len(removed)
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Contagens atuais (pares, trincas); não devem ser alteradas."""
+        with self._lock:
+            return self.pairs, self.triples
+
+    def _apply(self, draws: Iterable[Draw], sign: int) -> None:
+        draws = list(draws)
+        if not draws:
+            return
+        matrix = one_hot(draws)
+        self.pairs = self.pairs + sign * pairs_from_one_hot(matrix)
+        self.triples = self.triples + sign * triples_from_one_hot(matrix)
@@ -0,0 +1,97 @@
+"""
+Frequências com decaimento exponencial no tempo.
+Cada concurso soma 1 às suas dezenas, e o peso acumulado cai pela metade a
+cada `half_life` dias. O estado tem 60 posições por meia-vida e é
+atualizado em O(60) por concurso novo; concursos que saem da janela têm a
+sua contribuição decaída subtraída, então o estado é sempre igual ao
+recálculo sobre a janela atual.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from app.analytics.cooccurrence import MAX_NUMBER, one_hot
+from app.analytics.sliding import SlidingDrawWindow
+from app.utils.draw import Draw
+
+
+class DecayedFrequencies(SlidingDrawWindow):
+    """
+    Pontuação decaída de cada dezena para várias meias-vidas (em dias).
+
+    As pontuações são referentes à data do concurso mais recente;
+    o decaimento até hoje é o mesmo para todas as dezenas e não altera a
+    ordem entre elas.
+    """
+
+    def __init__(self, half_lives: Sequence[int]):
+        self.half_lives = tuple(sorted(set(half_lives)))
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self.scores: Dict[int, np.ndarray] = {
+            half_life: np.zeros(MAX_NUMBER, dtype=np.float64) for half_life in self.half_lives
+        }
+        self.latest_contest: Optional[int] = None
+        self.latest_ordinal: Optional[int] = None
+
+    @property
+    def draws(self) -> int:
+        """Concursos incorporados (os da janela atual)."""
+        return len(self._window)
+
+    def add(self, draw: Draw) -> None:
+        """Incorpora o próximo concurso em O(60) por meia-vida."""
+        with self._lock:
+            self._add(draw)
+
+    def _add(self, draw: Draw) -> None:
+        drawn = self._indices(draw)
+        elapsed = draw.ordinal - self.latest_ordinal if self.latest_ordinal is not None else 0
+
+        for half_life, scores in self.scores.items():
+            if elapsed:
+                scores *= 2.0 ** (-elapsed / half_life)
+            scores[drawn] += 1.0
+
+        self._window.append(draw)
+        self.latest_contest = draw.contest
+        self.latest_ordinal = draw.ordinal
+
+    def _remove_oldest(self) -> None:
+        """Subtrai a contribuição (já decaída) do concurso mais antigo."""
+        age = self._window[-1].ordinal - self._window[0].ordinal
+        draw = self._window.popleft()
+        drawn = self._indices(draw)
+        for half_life, scores in self.scores.items():
+            scores[drawn] -= 2.0 ** (-age / half_life)
+
+    def rebuild(self, draws: Sequence[Draw]) -> None:
+        """Recalcula as pontuações em uma passada vetorizada."""
+        ordered = sorted(draws, key=lambda draw: draw.contest)
+        matrix = one_hot(ordered).astype(np.float64)
+
+        with self._lock:
+            self.reset()
+            if not ordered:
+                return
+
+            ordinals = np.fromiter(
+                (draw.ordinal for draw in ordered), dtype=np.float64, count=len(ordered)
+            )
+            ages = ordinals[-1] - ordinals
+            for half_life in self.half_lives:
+                self.scores[half_life] = np.exp2(-ages / half_life) @ matrix
+
+            self._window.extend(ordered)
+            self.latest_contest = ordered[-1].contest
+            self.latest_ordinal = ordered[-1].ordinal
+
+    def strategy_scores(self) -> Dict[str, np.ndarray]:
+        """Pontuações por estratégia de estimativa (`decay_<meia-vida>`)."""
+        with self._lock:
+            return {
+                f"decay_{half_life}": scores.copy() for half_life, scores in self.scores.items()
+            }
@@ -0,0 +1,175 @@
+"""
+Atributos por concurso (soma, pares/ímpares, baixas/altas, dezenas por
+década, dezenas consecutivas e primos) em colunas numpy compactas.
+
+Cada concurso é processado uma única vez, quando entra nos dados; os
+histogramas de qualquer janela são agregações vetorizadas sobre um
+recorte contíguo das colunas.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.analytics.cooccurrence import one_hot
+from app.utils.draw import MAX_NUMBER, Draw
+
+# Dezenas por década (1-10, 11-20, ..., 51-60)
+DECADE_SIZE = 10
+DECADES = MAX_NUMBER // DECADE_SIZE
+
+# Dezenas baixas (1-30); as demais são altas
+LOW_MAX = MAX_NUMBER // 2
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59)
+
+# Colunas de contagem (0..dezenas do concurso) agregadas como histograma
+COUNT_COLUMNS = ("odd", "low", "consecutive", "primes")
+
+_WEIGHTS = np.arange(1, MAX_NUMBER + 1, dtype=np.uint16)
+_PRIME_INDEX = np.array(PRIMES) - 1
+
+
+def extract_features(draws: Sequence[Draw]) -> Dict[str, np.ndarray]:
+    """
+    Colunas de atributos dos concursos, na ordem recebida.
+
+    Returns:
+        Dicionário coluna -> vetor (`decades` é uma matriz n × 6)
+    """
+    matrix = one_hot(draws)
+    return {
+        "contest": np.fromiter((draw.contest for draw in draws), dtype=np.int64, count=len(draws)),
+        "ordinal": np.fromiter((draw.ordinal for draw in draws), dtype=np.int64, count=len(draws)),
+        "sum": (matrix @ _WEIGHTS).astype(np.uint16),
+        "odd": matrix[:, 0::2].sum(axis=1, dtype=np.uint8),
+        "low": matrix[:, :LOW_MAX].sum(axis=1, dtype=np.uint8),
+        "consecutive": (matrix[:, 1:] & matrix[:, :-1]).sum(axis=1, dtype=np.uint8),
+        "primes": matrix[:, _PRIME_INDEX].sum(axis=1, dtype=np.uint8),
+        "decades": matrix.reshape(len(draws), DECADES, DECADE_SIZE).sum(axis=2, dtype=np.uint8),
+    }
+
+
+def _concat(head: Dict[str, np.ndarray], tail: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {name: np.concatenate([column, tail[name]]) for name, column in head.items()}
+
+
+def count_histogram(values: np.ndarray, size: int) -> Dict[str, int]:
+    """Quantos concursos têm 0..size-1 (ou mais, se houver) em uma coluna."""
+    counts = np.bincount(values, minlength=size)
+    return {str(k): int(count) for k, count in enumerate(counts)}
+
+
+def sum_histogram(values: np.ndarray, bin_width: int) -> List[Dict[str, int]]:
+    """Faixas de soma (alinhadas a múltiplos de `bin_width`) e seus concursos."""
+    if not len(values):
+        return []
+    offset = int(values.min()) // bin_width
+    counts = np.bincount(values // bin_width - offset)
+    return [
+        {
+            "start": (offset + i) * bin_width,
+            "end": (offset + i + 1) * bin_width - 1,
+            "count": int(count),
+        }
+        for i, count in enumerate(counts)
+    ]
+
+
+class FeatureTable:
+    """
+    Colunas de atributos de todos os concursos, na ordem dos dados.
+
+    `sync` calcula apenas os concursos que entraram; concursos que saíram
+    do início da janela são descartados com um recorte.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._columns = extract_features([])
+
+    def __len__(self) -> int:
+        return len(self._columns["contest"])
+
+    def sync(self, draws: Sequence[Draw]) -> str:
+        """
+        Alinha a tabela aos concursos (ordenados pelo número).
+
+        Returns:
+            "unchanged", "incremental" ou "rebuild"
+        """
+        with self._lock:
+            contests = self._columns["contest"]
+            n = len(contests)
+            if n and draws:
+                first = int(np.searchsorted(contests, draws[0].contest))
+                kept = n - first
+                if (
+                    first < n
+                    and contests[first] == draws[0].contest
+                    and kept <= len(draws)
+                    and draws[kept - 1].contest == contests[-1]
+                ):
+                    if not first and kept == len(draws):
+                        return "unchanged"
+                    head = {name: column[first:] for name, column in self._columns.items()}
+                    self._columns = _concat(head, extract_features(draws[kept:]))
+                    return "incremental"
+            elif not n and not draws:
+                return "unchanged"
+
+            self._columns = extract_features(draws)
+            return "rebuild"
+
+    def window(
+        self, last: Optional[int] = None, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Recorte contíguo das colunas, como `select_window`.
+
+        Args:
+            last: Apenas os N concursos mais recentes
+            start: Data inicial (ordinal, inclusive)
+            end: Data final (ordinal, inclusive)
+        """
+        with self._lock:
+            columns = self._columns
+        ordinals = columns["ordinal"]
+        low = 0 if start is None else int(np.searchsorted(ordinals, start, side="left"))
+        high = len(ordinals) if end is None else int(np.searchsorted(ordinals, end, side="right"))
+        if last is not None:
+            low = max(low, high - last)
+        return {name: column[low:high] for name, column in columns.items()}
+
+
+def distributions(columns: Dict[str, np.ndarray], picks: int, sum_bin: int) -> Dict:
+    """
+    Histogramas dos atributos de um recorte de `FeatureTable.window`.
+
+    Args:
+        columns: Colunas recortadas
+        picks: Dezenas por concurso (tamanho mínimo dos histogramas de contagem)
+        sum_bin: Largura das faixas de soma
+    """
+    n = len(columns["contest"])
+    result: Dict[str, Any] = {
+        "sum": {
+            "bin_width": sum_bin,
+            "mean": round(float(columns["sum"].mean()), 4) if n else 0.0,
+            "bins": sum_histogram(columns["sum"], sum_bin),
+        }
+    }
+    for name in COUNT_COLUMNS:
+        result[name] = count_histogram(columns[name], picks + 1)
+
+    decades = columns["decades"]
+    result["decades"] = [
+        {
+            "decade": f"{d * DECADE_SIZE + 1}-{(d + 1) * DECADE_SIZE}",
+            "mean": round(float(decades[:, d].mean()), 4) if n else 0.0,
+            "counts": count_histogram(decades[:, d], picks + 1),
+        }
+        for d in range(DECADES)
+    ]
+    return result
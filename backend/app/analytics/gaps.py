@@ -0,0 +1,166 @@
+"""
+Atrasos ("gaps") por dezena: concursos desde a última aparição e o maior
+intervalo sem aparecer. O estado tem tamanho fixo (60 posições), é
+atualizado em O(60) por concurso novo e reconstruído em uma passada
+vetorizada quando os dados são recarregados.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.analytics.cooccurrence import MAX_NUMBER, one_hot
+from app.utils.draw import Draw
+
+
+class GapTracker:
+    """
+    Atraso atual e maior atraso de cada dezena sobre uma sequência de
+    concursos (ordenados pelo número).
+
+    O estado cobre todos os concursos incorporados desde a última
+    reconstrução: concursos antigos que saem dos dados (poda da ingestão)
+    não reduzem o atraso máximo nem forçam reconstrução. O intervalo antes
+    da primeira aparição não conta como atraso máximo, pois começa antes do
+    histórico disponível; dezenas que nunca saíram têm atraso igual ao
+    número de concursos incorporados.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.current = np.zeros(MAX_NUMBER, dtype=np.int64)
+        self.max_gap = np.zeros(MAX_NUMBER, dtype=np.int64)
+        self.last_contest = np.zeros(MAX_NUMBER, dtype=np.int64)
+        self.seen: np.ndarray = np.zeros(MAX_NUMBER, dtype=bool)
+        self.draws = 0
+        self.first_contest: Optional[int] = None
+        self.latest_contest: Optional[int] = None
+
+    def add(self, draw: Draw) -> None:
+        """Incorpora o próximo concurso em O(60)."""
+        with self._lock:
+            self._add(draw)
+
+    def _add(self, draw: Draw) -> None:
+        drawn = np.array(
+            [num - 1 for num in draw.numbers if 1 <= num <= MAX_NUMBER], dtype=np.int64
+        )
+        # O intervalo que termina agora só conta se a dezena já havia saído
+        closing = drawn[self.seen[drawn]]
+        self.max_gap[closing] = np.maximum(self.max_gap[closing], self.current[closing])
+
+        self.current += 1
+        self.current[drawn] = 0
+        self.last_contest[drawn] = draw.contest
+        self.seen[drawn] = True
+
+        self.draws += 1
+        if self.first_contest is None:
+            self.first_contest = draw.contest
+        self.latest_contest = draw.contest
+
+    def rebuild(self, draws: Sequence[Draw]) -> None:
+        """Recalcula todo o estado em uma passada vetorizada."""
+        matrix = one_hot(draws).astype(bool)
+        n = len(draws)
+
+        with self._lock:
+            self.reset()
+            if n == 0:
+                return
+
+            rows, cols = np.nonzero(matrix.T)  # por dezena, posições em ordem
+            contests = np.fromiter((draw.contest for draw in draws), dtype=np.int64, count=n)
+
+            self.seen = np.logical_or.reduce(matrix, axis=0)
+            last_pos = np.full(MAX_NUMBER, -1, dtype=np.int64)
+            if rows.size:
+                # Última ocorrência de cada dezena: fim de cada bloco de `rows`
+                ends = np.append(np.flatnonzero(rows[1:] != rows[:-1]), rows.size - 1)
+                last_pos[rows[ends]] = cols[ends]
+            self.current = np.where(self.seen, n - 1 - last_pos, n)
+            self.last_contest = np.where(self.seen, contests[np.maximum(last_pos, 0)], 0)
+
+            # Intervalos entre aparições consecutivas da mesma dezena
+            same = rows[1:] == rows[:-1]
+            gaps = cols[1:] - cols[:-1] - 1
+            np.maximum.at(self.max_gap, rows[1:][same], gaps[same])
+
+            self.draws = n
+            self.first_contest = draws[0].contest
+            self.latest_contest = draws[-1].contest
+
+    def sync(self, draws: Sequence[Draw]) -> str:
+        """
+        Alinha o estado aos concursos informados (ordenados pelo número).
+
+        Concursos novos ao final são incorporados um a um. Concursos antigos
+        que saíram do início apenas deixam de ser fornecidos: o histórico já
+        incorporado continua valendo, então a poda não reconstrói nada. Só há
+        reconstrução na carga inicial ou se os dados não continuarem o
+        histórico incorporado (dados substituídos).
+
+        Returns:
+            "unchanged", "incremental" ou "rebuild"
+        """
+        if not draws:
+            with self._lock:
+                changed = self.draws > 0
+                self.reset()
+            return "rebuild" if changed else "unchanged"
+
+        with self._lock:
+            if self.draws and self.first_contest is not None and self.latest_contest is not None:
+                contests = [draw.contest for draw in draws]
+                end = bisect.bisect_right(contests, self.latest_contest)
+                if (
+                    draws[0].contest >= self.first_contest
+                    and end
+                    and contests[end - 1] == self.latest_contest
+                ):
+                    if end == len(draws):
+                        return "unchanged"
+                    for draw in draws[end:]:
+                        self._add(draw)
+                    return "incremental"
+
+        self.rebuild(draws)
+        return "rebuild"
+
+    def current_gap(self, number: int) -> int:
+        """Concursos desde a última aparição da dezena."""
+        return int(self.current[number - 1])
+
+    def longest_gap(self, number: int) -> int:
+        """Maior atraso da dezena (inclui o atraso atual)."""
+        return int(max(self.max_gap[number - 1], self.current[number - 1]))
+
+    def to_list(self, sort: str = "number") -> List[Dict]:
+        """
+        Atrasos de todas as dezenas.
+
+        Args:
+            sort: "number", "current" (maior atraso atual primeiro) ou "max"
+        """
+        with self._lock:
+            longest = np.maximum(self.max_gap, self.current)
+            items: List[Dict[str, Any]] = [
+                {
+                    "number": num + 1,
+                    "current_gap": int(self.current[num]),
+                    "max_gap": int(longest[num]),
+                    "last_contest": int(self.last_contest[num]) if self.seen[num] else None,
+                }
+                for num in range(MAX_NUMBER)
+            ]
+
+        if sort == "current":
+            items.sort(key=lambda item: (-item["current_gap"], item["number"]))
+        elif sort == "max":
+            items.sort(key=lambda item: (-item["max_gap"], item["number"]))
+        return items
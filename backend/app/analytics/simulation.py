@@ -0,0 +1,152 @@
+"""
+Simulação de Monte Carlo para avaliar estratégias de aposta.
+Gera sorteios uniformes com amostragem vetorizada (numpy), em blocos e
+divididos entre processos, e conta quantas dezenas de cada aposta saíram
+em cada sorteio simulado.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from math import comb
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.analytics.cooccurrence import MAX_NUMBER
+
+# Dezenas por sorteio e por aposta
+PICKS = 6
+
+# Nome da estratégia sorteada a cada simulação (linha de base)
+RANDOM_STRATEGY = "random"
+
+# Processos de simulação são criados com "spawn" (o worker tem threads)
+_context = multiprocessing.get_context("spawn")
+
+
+def sample_draws(rng: np.random.Generator, count: int) -> np.ndarray:
+    """
+    Sorteios uniformes sem reposição.
+
+    Returns:
+        Matriz count × 6 com índices de dezena (0..59)
+    """
+    keys = rng.random((count, MAX_NUMBER))
+    return np.argpartition(keys, PICKS, axis=1)[:, :PICKS]
+
+
+def simulate_hits(tickets: np.ndarray, draws: int, seed, chunk_size: int = 100_000) -> np.ndarray:
+    """
+    Distribuição de acertos de cada aposta em `draws` sorteios simulados.
+
+    Todas as apostas são avaliadas contra os mesmos sorteios; a última
+    linha é uma aposta aleatória nova a cada sorteio.
+
+    Args:
+        tickets: Matriz k × 6 de dezenas (1..60)
+        draws: Quantidade de sorteios
+        seed: Semente (int ou SeedSequence)
+        chunk_size: Sorteios gerados por bloco (limita a memória)
+
+    Returns:
+        Matriz (k + 1) × 7: contagem de sorteios com 0..6 acertos
+    """
+    rng = np.random.default_rng(seed)
+    tickets = np.asarray(tickets, dtype=np.int64).reshape(-1, PICKS) - 1
+    counts = np.zeros((len(tickets) + 1, PICKS + 1), dtype=np.int64)
+
+    remaining = draws
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        rows = np.arange(n)[:, None]
+
+        drawn = np.zeros((n, MAX_NUMBER), dtype=np.uint8)
+        drawn[rows, sample_draws(rng, n)] = 1
+
+        for index, ticket in enumerate(tickets):
+            hits = drawn[:, ticket].sum(axis=1)
+            counts[index] += np.bincount(hits, minlength=PICKS + 1)
+
+        random_hits = drawn[rows, sample_draws(rng, n)].sum(axis=1)
+        counts[-1] += np.bincount(random_hits, minlength=PICKS + 1)
+
+        remaining -= n
+
+    return counts
+
+
+def run_simulation(
+    tickets: Sequence[Sequence[int]],
+    draws: int,
+    seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = 100_000,
+) -> np.ndarray:
+    """
+    Executa a simulação dividida em `workers` processos.
+
+    Cada fatia recebe uma semente derivada de `seed` (SeedSequence.spawn),
+    então o resultado é reprodutível para os mesmos parâmetros.
+    """
+    matrix = np.asarray(tickets, dtype=np.int64).reshape(-1, PICKS)
+    workers = max(1, min(workers, draws))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [draws // workers + (1 if i < draws % workers else 0) for i in range(workers)]
+
+    if workers == 1:
+        return simulate_hits(matrix, shares[0], seeds[0], chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_context) as pool:
+        futures = [
+            pool.submit(simulate_hits, matrix, share, shard_seed, chunk_size)
+            for share, shard_seed in zip(shares, seeds)
+        ]
+        counts = np.zeros((len(matrix) + 1, PICKS + 1), dtype=np.int64)
+        for future in futures:
+            counts += future.result()
+        return counts
+
+
+def theoretical_distribution(picks: int = PICKS) -> List[float]:
+    """Probabilidade exata de 0..6 acertos com uma aposta de 6 dezenas (hipergeométrica)."""
+    total = comb(MAX_NUMBER, PICKS)
+    return [comb(picks, k) * comb(MAX_NUMBER - picks, PICKS - k) / total for k in range(PICKS + 1)]
+
+
+def summarize(counts: np.ndarray, draws: int) -> Dict:
+    """Distribuição de acertos e frequências de quadra, quina e sena."""
+    totals = [int(value) for value in counts]
+    return {
+        "hits": {str(k): totals[k] for k in range(PICKS + 1)},
+        "mean_hits": round(sum(k * totals[k] for k in range(PICKS + 1)) / draws, 6)
+        if draws
+        else 0.0,
+        "quadra": totals[4] / draws if draws else 0.0,
+        "quina": totals[5] / draws if draws else 0.0,
+        "sena": totals[6] / draws if draws else 0.0,
+    }
+
+
+def build_report(
+    strategies: Dict[str, Optional[List[int]]], counts: np.ndarray, draws: int
+) -> Dict:
+    """
+    Monta o relatório da simulação.
+
+    Args:
+        strategies: Nome -> aposta (None para a aposta aleatória)
+        counts: Resultado de `run_simulation` (última linha = aleatória)
+        draws: Sorteios simulados
+    """
+    fixed = [name for name, ticket in strategies.items() if ticket is not None]
+    report = []
+    for index, name in enumerate(fixed):
+        report.append({"name": name, "ticket": strategies[name], **summarize(counts[index], draws)})
+    report.append({"name": RANDOM_STRATEGY, "ticket": None, **summarize(counts[-1], draws)})
+
+    theoretical = theoretical_distribution()
+    return {
+        "draws": draws,
+        "strategies": report,
+        "theoretical": {"quadra": theoretical[4], "quina": theoretical[5], "sena": theoretical[6]},
+    }
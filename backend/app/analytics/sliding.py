@@ -0,0 +1,89 @@
+"""
+Base comum dos acumuladores sobre uma janela móvel de concursos.
+A janela guarda os concursos incorporados (ordenados pelo número); ao
+sincronizar, os que saíram do início são subtraídos e os novos ao final
+somados, e qualquer outra mudança nos dados recarrega o estado inteiro.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, List, Sequence
+
+from app.utils.draw import MAX_NUMBER, Draw
+
+
+class SlidingDrawWindow:
+    """
+    Janela móvel de concursos com atualização incremental.
+
+    As subclasses implementam `_add` (que deve anexar o concurso a
+    `_window`), `_remove_oldest` (que deve retirar `_window[0]`) e
+    `rebuild`; `reset` deve chamar o desta classe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self._window: Deque[Draw] = deque()
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @staticmethod
+    def _indices(draw: Draw) -> List[int]:
+        return [num - 1 for num in draw.numbers if 1 <= num <= MAX_NUMBER]
+
+    def _add(self, draw: Draw) -> None:
+        raise NotImplementedError
+
+    def _remove_oldest(self) -> None:
+        raise NotImplementedError
+
+    def rebuild(self, draws: Sequence[Draw]) -> None:
+        raise NotImplementedError
+
+    def _synced(self, draws: Sequence[Draw]) -> None:
+        """Chamado após cada sincronização incremental."""
+
+    def sync(self, draws: Sequence[Draw]) -> str:
+        """
+        Alinha a janela aos concursos informados (ordenados pelo número).
+
+        Concursos que saíram do início são subtraídos e os novos ao final
+        somados; qualquer outra mudança recarrega a janela.
+
+        Returns:
+            "unchanged", "incremental" ou "rebuild"
+        """
+        with self._lock:
+            mode = self._advance(draws)
+
+        if mode == "rebuild":
+            self.rebuild(draws)
+        elif mode == "incremental":
+            self._synced(draws)
+        return mode
+
+    def _advance(self, draws: Sequence[Draw]) -> str:
+        if not self._window or not draws:
+            return "rebuild" if (self._window or draws) else "unchanged"
+
+        removed = 0
+        while self._window and self._window[0].contest < draws[0].contest:
+            self._remove_oldest()
+            removed += 1
+
+        n = len(self._window)
+        if (
+            not n
+            or n > len(draws)
+            or draws[0].contest != self._window[0].contest
+            or draws[n - 1].contest != self._window[-1].contest
+        ):
+            return "rebuild"
+
+        for draw in draws[n:]:
+            self._add(draw)
+        return "incremental" if removed or len(draws) > n else "unchanged"
@@ -0,0 +1,125 @@
+"""
+Registro de estratégias de estimativa.
+Cada estratégia atribui uma pontuação às 60 dezenas a partir de atributos
+da janela (frequências, atraso atual e frequência ponderada), calculados
+uma única vez por atualização dos dados; a estimativa são as dezenas de
+maior pontuação (no empate, a menor dezena, como em `generate_estimates`).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.analytics.cooccurrence import MAX_NUMBER, one_hot
+from app.utils.draw import Draw
+
+# Estratégia de /api/estimate sem o parâmetro `strategy`
+DEFAULT_STRATEGY = "frequency"
+
+# Meia-vida (em concursos) do peso da estratégia "recency"
+RECENCY_HALF_LIFE = 52
+
+# Tamanho de cada faixa da estimativa
+ESTIMATE_SIZES = {"quadra": 4, "quina": 5, "sorte": 6}
+
+
+@dataclass(frozen=True)
+class DrawFeatures:
+    """
+    Atributos da janela compartilhados pelas estratégias.
+
+    Calculados por varredura completa (`build_features`) ou mantidos de
+    forma incremental por `SlidingWindowFeatures`.
+    """
+
+    draws: int
+    counts: np.ndarray
+    current_gap: np.ndarray
+    recency: np.ndarray
+
+
+Strategy = Callable[[DrawFeatures], np.ndarray]
+
+STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """Registra uma estratégia: função DrawFeatures -> pontuação das 60 dezenas."""
+
+    def decorator(func: Strategy) -> Strategy:
+        STRATEGIES[name] = func
+        return func
+
+    return decorator
+
+
+@register_strategy("frequency")
+def frequency(features: DrawFeatures) -> np.ndarray:
+    """Dezenas que mais saíram na janela."""
+    return features.counts
+
+
+@register_strategy("recency")
+def recency(features: DrawFeatures) -> np.ndarray:
+    """Frequência com peso decaindo pela metade a cada RECENCY_HALF_LIFE concursos."""
+    return features.recency
+
+
+@register_strategy("gap")
+def gap(features: DrawFeatures) -> np.ndarray:
+    """Dezenas há mais tempo sem sair."""
+    return features.current_gap
+
+
+@register_strategy("cold")
+def cold(features: DrawFeatures) -> np.ndarray:
+    """Dezenas que menos saíram na janela."""
+    return -features.counts
+
+
+def build_features(draws: Sequence[Draw]) -> DrawFeatures:
+    """Atributos da janela por varredura completa da matriz one-hot."""
+    ordered = sorted(draws, key=lambda draw: draw.contest)
+    matrix = one_hot(ordered)
+    n = len(matrix)
+
+    seen = matrix.any(axis=0)
+    since_last = np.argmax(matrix[::-1], axis=0)
+    ages = np.arange(n - 1, -1, -1)
+    return DrawFeatures(
+        draws=n,
+        counts=matrix.sum(axis=0, dtype=np.int64),
+        current_gap=np.where(seen, since_last, n),
+        recency=np.exp2(-ages / RECENCY_HALF_LIFE) @ matrix,
+    )
+
+
+def rank_numbers(scores: np.ndarray) -> np.ndarray:
+    """Dezenas (1..60) da maior para a menor pontuação; no empate, a menor dezena."""
+    return np.lexsort((np.arange(MAX_NUMBER), -np.asarray(scores, dtype=np.float64))) + 1
+
+
+def estimate_from_scores(scores: np.ndarray) -> Dict[str, List[int]]:
+    """Quadra, quina e sorte (6) com as dezenas de maior pontuação, em ordem crescente."""
+    ranking = rank_numbers(scores).tolist()
+    return {name: sorted(ranking[:size]) for name, size in ESTIMATE_SIZES.items()}
+
+
+def compute_estimates(
+    features: DrawFeatures, extra_scores: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Estimativas de todas as estratégias registradas.
+
+    Args:
+        features: Atributos da janela
+        extra_scores: Pontuações mantidas fora do registro (ex.: frequências
+            com decaimento, atualizadas de forma incremental), por nome
+    """
+    estimates = {
+        name: estimate_from_scores(strategy(features)) for name, strategy in STRATEGIES.items()
+    }
+    for name, scores in (extra_scores or {}).items():
+        estimates[name] = estimate_from_scores(scores)
+    return estimates
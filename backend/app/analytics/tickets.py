@@ -0,0 +1,126 @@
+"""
+Conferência de apostas em lote.
+Cada lote de linhas (CSV ou NDJSON) é interpretado e conferido de uma vez:
+as apostas viram máscaras de 64 bits e os acertos contra todos os
+concursos selecionados saem de um AND + popcount (apostas × concursos).
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.analytics.bitmask import popcount
+from app.utils.draw import MAX_NUMBER, Draw, numbers_to_mask
+
+# Quantidade de dezenas aceitas em uma aposta da Mega-Sena
+TICKET_MIN_NUMBERS = 6
+TICKET_MAX_NUMBERS = 15
+
+# Acertos premiados
+PRIZE_TIERS = {4: "quadra", 5: "quina", 6: "sena"}
+
+INVALID_TICKET_MESSAGE = f"Informe de {TICKET_MIN_NUMBERS} a {TICKET_MAX_NUMBERS} dezenas distintas entre 1 e {MAX_NUMBER}"
+
+
+def is_valid_ticket(numbers: Sequence[int]) -> bool:
+    """6 a 15 dezenas distintas entre 1 e 60."""
+    return (
+        TICKET_MIN_NUMBERS <= len(numbers) <= TICKET_MAX_NUMBERS
+        and len(set(numbers)) == len(numbers)
+        and all(1 <= num <= MAX_NUMBER for num in numbers)
+    )
+
+
+def parse_csv_line(line: str) -> Tuple[Optional[str], List[int]]:
+    """
+    Linha CSV: dezenas separadas por vírgula (ou ponto e vírgula), com um
+    identificador opcional no primeiro campo (`joao,1,2,3,4,5,6`).
+    """
+    fields = [field.strip() for field in line.replace(";", ",").split(",")]
+    ticket_id = None
+    if fields and not fields[0].isdigit():
+        ticket_id, fields = fields[0], fields[1:]
+    return ticket_id, [int(field) for field in fields if field]
+
+
+def parse_ndjson_line(line: str) -> Tuple[Optional[str], List[int]]:
+    """Linha NDJSON: lista de dezenas ou objeto `{"id": ..., "numbers": [...]}`."""
+    item = json.loads(line)
+    if isinstance(item, list):
+        return None, [int(num) for num in item]
+    if isinstance(item, dict) and isinstance(item.get("numbers"), list):
+        ticket_id = item.get("id")
+        return (str(ticket_id) if ticket_id is not None else None), [
+            int(num) for num in item["numbers"]
+        ]
+    raise ValueError("esperado uma lista ou um objeto com 'numbers'")
+
+
+PARSERS = {"csv": parse_csv_line, "ndjson": parse_ndjson_line}
+
+
+class TicketBatchChecker:
+    """
+    Confere lotes de apostas contra um conjunto fixo de concursos.
+
+    `check` é CPU-bound e roda fora do loop de eventos; o objeto não tem
+    estado mutável, então lotes podem ser conferidos em qualquer thread.
+    """
+
+    def __init__(self, draws: Sequence[Draw], masks: np.ndarray, fmt: str = "csv"):
+        self.contests = [draw.contest for draw in draws]
+        self.masks = masks
+        self._parse = PARSERS[fmt]
+
+    def check(self, lines: Sequence[Tuple[int, Optional[str]]]) -> List[Dict]:
+        """
+        Interpreta e confere um lote de linhas.
+
+        Args:
+            lines: (número da linha, conteúdo ou None se a linha excedeu o limite)
+
+        Returns:
+            Um resultado por linha, na mesma ordem: melhor acerto e prêmios
+            por concurso, ou o erro da linha
+        """
+        results: List[Dict] = []
+        valid: List[Tuple[int, List[int]]] = []
+
+        for number, line in lines:
+            if line is None:
+                results.append({"line": number, "error": "Linha muito longa"})
+                continue
+            try:
+                ticket_id, numbers = self._parse(line)
+            except (TypeError, ValueError) as e:
+                results.append({"line": number, "error": f"Linha inválida: {e}"})
+                continue
+            result = {"line": number, "id": ticket_id}
+            if is_valid_ticket(numbers):
+                valid.append((len(results), numbers))
+            else:
+                result["error"] = INVALID_TICKET_MESSAGE
+            results.append(result)
+
+        if not valid:
+            return results
+
+        ticket_masks = np.fromiter(
+            (numbers_to_mask(numbers) for _, numbers in valid), dtype=np.uint64, count=len(valid)
+        )
+        hits = popcount(ticket_masks[:, None] & self.masks[None, :])
+        best = hits.max(axis=1) if hits.shape[1] else np.zeros(len(valid), dtype=np.uint8)
+
+        prizes: List[List[Dict]] = [[] for _ in valid]
+        for row, col in zip(*np.nonzero(hits >= min(PRIZE_TIERS))):
+            count = int(hits[row, col])
+            prizes[row].append(
+                {"contest": self.contests[col], "hits": count, "tier": PRIZE_TIERS[count]}
+            )
+
+        for (position, numbers), best_hits, ticket_prizes in zip(valid, best, prizes):
+            results[position].update(
+                {"ticket": sorted(numbers), "best": int(best_hits), "prizes": ticket_prizes}
+            )
+        return results
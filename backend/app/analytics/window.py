@@ -0,0 +1,115 @@
+"""
+Atributos da janela de concursos mantidos de forma incremental.
+Um concurso que entra soma 6 contagens e um que sai da janela subtrai 6;
+atraso atual e frequência ponderada pela recência também são atualizados
+em O(60), então a estimativa não depende de varrer a janela inteira a cada
+concurso novo. A varredura completa acontece só na carga inicial e nas
+verificações periódicas de integridade.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from app.analytics.sliding import SlidingDrawWindow
+from app.analytics.strategies import RECENCY_HALF_LIFE, DrawFeatures, build_features
+from app.utils.draw import MAX_NUMBER, Draw
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fator aplicado à frequência ponderada a cada concurso novo
+RECENCY_DECAY = 2.0 ** (-1 / RECENCY_HALF_LIFE)
+
+
+class SlidingWindowFeatures(SlidingDrawWindow):
+    """
+    Frequências, atraso atual e frequência ponderada de uma janela móvel
+    de concursos (ordenados pelo número).
+
+    Args:
+        verify_every: Atualizações incrementais entre verificações contra a
+            varredura completa (0 desativa)
+    """
+
+    def __init__(self, verify_every: int = 0):
+        self.verify_every = verify_every
+        self.updates = 0
+        self.integrity_failures = 0
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._next_position = 0
+        self.counts = np.zeros(MAX_NUMBER, dtype=np.int64)
+        self.recency = np.zeros(MAX_NUMBER, dtype=np.float64)
+        self.last_position = np.full(MAX_NUMBER, -1, dtype=np.int64)
+
+    def _add(self, draw: Draw) -> None:
+        drawn = self._indices(draw)
+        self.counts[drawn] += 1
+        self.recency *= RECENCY_DECAY
+        self.recency[drawn] += 1.0
+        self.last_position[drawn] = self._next_position
+        self._next_position += 1
+        self._window.append(draw)
+
+    def _remove_oldest(self) -> None:
+        age = len(self._window) - 1
+        drawn = self._indices(self._window.popleft())
+        self.counts[drawn] -= 1
+        self.recency[drawn] -= RECENCY_DECAY**age
+
+    def rebuild(self, draws: Sequence[Draw]) -> None:
+        """Recarrega a janela por varredura completa."""
+        ordered = sorted(draws, key=lambda draw: draw.contest)
+        features = build_features(ordered)
+
+        with self._lock:
+            self.reset()
+            self._window.extend(ordered)
+            self._next_position = len(ordered)
+            self.counts = features.counts.copy()
+            self.recency = features.recency.copy()
+            seen = features.current_gap < len(ordered)
+            self.last_position = np.where(seen, len(ordered) - 1 - features.current_gap, -1)
+
+    def _synced(self, draws: Sequence[Draw]) -> None:
+        self.updates += 1
+        if self.verify_every and self.updates % self.verify_every == 0:
+            self.verify(draws)
+
+    def features(self) -> DrawFeatures:
+        """Atributos atuais da janela, em O(60)."""
+        with self._lock:
+            n = len(self._window)
+            latest = self._next_position - 1
+            first = self._next_position - n
+            in_window = self.last_position >= first
+            return DrawFeatures(
+                draws=n,
+                counts=self.counts.copy(),
+                current_gap=np.where(in_window, latest - self.last_position, n),
+                recency=self.recency.copy(),
+            )
+
+    def verify(self, draws: Sequence[Draw]) -> bool:
+        """
+        Confere o estado incremental com a varredura completa; se divergir,
+        registra o erro e recarrega a janela.
+        """
+        expected = build_features(draws)
+        current = self.features()
+        ok = (
+            current.draws == expected.draws
+            and np.array_equal(current.counts, expected.counts)
+            and np.array_equal(current.current_gap, expected.current_gap)
+            and np.allclose(current.recency, expected.recency)
+        )
+        if not ok:
+            self.integrity_failures += 1
+            logger.error(
+                f"Window frequencies diverged from full recount after {self.updates} updates, rebuilding"
+            )
+            self.rebuild(draws)
+        return ok
@@ -3,7 +3,7 @@ Configuração centralizada da aplicação usando Pydantic Settings.
 Carrega variáveis de ambiente do arquivo .env
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -27,6 +27,15 @@ class Settings(BaseSettings):
     port: int = Field(default=8000, description="Porta do servidor")
     debug: bool = Field(default=False, description="Modo debug")
     reload: bool = Field(default=False, description="Auto-reload")
+    workers: int = Field(default=0, description="Workers do launcher de produção (0 = um por núcleo)")
+    worker_max_requests: int = Field(
+        default=10000,
+        description="Requisições atendidas por um worker antes de ser reciclado (0 desabilita)"
+    )
+    worker_max_requests_jitter: int = Field(
+        default=1000,
+        description="Variação aleatória do limite de reciclagem, para não reciclar todos juntos"
+    )
     
     # CORS Configuration
     cors_origins: List[str] = Field(
@@ -53,6 +62,74 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="URL do Redis"
     )
+    redis_connect_timeout: float = Field(
+        default=2.0,
+        description="Timeout de conexão com o Redis em segundos"
+    )
+    redis_socket_timeout: float = Field(
+        default=1.0,
+        description="Timeout de leitura/escrita nas operações Redis em segundos"
+    )
+    redis_max_connections: int = Field(
+        default=50,
+        description="Tamanho máximo do pool de conexões Redis"
+    )
+    redis_health_check_interval: int = Field(
+        default=30,
+        description="Intervalo de verificação de conexões ociosas do pool Redis (s)"
+    )
+    redis_retry_interval: float = Field(
+        default=30.0,
+        description="Intervalo entre tentativas de reconexão ao Redis (0 desabilita)"
+    )
+    refresh_scheduler_enabled: bool = Field(
+        default=True,
+        description="Atualiza os dados conforme o calendário de sorteios em vez de pelo TTL"
+    )
+    refresh_poll_interval: float = Field(
+        default=300.0,
+        description="Intervalo de consulta ao último concurso durante a janela de sorteio (s)"
+    )
+    refresh_window_before_minutes: int = Field(
+        default=15,
+        description="Início da janela de consulta antes do horário do sorteio (min)"
+    )
+    refresh_window_after_minutes: int = Field(
+        default=360,
+        description="Fim da janela de consulta após o horário do sorteio (min)"
+    )
+    refresh_safety_interval: float = Field(
+        default=21600.0,
+        description="Intervalo máximo entre consultas fora da janela (s), cobre sorteios especiais"
+    )
+    refresh_data_ttl: int = Field(
+        default=604800,
+        description="TTL de segurança dos dados quando o agendador está ativo (s)"
+    )
+    draw_batch_max_dates: int = Field(
+        default=50,
+        description="Quantidade máxima de datas por consulta em lote de concursos"
+    )
+    cache_namespace: str = Field(
+        default="numeros-da-sorte",
+        description="Prefixo das chaves de cache (isola a aplicação no banco Redis)"
+    )
+    cache_metrics_enabled: bool = Field(
+        default=True,
+        description="Coleta métricas do cache por prefixo de chave (/api/stats)"
+    )
+    cache_rewarm_on_clear: bool = Field(
+        default=True,
+        description="Recarrega os dados antes de trocar a geração ao limpar o cache"
+    )
+    cache_snapshot_path: str = Field(
+        default="",
+        description="Arquivo de snapshot do cache em memória (vazio desabilita)"
+    )
+    cache_snapshot_interval: float = Field(
+        default=300.0,
+        description="Intervalo entre snapshots periódicos do cache em memória (s)"
+    )
     
     # Rate Limiting
     rate_limit_enabled: bool = Field(
@@ -63,6 +140,46 @@ class Settings(BaseSettings):
         default=60,
         description="Requisições permitidas por minuto"
     )
+    rate_limit_storage: str = Field(
+        default="auto",
+        description="Estado do rate limiting: 'memory', 'redis' ou 'auto' (segue cache_type)"
+    )
+    rate_limit_estimate_per_minute: int = Field(
+        default=120,
+        description="Limite por minuto de /api/estimate"
+    )
+    rate_limit_draw_per_minute: int = Field(
+        default=60,
+        description="Limite por minuto de /api/draw/{date}"
+    )
+    rate_limit_uncached_per_minute: int = Field(
+        default=10,
+        description="Limite adicional por minuto para requisições que não estão em cache"
+    )
+    rate_limit_backtest_per_minute: int = Field(
+        default=10,
+        description="Limite por minuto de /api/analytics/backtest"
+    )
+    rate_limit_simulation_per_minute: int = Field(
+        default=5,
+        description="Limite por minuto de novas simulações (POST /api/analytics/simulations)"
+    )
+    rate_limit_cache_clear_per_minute: int = Field(
+        default=2,
+        description="Limite por minuto de /api/cache/clear"
+    )
+    rate_limit_prefetch: int = Field(
+        default=5,
+        description="Tokens reservados por ida ao backend de rate limiting"
+    )
+    rate_limit_lease_seconds: float = Field(
+        default=5.0,
+        description="Validade dos tokens reservados localmente; o lote é o que o limite repõe nesse período"
+    )
+    rate_limit_backend_cooldown: float = Field(
+        default=30.0,
+        description="Tempo (s) usando o estado em memória após uma falha do Redis"
+    )
     
     # Logging
     log_level: str = Field(default="INFO", description="Nível de log")
@@ -84,7 +201,86 @@ class Settings(BaseSettings):
         default=30,
         description="Tempo em segundos antes de tentar recuperar"
     )
+
+    # Startup
+    import_time_budget_ms: float = Field(
+        default=2000,
+        description="Orçamento de tempo para importar a aplicação (ms)"
+    )
+    startup_time_budget_ms: float = Field(
+        default=3000,
+        description="Orçamento de tempo para o startup do lifespan (ms)"
+    )
+    warmup_retry_interval: float = Field(
+        default=30.0,
+        description="Intervalo entre tentativas de warmup após falha (s)"
+    )
+    http_pool_size: int = Field(
+        default=10,
+        description="Conexões mantidas no pool HTTP da API externa"
+    )
+    
+    ingest_max_in_flight: int = Field(
+        default=20,
+        description="Máximo de buscas de concursos em andamento durante a ingestão"
+    )
+    
+    # Estimativas
+    decay_half_lives: List[int] = Field(
+        default=[90, 180, 365],
+        description="Meias-vidas (em dias) das estratégias com decaimento exponencial"
+    )
+    
+    window_verify_interval: int = Field(
+        default=50,
+        description="Atualizações incrementais das frequências entre verificações completas (0 desativa)"
+    )
     
+    # Conferência de apostas em lote
+    bulk_check_batch_size: int = Field(
+        default=1000,
+        description="Apostas conferidas por lote no upload em massa"
+    )
+    
+    bulk_check_max_tickets: int = Field(
+        default=100_000,
+        description="Máximo de apostas por upload"
+    )
+    
+    # Simulação de Monte Carlo
+    simulation_workers: int = Field(
+        default=0,
+        description="Processos da simulação de Monte Carlo (0 = um por núcleo)"
+    )
+    
+    simulation_max_draws: int = Field(
+        default=10_000_000,
+        description="Máximo de sorteios simulados por job"
+    )
+    
+    simulation_chunk_size: int = Field(
+        default=100_000,
+        description="Sorteios gerados por bloco em cada processo (limita a memória)"
+    )
+    
+    # Admin / Profiling
+    admin_token: Optional[str] = Field(
+        default=None,
+        description="Token dos endpoints administrativos (desabilitados se vazio)"
+    )
+    profiler_interval_ms: float = Field(
+        default=5.0,
+        description="Intervalo de amostragem do profiler em milissegundos"
+    )
+    profiler_max_seconds: int = Field(
+        default=60,
+        description="Duração máxima de uma sessão de profiling"
+    )
+    profiler_max_request_profiles: int = Field(
+        default=20,
+        description="Quantidade de perfis por requisição mantidos em memória"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
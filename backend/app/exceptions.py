@@ -60,5 +60,6 @@ class CircuitBreakerOpenError(MegaSenaException):
 class RateLimitExceededError(MegaSenaException):
     """Limite de requisições excedido."""
     
-    def __init__(self, message: str = "Limite de requisições excedido"):
+    def __init__(self, message: str = "Limite de requisições excedido", retry_after: int = 60):
         super().__init__(message, error_code="RATE_LIMIT_EXCEEDED")
+        self.retry_after = retry_after
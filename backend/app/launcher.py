@@ -0,0 +1,228 @@
+"""
+Launcher de produção com múltiplos workers.
+
+O processo principal carrega o dataset (concursos processados e estimativa)
+uma única vez, publica-o em memória compartilhada e abre o socket. Em
+seguida cria N workers uvicorn sobre o mesmo socket e os supervisiona:
+workers que encerram (por falha ou por reciclagem após `limit_max_requests`)
+são substituídos. Apenas a primeira geração de workers lê o dataset
+publicado: os substitutos fazem o próprio warmup, já que o agendador dos
+workers pode ter incorporado concursos mais novos que o snapshot.
+
+Uso:
+    python -m app.launcher --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import time
+from multiprocessing.context import SpawnProcess
+from typing import Dict, List, Optional
+
+import uvicorn
+
+from app.config import settings
+from app.utils.logger import get_logger
+from app.utils.shared_dataset import SHARED_DATASET_ENV, publish_dataset
+
+logger = get_logger(__name__)
+
+# Workers são criados com "spawn" para não herdar sessões HTTP nem threads
+_context = multiprocessing.get_context("spawn")
+
+
+def resolve_workers(workers: int) -> int:
+    """Quantidade de workers (0 = um por núcleo)."""
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def worker_max_requests(max_requests: int, jitter: int, rng: random.Random) -> Optional[int]:
+    """
+    Limite de requisições de um worker antes da reciclagem.
+
+    O jitter evita que todos os workers reciclem ao mesmo tempo.
+    """
+    if max_requests <= 0:
+        return None
+    return max_requests + (rng.randint(0, jitter) if jitter > 0 else 0)
+
+
+def preload_dataset() -> Optional[Dict]:
+    """
+    Carrega o dataset uma vez no processo principal.
+
+    Returns:
+        Dataset para publicação, ou None se a API externa estiver
+        indisponível (os workers farão o próprio warmup)
+    """
+    from app.services.mega_sena_service import MegaSenaService
+
+    service = MegaSenaService()
+    try:
+        started = time.perf_counter()
+        data = service.get_processed_data()
+        estimate = service.get_estimates()
+        logger.info(
+            f"Dataset preloaded: {len(data)} draws in "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return {"processed_data": data, "estimate": estimate}
+    except Exception as e:
+        logger.warning(f"Dataset preload failed, workers will warm up on their own: {e}")
+        return None
+    finally:
+        service.close()
+
+
+def run_worker(config_kwargs: Dict, sock: socket.socket) -> None:
+    """Ponto de entrada de um worker."""
+    config = uvicorn.Config(**config_kwargs)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+class Supervisor:
+    """Mantém N workers ativos sobre um socket compartilhado."""
+
+    def __init__(
+        self,
+        workers: int,
+        host: str,
+        port: int,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        log_level: str = "info",
+        shared_dataset: Optional[str] = None,
+    ):
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.log_level = log_level
+        self.shared_dataset = shared_dataset
+
+        self.processes: List[SpawnProcess] = []
+        self.restarts = 0
+        self._should_exit = False
+        self._rng = random.Random()
+        self._sock: Optional[socket.socket] = None
+
+    def _config_kwargs(self) -> Dict:
+        return {
+            "app": "app.main:app",
+            "host": self.host,
+            "port": self.port,
+            "log_level": self.log_level.lower(),
+            "limit_max_requests": worker_max_requests(
+                self.max_requests, self.max_requests_jitter, self._rng
+            ),
+        }
+
+    def _spawn(self, first_generation: bool = False) -> SpawnProcess:
+        # O worker herda o ambiente no start(): só a primeira geração recebe
+        # o nome do segmento compartilhado
+        if first_generation and self.shared_dataset:
+            os.environ[SHARED_DATASET_ENV] = self.shared_dataset
+        else:
+            os.environ.pop(SHARED_DATASET_ENV, None)
+
+        process = _context.Process(
+            target=run_worker, args=(self._config_kwargs(), self._sock), name="mega-sena-worker"
+        )
+        process.start()
+        logger.info(f"Worker started (pid {process.pid})")
+        return process
+
+    def _handle_exit(self, signum, frame) -> None:
+        self._should_exit = True
+
+    def run(self) -> None:
+        """Abre o socket, cria os workers e os substitui até o encerramento."""
+        config = uvicorn.Config("app.main:app", host=self.host, port=self.port)
+        self._sock = config.bind_socket()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+
+        self.processes = [self._spawn(first_generation=True) for _ in range(self.workers)]
+        logger.info(f"Serving on http://{self.host}:{self.port} with {self.workers} workers")
+
+        try:
+            while not self._should_exit:
+                for index, process in enumerate(self.processes):
+                    if not process.is_alive() and not self._should_exit:
+                        logger.info(f"Worker {process.pid} exited ({process.exitcode}), replacing")
+                        process.join()
+                        self.processes[index] = self._spawn()
+                        self.restarts += 1
+                time.sleep(0.5)
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Encerra os workers e fecha o socket."""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join(timeout=10)
+        if self._sock is not None:
+            self._sock.close()
+        logger.info("All workers stopped")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Launcher de produção da API Mega-Sena")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.workers,
+        help="Quantidade de workers (0 = um por núcleo)",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=settings.worker_max_requests,
+        help="Recicla o worker após N requisições (0 desabilita)",
+    )
+    parser.add_argument(
+        "--max-requests-jitter", type=int, default=settings.worker_max_requests_jitter
+    )
+    parser.add_argument(
+        "--no-preload", action="store_true", help="Não pré-carrega o dataset no processo principal"
+    )
+    args = parser.parse_args(argv)
+
+    segment = None
+    if not args.no_preload:
+        dataset = preload_dataset()
+        if dataset is not None:
+            segment = publish_dataset(dataset)
+
+    supervisor = Supervisor(
+        workers=resolve_workers(args.workers),
+        host=args.host,
+        port=args.port,
+        max_requests=args.max_requests,
+        max_requests_jitter=args.max_requests_jitter,
+        log_level=settings.log_level,
+        shared_dataset=segment.name if segment is not None else None,
+    )
+
+    try:
+        supervisor.run()
+    finally:
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,152 @@ Configuração e inicialização da API com middleware e tratamento de erros.
 Versão refatorada com rate limiting, logging e segurança.
 """
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+import asyncio
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 
-from app.routes import api
+from app import IMPORT_STARTED
+from app.routes import api, admin, analytics
 from app.config import settings
+from app.utils.cache import get_cache
 from app.utils.logger import get_logger, log_request
-from app.exceptions import MegaSenaException
+from app.utils.profiler import SamplingProfiler, get_profile_store
+from app.utils.rate_limiter import rate_limit
+from app.utils.startup import StartupPhase, get_startup_state
+from app.services.analytics_service import get_analytics_service
+from app.services.refresh_scheduler import get_refresh_scheduler
+from app.exceptions import MegaSenaException, RateLimitExceededError
 
 # Configuração de logging
 logger = get_logger(__name__)
 
-# Configuração de rate limiting
-limiter = Limiter(key_func=get_remote_address)
+
+# Ciclo de vida da aplicação
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Inicializa os recursos sem bloquear a importação.
+    
+    Conecta o cache e cria o pool HTTP em paralelo (cada um em sua thread),
+    mede o tempo de startup e dispara o aquecimento do cache em background.
+    O worker só é reportado como pronto em /health/ready após o warmup.
+    """
+    startup_started = time.perf_counter()
+    state = get_startup_state()
+    state.reset()
+    state.set_phase(StartupPhase.CONNECTING)
+    logger.info(
+        f"Starting {settings.api_title} v{settings.api_version}",
+        extra={
+            "cache_type": settings.cache_type,
+            "rate_limit_enabled": settings.rate_limit_enabled
+        }
+    )
+    
+    cache = get_cache()
+    await asyncio.gather(
+        asyncio.to_thread(_timed_step, state, "cache_connect", cache.connect),
+        asyncio.to_thread(_timed_step, state, "http_pool", api.service.init_http_pool)
+    )
+    # Último estado conhecido: permite servir a estimativa mesmo com o upstream fora
+    await asyncio.to_thread(_timed_step, state, "cache_snapshot", cache.load_snapshot)
+    
+    startup_ms = (time.perf_counter() - startup_started) * 1000
+    app.state.startup_timings = {
+        "import_ms": round(IMPORT_DURATION_MS, 2),
+        "startup_ms": round(startup_ms, 2),
+        "cache_type": cache.get_type()
+    }
+    logger.info("Startup completed", extra=app.state.startup_timings)
+    
+    if IMPORT_DURATION_MS > settings.import_time_budget_ms:
+        logger.warning(
+            f"Import took {IMPORT_DURATION_MS:.0f}ms "
+            f"(budget {settings.import_time_budget_ms:.0f}ms)"
+        )
+    if startup_ms > settings.startup_time_budget_ms:
+        logger.warning(
+            f"Startup took {startup_ms:.0f}ms "
+            f"(budget {settings.startup_time_budget_ms:.0f}ms)"
+        )
+    
+    # Aquecimento do cache em background, acompanhado pelo readiness
+    app.state.warmup_task = asyncio.create_task(warmup_cache())
+    app.state.snapshot_task = (
+        asyncio.create_task(snapshot_cache()) if cache.snapshot_path else None
+    )
+    # Novos concursos são detectados pelo calendário de sorteios
+    app.state.refresh_task = (
+        asyncio.create_task(get_refresh_scheduler(api.service).run())
+        if settings.refresh_scheduler_enabled else None
+    )
+    
+    yield
+    
+    logger.info("Shutting down application")
+    app.state.warmup_task.cancel()
+    for task in (app.state.snapshot_task, app.state.refresh_task):
+        if task is not None:
+            task.cancel()
+    await asyncio.to_thread(cache.save_snapshot)
+    get_analytics_service(api.service).close()
+    await cache.aclose()
+    cache.close()
+    api.service.close()
+
+
+def _timed_step(state, step: str, func):
+    """Executa uma etapa de startup registrando sua duração."""
+    state.begin(step)
+    try:
+        result = func()
+        state.end(step)
+        return result
+    except Exception as e:
+        state.fail(step, e)
+        raise
+
+
+async def snapshot_cache():
+    """Grava periodicamente o snapshot do cache em memória."""
+    cache = get_cache()
+    
+    while True:
+        await asyncio.sleep(settings.cache_snapshot_interval)
+        await asyncio.to_thread(cache.save_snapshot)
+
+
+async def warmup_cache():
+    """
+    Aquece o cache com dados iniciais.
+    
+    Em caso de falha, o worker fica como "degraded" (não pronto) e uma
+    nova tentativa é feita após `warmup_retry_interval` segundos.
+    """
+    state = get_startup_state()
+    
+    while True:
+        attempt = state.begin_attempt()
+        state.set_phase(StartupPhase.WARMING)
+        logger.info(f"Starting cache warmup (attempt {attempt})")
+        
+        try:
+            await asyncio.to_thread(api.service.warmup, state)
+            await asyncio.to_thread(get_analytics_service(api.service).warmup, state)
+            state.set_phase(StartupPhase.READY)
+            logger.info("Cache warmup completed")
+            return
+        except Exception as e:
+            state.set_phase(StartupPhase.DEGRADED)
+            logger.error(f"Cache warmup error: {e}")
+        
+        await asyncio.sleep(settings.warmup_retry_interval)
+
 
 # Criação da aplicação
 app = FastAPI(
@@ -31,13 +157,10 @@ app = FastAPI(
     description=settings.api_description,
     version=settings.api_version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
-# Adiciona rate limiting à aplicação
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 
 # Middleware de logging de requisições
 @app.middleware("http")
@@ -77,6 +200,29 @@ async def log_requests(request: Request, call_next):
     return response
 
 
+# Middleware de profiling por requisição
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """
+    Perfila a requisição quando o header X-Profile é enviado com um
+    X-Admin-Token válido. O perfil fica disponível em
+    /api/admin/profile/requests/{id}, informado no header X-Profile-Id.
+    """
+    if "x-profile" not in request.headers or not admin.is_admin_token_valid(
+        request.headers.get("x-admin-token")
+    ):
+        return await call_next(request)
+
+    profiler = SamplingProfiler(interval=settings.profiler_interval_ms / 1000).start()
+    try:
+        response = await call_next(request)
+    finally:
+        profiler.stop()
+
+    response.headers["X-Profile-Id"] = get_profile_store().add(profiler)
+    return response
+
+
 # Middleware de segurança
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
@@ -123,6 +269,25 @@ async def mega_sena_exception_handler(request: Request, exc: MegaSenaException):
     )
 
 
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exception_handler(request: Request, exc: RateLimitExceededError):
+    """Handler para requisições acima do limite."""
+    logger.warning(
+        f"Rate limit exceeded: {exc.message}",
+        extra={"path": request.url.path}
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "detail": exc.message,
+            "error_code": exc.error_code,
+            "timestamp": datetime.now().isoformat()
+        },
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handler para erros de validação do Pydantic."""
@@ -160,50 +325,18 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Eventos de ciclo de vida
-@app.on_event("startup")
-async def startup_event():
-    """Executado ao iniciar a aplicação."""
-    logger.info(
-        f"Starting {settings.api_title} v{settings.api_version}",
-        extra={
-            "cache_type": settings.cache_type,
-            "rate_limit_enabled": settings.rate_limit_enabled
-        }
-    )
-    
-    # Aquecimento do cache em background
-    try:
-        import asyncio
-        asyncio.create_task(warmup_cache())
-    except Exception as e:
-        logger.warning(f"Cache warmup failed: {e}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Executado ao desligar a aplicação."""
-    logger.info("Shutting down application")
-
-
-async def warmup_cache():
-    """Aquece o cache com dados iniciais."""
-    try:
-        logger.info("Starting cache warmup")
-        import asyncio
-        await asyncio.to_thread(api.service.get_processed_data)
-        logger.info("Cache warmup completed")
-    except Exception as e:
-        logger.error(f"Cache warmup error: {e}")
-
-
 # Registra as rotas
 app.include_router(api.router, prefix="/api", tags=["api"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 
 
 # Endpoint raiz
-@app.get("/", tags=["root"])
-@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+@app.get(
+    "/",
+    tags=["root"],
+    dependencies=[Depends(rate_limit("root", lambda: settings.rate_limit_per_minute))]
+)
 async def root(request: Request):
     """
     Endpoint raiz da API.
@@ -217,9 +350,18 @@ async def root(request: Request):
         "docs": "/docs",
         "endpoints": {
             "health": "/api/health",
+            "liveness": "/health/live",
+            "readiness": "/health/ready",
             "estimate": "/api/estimate",
             "draw": "/api/draw/{date}",
             "stats": "/api/stats",
+            "check": "/api/check",
+            "check_bulk": "/api/check/bulk",
+            "analytics_pairs": "/api/analytics/pairs",
+            "analytics_gaps": "/api/analytics/gaps",
+            "analytics_features": "/api/analytics/features",
+            "analytics_backtest": "/api/analytics/backtest",
+            "analytics_simulations": "/api/analytics/simulations",
             "cache_clear": "/api/cache/clear"
         },
         "timestamp": datetime.now().isoformat()
@@ -234,3 +376,40 @@ async def health():
         "status": "ok",
         "timestamp": datetime.now().isoformat()
     }
+
+
+@app.get("/health/live", tags=["health"])
+async def liveness():
+    """
+    Liveness: o processo está de pé e o loop de eventos responde.
+    
+    Não depende do cache nem da API externa.
+    """
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.get("/health/ready", tags=["health"])
+async def readiness():
+    """
+    Readiness: o worker terminou o warmup e pode receber tráfego.
+    
+    Retorna 503 enquanto os concursos e artefatos derivados não estiverem
+    carregados, para que o load balancer só envie tráfego a workers aquecidos.
+    """
+    state = get_startup_state()
+    
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if state.is_ready() else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if state.is_ready() else "not_ready",
+            **state.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+
+
+# Tempo total de importação desde o pacote `app` (inclui FastAPI, rotas, serviço e configurações)
+IMPORT_DURATION_MS = (time.perf_counter() - IMPORT_STARTED) * 1000
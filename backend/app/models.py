@@ -3,7 +3,7 @@ Modelos Pydantic para validação de request/response.
 Define a estrutura de dados da API.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
@@ -32,6 +32,7 @@ class EstimateResponse(BaseModel):
     """Resposta do endpoint de estimativa."""
     
     data: str = Field(..., description="Data da estimativa")
+    strategy: str = Field("frequency", description="Estratégia usada na estimativa")
     quadra: List[int] = Field(..., description="4 números mais prováveis")
     quina: List[int] = Field(..., description="5 números mais prováveis")
     sorte: List[int] = Field(..., description="6 números mais prováveis (sena)")
@@ -70,6 +71,7 @@ class EstimateResponse(BaseModel):
         "json_schema_extra": {
             "example": {
                 "data": "2024-01-15",
+                "strategy": "frequency",
                 "quadra": [5, 12, 23, 45],
                 "quina": [5, 12, 23, 45, 58],
                 "sorte": [5, 12, 23, 45, 58, 60]
@@ -106,6 +108,279 @@ class DrawResponse(BaseModel):
     }
 
 
+class DrawBatchResponse(BaseModel):
+    """Resposta da busca de vários concursos por data."""
+    
+    draws: List[DrawResponse] = Field(..., description="Concursos encontrados")
+    not_found: List[str] = Field(default_factory=list, description="Datas sem concurso")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "draws": [
+                    {
+                        "data": "13/01/2024",
+                        "numero_concurso": "2649",
+                        "numeros": [3, 9, 17, 28, 41, 55]
+                    }
+                ],
+                "not_found": ["2024-01-14"]
+            }
+        }
+    }
+
+
+class TicketCheckResponse(BaseModel):
+    """Resultado da conferência de uma aposta contra o histórico."""
+    
+    ticket: List[int] = Field(..., description="Dezenas da aposta em ordem crescente")
+    draws: int = Field(..., description="Concursos conferidos")
+    hits: Dict[str, int] = Field(..., description="Concursos com 0..6 acertos")
+    quadra: List[DrawResponse] = Field(..., description="Concursos com 4 acertos")
+    quina: List[DrawResponse] = Field(..., description="Concursos com 5 acertos")
+    sena: List[DrawResponse] = Field(..., description="Concursos com 6 acertos")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "ticket": [5, 12, 23, 33, 45, 58, 60],
+                "draws": 312,
+                "hits": {"0": 142, "1": 121, "2": 41, "3": 7, "4": 1, "5": 0, "6": 0},
+                "quadra": [
+                    {
+                        "data": "15/01/2024",
+                        "numero_concurso": "2650",
+                        "numeros": [5, 12, 23, 45, 58, 60]
+                    }
+                ],
+                "quina": [],
+                "sena": []
+            }
+        }
+    }
+
+
+class CombinationCount(BaseModel):
+    """Combinação de dezenas e quantidade de concursos em que ocorreu."""
+    
+    numbers: List[int] = Field(..., description="Dezenas em ordem crescente")
+    count: int = Field(..., description="Concursos em que todas as dezenas saíram")
+
+
+class PairAnalyticsResponse(BaseModel):
+    """Resposta da análise de coocorrência de pares e trincas."""
+    
+    draws: int = Field(..., description="Concursos na janela analisada")
+    start: Optional[str] = Field(None, description="Data do primeiro concurso da janela")
+    end: Optional[str] = Field(None, description="Data do último concurso da janela")
+    expected_pair: float = Field(..., description="Ocorrências esperadas de um par sob sorteio uniforme")
+    expected_triple: float = Field(..., description="Ocorrências esperadas de uma trinca sob sorteio uniforme")
+    pairs: List[CombinationCount] = Field(..., description="Pares mais frequentes")
+    triples: Optional[List[CombinationCount]] = Field(None, description="Trincas mais frequentes")
+    matrix: Optional[List[List[int]]] = Field(None, description="Matriz 60×60 de pares (diagonal = frequência simples)")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "draws": 312,
+                "start": "2022-10-18",
+                "end": "2024-10-15",
+                "expected_pair": 2.6441,
+                "expected_triple": 0.0366,
+                "pairs": [{"numbers": [10, 53], "count": 9}],
+                "triples": [{"numbers": [4, 10, 53], "count": 3}],
+                "matrix": None
+            }
+        }
+    }
+
+
+class NumberGap(BaseModel):
+    """Atraso de uma dezena."""
+    
+    number: int = Field(..., description="Dezena")
+    current_gap: int = Field(..., description="Concursos desde a última aparição")
+    max_gap: int = Field(..., description="Maior atraso na janela (inclui o atual)")
+    last_contest: Optional[int] = Field(None, description="Último concurso em que saiu")
+
+
+class GapAnalyticsResponse(BaseModel):
+    """Resposta da análise de atrasos por dezena."""
+    
+    draws: int = Field(..., description="Concursos considerados")
+    latest_contest: Optional[int] = Field(None, description="Concurso mais recente considerado")
+    numbers: List[NumberGap] = Field(..., description="Atraso de cada dezena")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "draws": 312,
+                "latest_contest": 2650,
+                "numbers": [
+                    {"number": 57, "current_gap": 41, "max_gap": 52, "last_contest": 2609}
+                ]
+            }
+        }
+    }
+
+
+class SumBin(BaseModel):
+    """Faixa de soma das dezenas."""
+    
+    start: int = Field(..., description="Menor soma da faixa")
+    end: int = Field(..., description="Maior soma da faixa")
+    count: int = Field(..., description="Concursos na faixa")
+
+
+class SumDistribution(BaseModel):
+    """Histograma da soma das dezenas."""
+    
+    bin_width: int = Field(..., description="Largura das faixas")
+    mean: float = Field(..., description="Soma média")
+    bins: List[SumBin] = Field(..., description="Faixas, da menor para a maior soma")
+
+
+class DecadeDistribution(BaseModel):
+    """Dezenas sorteadas em uma década."""
+    
+    decade: str = Field(..., description="Década (ex.: 1-10)")
+    mean: float = Field(..., description="Média de dezenas da década por concurso")
+    counts: Dict[str, int] = Field(..., description="Concursos com 0..6 dezenas na década")
+
+
+class FeatureAnalyticsResponse(BaseModel):
+    """Resposta da distribuição de atributos dos concursos."""
+    
+    draws: int = Field(..., description="Concursos na janela")
+    start: Optional[str] = Field(None, description="Data do primeiro concurso da janela")
+    end: Optional[str] = Field(None, description="Data do último concurso da janela")
+    sum: SumDistribution = Field(..., description="Soma das dezenas")
+    odd: Dict[str, int] = Field(..., description="Concursos com 0..6 dezenas ímpares")
+    low: Dict[str, int] = Field(..., description="Concursos com 0..6 dezenas baixas (1-30)")
+    consecutive: Dict[str, int] = Field(..., description="Concursos com 0..5 pares de dezenas consecutivas")
+    primes: Dict[str, int] = Field(..., description="Concursos com 0..6 dezenas primas")
+    decades: List[DecadeDistribution] = Field(..., description="Distribuição por década")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "draws": 312,
+                "start": "2022-01-15",
+                "end": "2024-01-15",
+                "sum": {"bin_width": 10, "mean": 183.2, "bins": [{"start": 90, "end": 99, "count": 2}]},
+                "odd": {"0": 4, "1": 29, "2": 75, "3": 104, "4": 72, "5": 25, "6": 3},
+                "low": {"0": 5, "1": 30, "2": 74, "3": 101, "4": 73, "5": 26, "6": 3},
+                "consecutive": {"0": 173, "1": 116, "2": 21, "3": 2, "4": 0, "5": 0, "6": 0},
+                "primes": {"0": 52, "1": 112, "2": 94, "3": 43, "4": 10, "5": 1, "6": 0},
+                "decades": [
+                    {"decade": "1-10", "mean": 0.98, "counts": {"0": 102, "1": 124, "2": 67, "3": 17, "4": 2, "5": 0, "6": 0}}
+                ]
+            }
+        }
+    }
+
+
+class BacktestWindow(BaseModel):
+    """Desempenho histórico da estimativa com uma janela de concursos."""
+    
+    window: int = Field(..., description="Concursos anteriores usados na estimativa (0 = todos)")
+    tested: int = Field(..., description="Concursos testados")
+    first_contest: Optional[int] = Field(None, description="Primeiro concurso testado")
+    hits: Dict[str, int] = Field(..., description="Concursos com 0..6 acertos")
+    mean_hits: float = Field(..., description="Média de acertos por concurso")
+    quadra: int = Field(..., description="Concursos com 4 ou mais acertos")
+    quina: int = Field(..., description="Concursos com 5 ou mais acertos")
+    sena: int = Field(..., description="Concursos com 6 acertos")
+
+
+class BacktestResponse(BaseModel):
+    """Resposta do backtest walk-forward da estimativa."""
+    
+    draws: int = Field(..., description="Concursos no histórico")
+    expected_mean_hits: float = Field(..., description="Média de acertos esperada ao acaso")
+    windows: List[BacktestWindow] = Field(..., description="Resultado por tamanho de janela")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "draws": 312,
+                "expected_mean_hits": 0.6,
+                "windows": [
+                    {
+                        "window": 100,
+                        "tested": 212,
+                        "first_contest": 2439,
+                        "hits": {"0": 109, "1": 79, "2": 22, "3": 2, "4": 0, "5": 0, "6": 0},
+                        "mean_hits": 0.617925,
+                        "quadra": 0,
+                        "quina": 0,
+                        "sena": 0
+                    }
+                ]
+            }
+        }
+    }
+
+
+class StrategyScore(BaseModel):
+    """Desempenho simulado de uma estratégia de aposta."""
+    
+    name: str = Field(..., description="Estratégia")
+    ticket: Optional[List[int]] = Field(None, description="Aposta avaliada (null para a aleatória)")
+    hits: Dict[str, int] = Field(..., description="Sorteios simulados com 0..6 acertos")
+    mean_hits: float = Field(..., description="Média de acertos por sorteio")
+    quadra: float = Field(..., description="Frequência de quadras")
+    quina: float = Field(..., description="Frequência de quinas")
+    sena: float = Field(..., description="Frequência de senas")
+
+
+class SimulationResult(BaseModel):
+    """Resultado de uma simulação de Monte Carlo."""
+    
+    draws: int = Field(..., description="Sorteios simulados")
+    strategies: List[StrategyScore] = Field(..., description="Desempenho de cada estratégia")
+    theoretical: Dict[str, float] = Field(..., description="Probabilidades exatas por aposta de 6 dezenas")
+
+
+class SimulationJobResponse(BaseModel):
+    """Estado de um job de simulação."""
+    
+    id: str = Field(..., description="Identificador do job (derivado dos parâmetros)")
+    status: str = Field(..., description="pending, running, done ou failed")
+    params: Optional[Dict[str, Any]] = Field(None, description="Sorteios, semente e apostas avaliadas")
+    submitted_at: Optional[str] = Field(None, description="Quando o job foi agendado")
+    finished_at: Optional[str] = Field(None, description="Quando o job terminou")
+    duration_s: Optional[float] = Field(None, description="Duração da simulação em segundos")
+    result: Optional[SimulationResult] = Field(None, description="Resultado (quando concluído)")
+    error: Optional[str] = Field(None, description="Erro (quando falhou)")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "id": "3f1c2a9b8e7d6c5a",
+                "status": "done",
+                "params": {"draws": 1000000, "seed": 0},
+                "duration_s": 2.6,
+                "result": {
+                    "draws": 1000000,
+                    "strategies": [
+                        {
+                            "name": "frequency",
+                            "ticket": [5, 10, 23, 33, 42, 53],
+                            "hits": {"0": 584818, "1": 349011, "2": 60065, "3": 5823, "4": 280, "5": 3, "6": 0},
+                            "mean_hits": 0.600147,
+                            "quadra": 0.00028,
+                            "quina": 0.000003,
+                            "sena": 0.0
+                        }
+                    ],
+                    "theoretical": {"quadra": 0.000433, "quina": 0.0000065, "sena": 0.00000002}
+                }
+            }
+        }
+    }
+
+
 class ErrorResponse(BaseModel):
     """Resposta de erro padronizada."""
     
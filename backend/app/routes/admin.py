@@ -0,0 +1,168 @@
+"""
+Rotas administrativas.
+Endpoints de diagnóstico protegidos por token (header X-Admin-Token).
+"""
+
+import asyncio
+import hmac
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.utils.cache import get_cache
+from app.utils.logger import get_logger
+from app.utils.profiler import (
+    SamplingProfiler,
+    acquire_worker_profile,
+    release_worker_profile,
+    get_profile_store,
+)
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+
+def is_admin_token_valid(token: Optional[str]) -> bool:
+    """Verifica se o token informado corresponde ao token administrativo."""
+    if not settings.admin_token or not token:
+        return False
+    return hmac.compare_digest(token, settings.admin_token)
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Dependência que exige o token administrativo."""
+    if not settings.admin_token:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "detail": "Endpoints administrativos desabilitados",
+                "error_code": "ADMIN_DISABLED",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+    if not is_admin_token_valid(x_admin_token):
+        logger.warning("Invalid admin token")
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "detail": "Token administrativo inválido",
+                "error_code": "UNAUTHORIZED",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+def _profile_response(profiler: SamplingProfiler, fmt: str):
+    """Monta a resposta no formato solicitado."""
+    if fmt == "speedscope":
+        return profiler.speedscope()
+    return PlainTextResponse(profiler.collapsed())
+
+
+@router.get(
+    "/profile",
+    summary="Perfilar Worker",
+    description="Amostra as pilhas de todas as threads do worker por N segundos",
+    dependencies=[Depends(require_admin)],
+)
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0, description="Duração da amostragem"),
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope)$"),
+    interval_ms: Optional[float] = Query(None, gt=0, description="Intervalo entre amostras"),
+):
+    """
+    Executa o profiler por amostragem sobre o worker atual.
+
+    O loop de eventos continua atendendo requisições durante a amostragem,
+    portanto o perfil reflete o tráfego real, incluindo as threads de ingestão.
+
+    Returns:
+        Pilhas agregadas (collapsed) ou JSON do speedscope
+    """
+    seconds = min(seconds, settings.profiler_max_seconds)
+    interval = (interval_ms or settings.profiler_interval_ms) / 1000
+
+    if not acquire_worker_profile():
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "detail": "Já existe uma sessão de profiling em andamento",
+                "error_code": "PROFILER_BUSY",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+    logger.info(f"Worker profiling started for {seconds}s")
+
+    try:
+        profiler = SamplingProfiler(interval=interval).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+    finally:
+        release_worker_profile()
+
+    logger.info(f"Worker profiling finished with {profiler.sample_count} samples")
+    return _profile_response(profiler, format)
+
+
+@router.get(
+    "/profile/requests",
+    summary="Listar Perfis por Requisição",
+    description="Lista os perfis gerados pelo header X-Profile",
+    dependencies=[Depends(require_admin)],
+)
+async def list_request_profiles():
+    """Lista os perfis de requisição disponíveis."""
+    return {"profiles": get_profile_store().list(), "timestamp": datetime.now().isoformat()}
+
+
+@router.get(
+    "/profile/requests/{profile_id}",
+    summary="Obter Perfil de Requisição",
+    description="Retorna o perfil de uma requisição marcada com X-Profile",
+    dependencies=[Depends(require_admin)],
+)
+async def get_request_profile(
+    profile_id: str, format: str = Query("collapsed", pattern="^(collapsed|speedscope)$")
+):
+    """Retorna um perfil de requisição pelo identificador."""
+    profiler = get_profile_store().get(profile_id)
+
+    if profiler is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "detail": f"Perfil {profile_id} não encontrado",
+                "error_code": "PROFILE_NOT_FOUND",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+    return _profile_response(profiler, format)
+
+
+@router.get(
+    "/cache/keys",
+    summary="Principais Chaves do Cache",
+    description="Lista as chaves do cache com maior tamanho ou mais acessos neste worker",
+    dependencies=[Depends(require_admin)],
+)
+async def cache_top_keys(
+    limit: int = Query(20, ge=1, le=500, description="Quantidade de chaves"),
+    sort: str = Query("bytes", pattern="^(bytes|accesses)$", description="Ordenação"),
+):
+    """Chaves acompanhadas pelas métricas do cache, para calibrar TTLs e memória."""
+    cache = get_cache()
+    return {
+        "cache_type": cache.get_type(),
+        "generation": cache.get_generation(),
+        "sort": sort,
+        "keys": cache.metrics.top_keys(limit=limit, sort=sort),
+        "timestamp": datetime.now().isoformat(),
+    }
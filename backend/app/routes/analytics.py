@@ -0,0 +1,353 @@
+"""
+Rotas de análises estatísticas sobre os concursos.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.config import settings
+from app.exceptions import APIConnectionError, CircuitBreakerOpenError, MegaSenaException
+from app.models import (
+    BacktestResponse,
+    ErrorResponse,
+    FeatureAnalyticsResponse,
+    GapAnalyticsResponse,
+    PairAnalyticsResponse,
+    SimulationJobResponse,
+)
+from app.routes.api import service
+from app.services.analytics_service import get_analytics_service
+from app.utils.draw import parse_iso_date
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import rate_limit
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+# Limite de janelas por requisição de backtest
+MAX_BACKTEST_WINDOWS = 10
+
+
+def _parse_window_date(value: Optional[str], name: str) -> Optional[int]:
+    """Converte um limite de janela (YYYY-MM-DD) em ordinal."""
+    if value is None:
+        return None
+    ordinal = parse_iso_date(value)
+    if ordinal is None:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"Formato de data inválido em '{name}'. Use YYYY-MM-DD",
+                "error_code": "INVALID_DATE",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+    return ordinal
+
+
+def _upstream_unavailable(e: MegaSenaException) -> HTTPException:
+    """Erro 503 quando os concursos não puderam ser carregados."""
+    logger.error(f"Upstream unavailable for analytics: {e}")
+    return HTTPException(
+        status_code=503,
+        detail={
+            "detail": "Serviço temporariamente indisponível. Tente novamente em alguns instantes.",
+            "error_code": e.error_code,
+            "timestamp": datetime.now().isoformat(),
+        },
+    )
+
+
+@router.get(
+    "/pairs",
+    response_model=PairAnalyticsResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Janela inválida"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"},
+    },
+    summary="Pares e Trincas Frequentes",
+    description="Coocorrência de dezenas (pares e trincas) em uma janela do histórico",
+    dependencies=[Depends(rate_limit("analytics", lambda: settings.rate_limit_per_minute))],
+)
+async def get_pairs(
+    top: int = Query(20, ge=1, le=200, description="Quantidade de pares/trincas retornados"),
+    last: Optional[int] = Query(None, ge=1, description="Apenas os N concursos mais recentes"),
+    start: Optional[str] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="Data final (YYYY-MM-DD)"),
+    triples: bool = Query(True, description="Inclui as trincas mais frequentes"),
+    matrix: bool = Query(False, description="Inclui a matriz 60×60 de pares"),
+):
+    """
+    Pares e trincas de dezenas que mais saíram juntas.
+
+    Returns:
+        Top-k de pares e trincas, com a contagem esperada sob sorteio uniforme
+    """
+    start_ordinal = _parse_window_date(start, "start")
+    end_ordinal = _parse_window_date(end, "end")
+
+    try:
+        result = await asyncio.to_thread(
+            get_analytics_service(service).get_pairs,
+            top=top,
+            last=last,
+            start=start_ordinal,
+            end=end_ordinal,
+            include_triples=triples,
+            include_matrix=matrix,
+        )
+        return PairAnalyticsResponse(**result)
+
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        raise _upstream_unavailable(e)
+
+    except Exception as e:
+        logger.error(f"Unexpected error computing pairs: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao calcular pares: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+@router.get(
+    "/gaps",
+    response_model=GapAnalyticsResponse,
+    responses={503: {"model": ErrorResponse, "description": "API externa indisponível"}},
+    summary="Atraso por Dezena",
+    description="Concursos desde a última aparição de cada dezena e o maior atraso no histórico",
+    dependencies=[Depends(rate_limit("analytics", lambda: settings.rate_limit_per_minute))],
+)
+async def get_gaps(
+    sort: Literal["number", "current", "max"] = Query(
+        "number", description="Ordenação do resultado"
+    )
+):
+    """
+    Atraso atual e maior atraso de cada dezena.
+
+    O estado é mantido pelo serviço de análises e atualizado a cada
+    concurso novo; a requisição apenas o lê.
+
+    Returns:
+        Atrasos das 60 dezenas
+    """
+    try:
+        result = await asyncio.to_thread(get_analytics_service(service).get_gaps, sort)
+        return GapAnalyticsResponse(**result)
+
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        raise _upstream_unavailable(e)
+
+    except Exception as e:
+        logger.error(f"Unexpected error computing gaps: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao calcular atrasos: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+@router.get(
+    "/features",
+    response_model=FeatureAnalyticsResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Janela inválida"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"},
+    },
+    summary="Distribuição de Atributos",
+    description="Histogramas de soma, ímpares, baixas, décadas, consecutivas e primos em uma janela do histórico",
+    dependencies=[Depends(rate_limit("analytics", lambda: settings.rate_limit_per_minute))],
+)
+async def get_features(
+    last: Optional[int] = Query(None, ge=1, description="Apenas os N concursos mais recentes"),
+    start: Optional[str] = Query(None, description="Data inicial (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="Data final (YYYY-MM-DD)"),
+    sum_bin: int = Query(10, ge=1, le=100, description="Largura das faixas de soma"),
+):
+    """
+    Distribuição dos atributos dos concursos.
+
+    Os atributos são calculados uma vez por concurso, quando ele entra nos
+    dados; a requisição apenas agrega as colunas da janela.
+
+    Returns:
+        Histogramas de cada atributo
+    """
+    start_ordinal = _parse_window_date(start, "start")
+    end_ordinal = _parse_window_date(end, "end")
+
+    try:
+        result = await asyncio.to_thread(
+            get_analytics_service(service).get_features,
+            last=last,
+            start=start_ordinal,
+            end=end_ordinal,
+            sum_bin=sum_bin,
+        )
+        return FeatureAnalyticsResponse(**result)
+
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        raise _upstream_unavailable(e)
+
+    except Exception as e:
+        logger.error(f"Unexpected error computing features: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao calcular atributos: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+def _parse_windows(value: str) -> List[int]:
+    """Converte '50,100,0' em tamanhos de janela."""
+    try:
+        windows = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        windows = []
+    if not windows or len(windows) > MAX_BACKTEST_WINDOWS or min(windows) < 0:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"Informe de 1 a {MAX_BACKTEST_WINDOWS} janelas (inteiros >= 0, separados por vírgula)",
+                "error_code": "INVALID_PARAMETER",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+    return windows
+
+
+@router.get(
+    "/backtest",
+    response_model=BacktestResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Janelas inválidas"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"},
+    },
+    summary="Backtest da Estimativa",
+    description="Acertos que a estimativa por frequência teria tido em cada concurso do histórico",
+    dependencies=[Depends(rate_limit("backtest", lambda: settings.rate_limit_backtest_per_minute))],
+)
+async def get_backtest(
+    windows: str = Query(
+        "50,100,200,0",
+        description="Tamanhos de janela separados por vírgula (0 = todo o histórico anterior)",
+    )
+):
+    """
+    Backtest walk-forward: para cada concurso, a estimativa é calculada
+    apenas com os concursos anteriores e comparada com o resultado.
+
+    Returns:
+        Distribuição de acertos por tamanho de janela
+    """
+    sizes = _parse_windows(windows)
+
+    try:
+        result = await asyncio.to_thread(get_analytics_service(service).get_backtest, sizes)
+        return BacktestResponse(**result)
+
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        raise _upstream_unavailable(e)
+
+    except Exception as e:
+        logger.error(f"Unexpected error running backtest: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao executar o backtest: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+@router.post(
+    "/simulations",
+    response_model=SimulationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        200: {"model": SimulationJobResponse, "description": "Resultado já disponível"},
+        400: {"model": ErrorResponse, "description": "Parâmetros inválidos"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"},
+    },
+    summary="Simulação de Monte Carlo",
+    description="Agenda a simulação das estratégias de aposta contra sorteios aleatórios",
+    dependencies=[
+        Depends(rate_limit("simulation", lambda: settings.rate_limit_simulation_per_minute))
+    ],
+)
+async def submit_simulation(
+    response: Response,
+    draws: int = Query(1_000_000, ge=1000, description="Sorteios simulados"),
+    seed: int = Query(0, ge=0, description="Semente (mesma semente, mesmo resultado)"),
+):
+    """
+    Agenda uma simulação em background.
+
+    A simulação roda fora dos workers da API (pool de processos); o
+    resultado fica em cache pelos parâmetros e é consultado em
+    /api/analytics/simulations/{id}.
+
+    Returns:
+        Job (202) ou resultado já calculado (200)
+    """
+    if draws > settings.simulation_max_draws:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"Máximo de {settings.simulation_max_draws} sorteios por simulação",
+                "error_code": "INVALID_PARAMETER",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+    try:
+        job = await asyncio.to_thread(get_analytics_service(service).submit_simulation, draws, seed)
+
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        raise _upstream_unavailable(e)
+
+    if job["status"] == "done":
+        response.status_code = status.HTTP_200_OK
+    return SimulationJobResponse(**job)
+
+
+@router.get(
+    "/simulations/{job_id}",
+    response_model=SimulationJobResponse,
+    responses={404: {"model": ErrorResponse, "description": "Job não encontrado"}},
+    summary="Resultado da Simulação",
+    description="Estado ou resultado de um job de simulação",
+    dependencies=[Depends(rate_limit("analytics", lambda: settings.rate_limit_per_minute))],
+)
+async def get_simulation(job_id: str):
+    """
+    Estado de um job de simulação.
+
+    Returns:
+        Job com o resultado quando concluído
+    """
+    job = get_analytics_service(service).get_simulation(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "detail": f"Simulação {job_id} não encontrada",
+                "error_code": "SIMULATION_NOT_FOUND",
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+    return SimulationJobResponse(**job)
@@ -4,15 +4,22 @@ Define os endpoints disponíveis com validação e tratamento de erros.
 Versão refatorada com modelos Pydantic e logging estruturado.
 """
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
 from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
 
 from app.services.mega_sena_service import MegaSenaService
 from app.models import (
     HealthResponse,
     EstimateResponse,
     DrawResponse,
-    ErrorResponse
+    DrawBatchResponse,
+    ErrorResponse,
+    TicketCheckResponse
 )
 from app.exceptions import (
     APIConnectionError,
@@ -20,13 +27,23 @@ from app.exceptions import (
     DrawNotFoundError,
     CircuitBreakerOpenError
 )
+from app.utils.cache import get_cache
 from app.utils.logger import get_logger
+from app.utils.rate_limiter import rate_limit
+from app.utils.startup import get_startup_state
+from app.analytics.strategies import DEFAULT_STRATEGY
+from app.analytics.tickets import INVALID_TICKET_MESSAGE, TicketBatchChecker, is_valid_ticket
+from app.services.analytics_service import get_analytics_service
+from app.services.refresh_scheduler import get_refresh_scheduler
 from app.config import settings
 
 logger = get_logger(__name__)
 router = APIRouter()
 service = MegaSenaService()
 
+# Tamanho máximo de uma linha (uma aposta) no upload em lote
+BULK_MAX_LINE_BYTES = 1024
+
 
 @router.get(
     "/health",
@@ -57,18 +74,28 @@ async def health_check():
     "/estimate",
     response_model=EstimateResponse,
     responses={
+        400: {"model": ErrorResponse, "description": "Estratégia desconhecida"},
         500: {"model": ErrorResponse, "description": "Erro ao gerar estimativa"},
         503: {"model": ErrorResponse, "description": "Serviço temporariamente indisponível"}
     },
     summary="Gerar Estimativa",
-    description="Retorna estimativa de números mais prováveis baseada em análise histórica"
+    description="Retorna estimativa de números mais prováveis baseada em análise histórica",
+    dependencies=[Depends(rate_limit(
+        "estimate",
+        lambda: settings.rate_limit_estimate_per_minute,
+        uncached=lambda request: not service.is_estimate_cached()
+    ))]
 )
-async def get_estimate():
+async def get_estimate(
+    strategy: str = Query(DEFAULT_STRATEGY, description="Estratégia de estimativa")
+):
     """
     Retorna estimativa de números mais prováveis.
     
-    Analisa os concursos dos últimos 2 anos e retorna os números
-    mais frequentes organizados em quadra, quina e sena.
+    Analisa os concursos dos últimos 2 anos segundo a estratégia escolhida
+    (frequency, recency, gap, cold ou decay_<dias>) e retorna os números organizados em
+    quadra, quina e sena. As estimativas de todas as estratégias são
+    calculadas juntas quando os dados mudam; a requisição apenas escolhe uma.
     
     Returns:
         Estimativa com quadra, quina e sorte (sena)
@@ -76,13 +103,25 @@ async def get_estimate():
     Raises:
         HTTPException: Em caso de erro ao gerar estimativa
     """
-    logger.info("Estimate requested")
+    logger.info(f"Estimate requested ({strategy})")
+    
+    strategies = service.strategy_names()
+    if strategy not in strategies:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"Estratégia desconhecida. Use uma de: {', '.join(strategies)}",
+                "error_code": "INVALID_STRATEGY",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
     
     try:
-        estimate = service.get_estimate()
+        estimate = service.get_estimate(strategy)
         
         return EstimateResponse(
             data=estimate["data"],
+            strategy=estimate.get("strategy", strategy),
             quadra=estimate["quadra"],
             quina=estimate["quina"],
             sorte=estimate["sorte"]
@@ -142,7 +181,12 @@ async def get_estimate():
         500: {"model": ErrorResponse, "description": "Erro ao buscar concurso"}
     },
     summary="Buscar Concurso por Data",
-    description="Retorna os números sorteados em uma data específica"
+    description="Retorna os números sorteados em uma data específica",
+    dependencies=[Depends(rate_limit(
+        "draw",
+        lambda: settings.rate_limit_draw_per_minute,
+        uncached=lambda request: not service.is_draw_cached(request.path_params.get("date", ""))
+    ))]
 )
 async def get_draw_by_date(date: str):
     """
@@ -164,13 +208,9 @@ async def get_draw_by_date(date: str):
         datetime.strptime(date, '%Y-%m-%d')
         
         # Busca concurso
-        draw_data = service.get_draw_by_date(date)
+        draw = service.get_draw_by_date(date)
         
-        return DrawResponse(
-            data=draw_data["data"],
-            numero_concurso=draw_data["numero_concurso"],
-            numeros=draw_data["numeros"]
-        )
+        return DrawResponse(**draw.to_api())
     
     except ValueError:
         logger.warning(f"Invalid date format: {date}")
@@ -217,24 +257,389 @@ async def get_draw_by_date(date: str):
         )
 
 
+def _parse_dates(raw: str) -> List[str]:
+    """Separa e deduplica a lista de datas do parâmetro `dates`."""
+    return list(dict.fromkeys(date.strip() for date in raw.split(",") if date.strip()))
+
+
+@router.get(
+    "/draws",
+    response_model=DrawBatchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Datas inválidas"},
+        500: {"model": ErrorResponse, "description": "Erro ao buscar concursos"}
+    },
+    summary="Buscar Concursos por Várias Datas",
+    description="Retorna os concursos de várias datas com uma única leitura em lote do cache",
+    dependencies=[Depends(rate_limit(
+        "draw",
+        lambda: settings.rate_limit_draw_per_minute,
+        # Uma única consulta: sem os dados processados, qualquer data ausente
+        # do MGET cai na API externa (as chaves por data expiram junto)
+        uncached=lambda request: not service.is_data_cached()
+    ))]
+)
+async def get_draws_by_dates(
+    dates: str = Query(..., description="Datas no formato YYYY-MM-DD, separadas por vírgula")
+):
+    """
+    Retorna os concursos de várias datas.
+    
+    As chaves já em cache são lidas com um único MGET assíncrono; apenas
+    as datas ausentes são resolvidas pelo serviço.
+    
+    Args:
+        dates: Datas no formato YYYY-MM-DD separadas por vírgula
+    
+    Returns:
+        Concursos encontrados e datas sem concurso
+    """
+    date_list = _parse_dates(dates)
+    
+    if not date_list or len(date_list) > settings.draw_batch_max_dates:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"Informe entre 1 e {settings.draw_batch_max_dates} datas",
+                "error_code": "INVALID_DATES",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    try:
+        for date in date_list:
+            datetime.strptime(date, '%Y-%m-%d')
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": "Formato de data inválido. Use YYYY-MM-DD",
+                "error_code": "INVALID_DATE",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    try:
+        cached = await get_cache().aget_many(f"mega_sena:draw:{date}" for date in date_list)
+        draws = {date: cached.get(f"mega_sena:draw:{date}") for date in date_list}
+        
+        missing = [date for date, draw in draws.items() if draw is None]
+        if missing:
+            draws.update(await asyncio.to_thread(service.get_draws_by_dates, missing))
+        
+        return DrawBatchResponse(
+            draws=[DrawResponse(**draw.to_api()) for draw in draws.values() if draw is not None],
+            not_found=[date for date, draw in draws.items() if draw is None]
+        )
+    
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        logger.error(f"Upstream unavailable for batch draws: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "detail": "Serviço temporariamente indisponível. Tente novamente em alguns instantes.",
+                "error_code": e.error_code,
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error fetching draws: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao buscar concursos: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
+
+def _parse_ticket(raw: str) -> List[int]:
+    """Valida as dezenas da aposta: 6 a 15 dezenas distintas entre 1 e 60."""
+    try:
+        numbers = [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError:
+        numbers = []
+    
+    if not is_valid_ticket(numbers):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "detail": f"{INVALID_TICKET_MESSAGE}, separadas por vírgula",
+                "error_code": "INVALID_TICKET",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    return numbers
+
+
+@router.get(
+    "/check",
+    response_model=TicketCheckResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Aposta inválida"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"}
+    },
+    summary="Conferir Aposta",
+    description="Confere uma aposta de 6 a 15 dezenas contra todos os concursos do histórico",
+    dependencies=[Depends(rate_limit("check", lambda: settings.rate_limit_per_minute))]
+)
+async def check_ticket(
+    numbers: str = Query(..., description="Dezenas da aposta separadas por vírgula")
+):
+    """
+    Confere uma aposta contra o histórico.
+    
+    Cada concurso é guardado como máscara de 64 bits; os acertos de todos
+    os concursos saem de um AND e um popcount vetorizados.
+    
+    Returns:
+        Distribuição de acertos e concursos com quadra, quina e sena
+    """
+    ticket = _parse_ticket(numbers)
+    
+    try:
+        result = await asyncio.to_thread(get_analytics_service(service).check_ticket, ticket)
+        return TicketCheckResponse(
+            ticket=result["ticket"],
+            draws=result["draws"],
+            hits=result["hits"],
+            **{
+                tier: [DrawResponse(**draw.to_api()) for draw in result[tier]]
+                for tier in ("quadra", "quina", "sena")
+            }
+        )
+    
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        logger.error(f"Upstream unavailable for ticket check: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "detail": "Serviço temporariamente indisponível. Tente novamente em alguns instantes.",
+                "error_code": e.error_code,
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error checking ticket: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "detail": f"Erro ao conferir aposta: {str(e)}",
+                "error_code": "INTERNAL_ERROR",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse que lê o corpo da requisição enquanto responde.
+    
+    O StreamingResponse padrão consome `receive()` em paralelo para detectar
+    a desconexão do cliente, o que roubaria os pedaços do upload; aqui a
+    desconexão aparece na própria leitura do corpo (ClientDisconnect).
+    """
+    
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def _iter_upload_lines(request: Request) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Linhas não vazias do upload, conforme os pedaços chegam.
+    
+    Guarda no máximo uma linha incompleta; linhas acima de
+    BULK_MAX_LINE_BYTES são descartadas e reportadas como None.
+    """
+    buffer = b""
+    number = 0
+    overflow = False
+    
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            number += 1
+            if overflow or len(raw) > BULK_MAX_LINE_BYTES:
+                overflow = False
+                yield number, None
+                continue
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                yield number, line
+        if len(buffer) > BULK_MAX_LINE_BYTES:
+            overflow, buffer = True, b""
+    
+    if overflow or buffer.strip():
+        yield number + 1, None if overflow else buffer.decode("utf-8", errors="replace").strip()
+
+
+def _encode_results(results: List[Dict], summary: Dict) -> bytes:
+    """Serializa um lote em NDJSON e acumula o resumo."""
+    for result in results:
+        if "error" in result:
+            summary["invalid"] += 1
+            continue
+        summary["tickets"] += 1
+        for prize in result["prizes"]:
+            summary[prize["tier"]] += 1
+    return "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in results).encode()
+
+
+async def _stream_bulk_check(request: Request, checker: TicketBatchChecker) -> AsyncIterator[bytes]:
+    """
+    Lê o upload em lotes de BULK_CHECK_BATCH_SIZE linhas e devolve os
+    resultados de cada lote assim que conferido.
+    
+    A memória fica limitada a um lote, independente do tamanho do upload;
+    a conferência (CPU) roda no pool de threads, fora do loop de eventos.
+    """
+    summary = {
+        "tickets": 0,
+        "invalid": 0,
+        "contests": len(checker.contests),
+        "quadra": 0,
+        "quina": 0,
+        "sena": 0,
+        "truncated": False
+    }
+    batch: List[Tuple[int, Optional[str]]] = []
+    received = 0
+    
+    try:
+        async for item in _iter_upload_lines(request):
+            if received >= settings.bulk_check_max_tickets:
+                summary["truncated"] = True
+                break
+            received += 1
+            batch.append(item)
+            if len(batch) >= settings.bulk_check_batch_size:
+                yield _encode_results(await asyncio.to_thread(checker.check, batch), summary)
+                batch = []
+        
+        if batch:
+            yield _encode_results(await asyncio.to_thread(checker.check, batch), summary)
+    
+    except ClientDisconnect:
+        logger.warning(f"Client disconnected during bulk check after {received} lines")
+        return
+    
+    yield (json.dumps({"summary": summary}) + "\n").encode()
+
+
+@router.post(
+    "/check/bulk",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "Um resultado por linha, seguido do resumo"},
+        404: {"model": ErrorResponse, "description": "Nenhum concurso no intervalo"},
+        503: {"model": ErrorResponse, "description": "API externa indisponível"}
+    },
+    summary="Conferir Apostas em Lote",
+    description="Confere um upload CSV ou NDJSON de apostas contra um concurso ou intervalo de concursos",
+    dependencies=[Depends(rate_limit("check_bulk", lambda: settings.rate_limit_uncached_per_minute))]
+)
+async def check_tickets_bulk(
+    request: Request,
+    contest: Optional[int] = Query(None, ge=1, description="Concurso a conferir (padrão: o mais recente)"),
+    start: Optional[int] = Query(None, ge=1, description="Primeiro concurso do intervalo"),
+    end: Optional[int] = Query(None, ge=1, description="Último concurso do intervalo")
+):
+    """
+    Confere apostas em lote (bolões).
+    
+    O corpo é lido em fluxo: CSV (`Content-Type: text/csv`, uma aposta por
+    linha, com identificador opcional no primeiro campo) ou NDJSON
+    (`application/x-ndjson`, lista de dezenas ou `{"id", "numbers"}`).
+    A resposta é NDJSON, enviada conforme os lotes são conferidos.
+    
+    Returns:
+        Uma linha por aposta com o melhor acerto e os prêmios por concurso,
+        e uma linha final com o resumo
+    """
+    if contest is not None:
+        start = end = contest
+    fmt = "ndjson" if "json" in request.headers.get("content-type", "") else "csv"
+    
+    try:
+        checker = await asyncio.to_thread(get_analytics_service(service).ticket_checker, start, end, fmt)
+    
+    except (APIConnectionError, CircuitBreakerOpenError) as e:
+        logger.error(f"Upstream unavailable for bulk check: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "detail": "Serviço temporariamente indisponível. Tente novamente em alguns instantes.",
+                "error_code": e.error_code,
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    if checker is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "detail": "Nenhum concurso do histórico no intervalo informado",
+                "error_code": "DRAW_NOT_FOUND",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+    
+    return UploadStreamingResponse(_stream_bulk_check(request, checker), media_type="application/x-ndjson")
+
+
 @router.post(
     "/cache/clear",
     summary="Limpar Cache",
-    description="Limpa todo o cache do sistema (requer permissões administrativas)"
+    description="Limpa todo o cache do sistema (requer permissões administrativas)",
+    dependencies=[Depends(rate_limit("cache_clear", lambda: settings.rate_limit_cache_clear_per_minute))]
 )
-async def clear_cache():
+async def clear_cache(
+    background_tasks: BackgroundTasks,
+    prefix: Optional[str] = Query(
+        None, description="Remove apenas as chaves com este prefixo (ex.: draw:)"
+    ),
+    rewarm: Optional[bool] = Query(
+        None, description="Recarrega os dados antes de trocar a geração (padrão: CACHE_REWARM_ON_CLEAR)"
+    )
+):
     """
-    Limpa todo o cache do sistema.
+    Limpa o cache do sistema.
+    
+    Sem `prefix`, invalida todo o cache trocando a geração das chaves. Com
+    reaquecimento, a troca acontece em background só depois que os novos
+    dados foram buscados, e até lá as requisições continuam sendo servidas
+    pela geração anterior.
     
     Returns:
         Mensagem de confirmação
     """
-    logger.info("Cache clear requested")
+    logger.info("Cache clear requested", extra={"prefix": prefix, "rewarm": rewarm})
     
     try:
-        service.clear_cache()
+        if prefix:
+            removed = service.invalidate_prefix(prefix)
+            return {
+                "message": f"{removed} chaves removidas",
+                "prefix": prefix,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        if rewarm is None:
+            rewarm = settings.cache_rewarm_on_clear
+        
+        if rewarm:
+            background_tasks.add_task(service.clear_cache, rewarm=True)
+        else:
+            service.clear_cache()
+        
         return {
             "message": "Cache limpo com sucesso",
+            "rewarm": rewarm,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -252,7 +657,8 @@ async def clear_cache():
 @router.get(
     "/stats",
     summary="Estatísticas do Sistema",
-    description="Retorna estatísticas e métricas do sistema"
+    description="Retorna estatísticas e métricas do sistema",
+    dependencies=[Depends(rate_limit("stats", lambda: settings.rate_limit_per_minute))]
 )
 async def get_stats():
     """
@@ -267,7 +673,13 @@ async def get_stats():
         stats = service.get_stats()
         return {
             "cache_type": stats.get("cache_type"),
+            "cache": {
+                "generation": stats.get("cache_generation"),
+                "prefixes": stats.get("cache_metrics")
+            },
             "circuit_breaker": stats.get("circuit_breaker"),
+            "startup": get_startup_state().to_dict(),
+            "refresh": get_refresh_scheduler(service).get_stats(),
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -0,0 +1,420 @@
+"""
+Serviço de análises sobre os concursos processados.
+Mantém em memória os índices derivados (atualizados de forma incremental
+quando novos concursos chegam) e recorta janelas do histórico sob demanda.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.analytics.backtest import backtest
+from app.analytics.bitmask import MaskIndex
+from app.analytics.features import FeatureTable, distributions
+from app.analytics.tickets import TicketBatchChecker
+from app.analytics.gaps import GapTracker
+from app.analytics.simulation import PICKS, RANDOM_STRATEGY, build_report, run_simulation
+from app.analytics.cooccurrence import (
+    MAX_NUMBER,
+    CooccurrenceIndex,
+    expected_count,
+    one_hot,
+    pairs_from_one_hot,
+    top_pairs,
+    top_triples,
+    triples_from_one_hot,
+)
+from app.config import settings
+from app.utils.draw import Draw, numbers_to_mask, ordinal_to_iso
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Jobs de simulação mantidos em memória (os resultados ficam no cache)
+MAX_SIMULATION_JOBS = 50
+
+
+def select_window(
+    draws: List[Draw],
+    last: Optional[int] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> List[Draw]:
+    """
+    Recorta uma janela dos concursos (ordenados pelo número).
+
+    Args:
+        draws: Concursos processados
+        last: Apenas os N concursos mais recentes
+        start: Data inicial (ordinal, inclusive)
+        end: Data final (ordinal, inclusive)
+    """
+    window = draws
+    if start is not None or end is not None:
+        low = start if start is not None else float("-inf")
+        high = end if end is not None else float("inf")
+        window = [draw for draw in window if low <= draw.ordinal <= high]
+    if last is not None:
+        window = window[-last:]
+    return window
+
+
+class AnalyticsService:
+    """
+    Análises sobre os dados do MegaSenaService.
+
+    Os índices do histórico completo são atualizados quando o serviço
+    recarrega ou recebe concursos novos (fora do caminho das requisições);
+    nas requisições, `sync` apenas confirma que estão em dia.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.cooccurrence = CooccurrenceIndex()
+        self.gaps = GapTracker()
+        self.masks = MaskIndex()
+        self.features = FeatureTable()
+        service.add_data_listener(self.refresh)
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._jobs_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def refresh(self, data: List[Draw]) -> None:
+        """Atualiza os índices com os concursos processados."""
+        added, removed = self.cooccurrence.sync(data)
+        mode = self.gaps.sync(data)
+        self.masks.sync(data)
+        features = self.features.sync(data)
+        logger.info(
+            f"Analytics refreshed: co-occurrence +{added} -{removed}, gaps {mode}, features {features}"
+        )
+
+    def warmup(self, state) -> None:
+        """
+        Constrói os índices no warmup. Falhas não impedem o worker de ficar
+        pronto: os índices são montados na primeira requisição.
+        """
+        state.begin("analytics")
+        try:
+            self.refresh(self.service.get_processed_data())
+        except Exception as e:
+            state.fail("analytics", e)
+            logger.warning(f"Analytics warmup failed: {e}")
+            return
+        state.end("analytics", draws=self.gaps.draws)
+        state.mark_artifact("analytics")
+
+    def get_gaps(self, sort: str = "number") -> Dict:
+        """
+        Atraso atual e maior atraso de cada dezena no histórico.
+
+        Args:
+            sort: "number", "current" ou "max"
+        """
+        data = self.service.get_processed_data()
+        self.gaps.sync(data)
+        return {
+            "draws": self.gaps.draws,
+            "latest_contest": self.gaps.latest_contest,
+            "numbers": self.gaps.to_list(sort),
+        }
+
+    def check_ticket(self, numbers: List[int]) -> Dict:
+        """
+        Confere uma aposta contra todos os concursos do histórico.
+
+        Args:
+            numbers: Dezenas da aposta (6 a 15, validadas pela rota)
+
+        Returns:
+            Distribuição de acertos e os concursos com quadra, quina e sena
+            (do mais recente para o mais antigo)
+        """
+        self.masks.sync(self.service.get_processed_data())
+        draws, hits = self.masks.hits(numbers_to_mask(numbers))
+
+        counts = np.bincount(hits, minlength=PICKS + 1)
+        tiers = {}
+        for name, k in (("quadra", 4), ("quina", 5), ("sena", 6)):
+            tiers[name] = [draws[i] for i in np.flatnonzero(hits == k)[::-1]]
+
+        return {
+            "ticket": sorted(numbers),
+            "draws": len(draws),
+            "hits": {str(k): int(counts[k]) for k in range(PICKS + 1)},
+            **tiers,
+        }
+
+    def ticket_checker(
+        self, start: Optional[int] = None, end: Optional[int] = None, fmt: str = "csv"
+    ) -> Optional[TicketBatchChecker]:
+        """
+        Conferidor de apostas em lote para um intervalo de concursos.
+
+        Sem `start` nem `end`, usa apenas o concurso mais recente; só com
+        `start`, vai até o mais recente; só com `end`, desde o primeiro.
+
+        Args:
+            start: Primeiro concurso (inclusive)
+            end: Último concurso (inclusive)
+            fmt: "csv" ou "ndjson"
+
+        Returns:
+            Conferidor ou None se nenhum concurso estiver no intervalo
+        """
+        self.masks.sync(self.service.get_processed_data())
+        draws, masks = self.masks.snapshot()
+        if not draws:
+            return None
+
+        latest = draws[-1].contest
+        low = start if start is not None else (draws[0].contest if end is not None else latest)
+        high = end if end is not None else latest
+        selected = [i for i, draw in enumerate(draws) if low <= draw.contest <= high]
+        if not selected:
+            return None
+        return TicketBatchChecker([draws[i] for i in selected], masks[selected], fmt)
+
+    def get_backtest(self, windows: List[int]) -> Dict:
+        """
+        Backtest walk-forward da estimativa atual sobre o histórico.
+
+        Args:
+            windows: Tamanhos de janela (0 = todo o histórico anterior)
+        """
+        data = self.service.get_processed_data()
+        return {
+            "draws": len(data),
+            "expected_mean_hits": PICKS * PICKS / MAX_NUMBER,
+            "windows": backtest(data, windows),
+        }
+
+    def get_features(
+        self,
+        last: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        sum_bin: int = 10,
+    ) -> Dict:
+        """
+        Distribuição dos atributos dos concursos em uma janela do histórico.
+
+        Os atributos são extraídos uma vez por concurso (em `refresh`); a
+        requisição apenas recorta as colunas e agrega.
+
+        Returns:
+            Dicionário com a janela e os histogramas de cada atributo
+        """
+        self.features.sync(self.service.get_processed_data())
+        columns = self.features.window(last, start, end)
+        ordinals = columns["ordinal"]
+        return {
+            "draws": len(ordinals),
+            "start": ordinal_to_iso(int(ordinals[0])) if len(ordinals) else None,
+            "end": ordinal_to_iso(int(ordinals[-1])) if len(ordinals) else None,
+            **distributions(columns, PICKS, sum_bin),
+        }
+
+    def get_pairs(
+        self,
+        top: int = 20,
+        last: Optional[int] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        include_triples: bool = True,
+        include_matrix: bool = False,
+    ) -> Dict:
+        """
+        Pares (e trincas) mais frequentes em uma janela do histórico.
+
+        Sem janela, usa o índice incremental do histórico completo; com
+        janela, recalcula as contagens apenas dos concursos recortados.
+
+        Returns:
+            Dicionário com a janela, os top-k e as contagens esperadas
+            sob sorteio uniforme
+        """
+        data = self.service.get_processed_data()
+        window = select_window(data, last, start, end)
+
+        triples: Optional[np.ndarray]
+        if window is data:
+            added, removed = self.cooccurrence.sync(data)
+            if added or removed:
+                logger.info(f"Co-occurrence index updated: +{added} -{removed} draws")
+            pairs, all_triples = self.cooccurrence.snapshot()
+            triples = all_triples if include_triples else None
+        else:
+            matrix = one_hot(window)
+            pairs = pairs_from_one_hot(matrix)
+            triples = triples_from_one_hot(matrix) if include_triples else None
+
+        return {
+            "draws": len(window),
+            "start": ordinal_to_iso(window[0].ordinal) if window else None,
+            "end": ordinal_to_iso(window[-1].ordinal) if window else None,
+            "expected_pair": round(expected_count(len(window), 2), 4),
+            "expected_triple": round(expected_count(len(window), 3), 4),
+            "pairs": top_pairs(pairs, top),
+            "triples": top_triples(triples, top) if triples is not None else None,
+            "matrix": pairs.tolist() if include_matrix else None,
+        }
+
+    def simulation_strategies(self) -> Dict[str, Optional[List[int]]]:
+        """
+        Apostas avaliadas na simulação: a sorte (6 dezenas) de cada
+        estratégia de estimativa registrada, mais uma aposta nova a cada
+        sorteio simulado (linha de base).
+        """
+        estimates = self.service.get_estimates()["strategies"]
+        return {
+            **{name: estimate["sorte"] for name, estimate in estimates.items()},
+            RANDOM_STRATEGY: None,
+        }
+
+    @staticmethod
+    def _simulation_id(params: Dict[str, Any]) -> str:
+        """Identificador determinístico dos parâmetros da simulação."""
+        payload = json.dumps(params, sort_keys=True).encode()
+        return hashlib.sha1(payload).hexdigest()[:16]
+
+    @staticmethod
+    def _simulation_key(job_id: str) -> str:
+        return f"mega_sena:simulation:{job_id}"
+
+    def submit_simulation(self, draws: int, seed: int = 0) -> Dict[str, Any]:
+        """
+        Agenda uma simulação em background.
+
+        Parâmetros iguais (incluindo as apostas, que dependem dos dados)
+        reaproveitam o resultado em cache ou o job em andamento.
+
+        Returns:
+            Estado do job
+        """
+        strategies = self.simulation_strategies()
+        params = {"draws": draws, "seed": seed, "strategies": strategies}
+        job_id = self._simulation_id(params)
+
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job["status"] in ("pending", "running", "done"):
+                return dict(job)
+
+        cached = self.service.cache.get(self._simulation_key(job_id))
+        if cached is not None:
+            return {"id": job_id, "status": "done", "params": params, "result": cached}
+
+        job = {
+            "id": job_id,
+            "status": "pending",
+            "params": params,
+            "submitted_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "duration_s": None,
+            "result": None,
+            "error": None,
+        }
+        with self._jobs_lock:
+            # Outra requisição pode ter agendado o mesmo job desde a primeira consulta
+            current = self._jobs.get(job_id)
+            if current is not None and current["status"] in ("pending", "running", "done"):
+                return dict(current)
+
+            submitted = dict(job)
+            self._jobs[job_id] = job
+            self._trim_jobs()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mega-sena-simulation"
+                )
+            self._executor.submit(self._run_simulation, job)
+
+        logger.info(f"Simulation {job_id} submitted ({draws} draws)")
+        return submitted
+
+    def _update_job(self, job: Dict[str, Any], **fields: Any) -> None:
+        with self._jobs_lock:
+            job.update(fields)
+
+    def _run_simulation(self, job: Dict[str, Any]) -> None:
+        """Executa o job no pool de processos e grava o resultado no cache."""
+        params = job["params"]
+        strategies = params["strategies"]
+        tickets = [ticket for ticket in strategies.values() if ticket is not None]
+
+        self._update_job(job, status="running")
+        started = time.perf_counter()
+        try:
+            workers = settings.simulation_workers or (os.cpu_count() or 1)
+            counts = run_simulation(
+                tickets,
+                params["draws"],
+                seed=params["seed"],
+                workers=workers,
+                chunk_size=settings.simulation_chunk_size,
+            )
+            result = build_report(strategies, counts, params["draws"])
+            self.service.cache.set(
+                self._simulation_key(job["id"]), result, ttl=self.service.data_ttl
+            )
+            outcome: Dict[str, Any] = {"status": "done", "result": result}
+            logger.info(f"Simulation {job['id']} finished in {time.perf_counter() - started:.1f}s")
+        except Exception as e:
+            outcome = {"status": "failed", "error": str(e)}
+            logger.error(f"Simulation {job['id']} failed: {e}")
+
+        self._update_job(
+            job,
+            duration_s=round(time.perf_counter() - started, 3),
+            finished_at=datetime.now().isoformat(),
+            **outcome,
+        )
+
+    def _trim_jobs(self) -> None:
+        """Descarta os jobs concluídos mais antigos acima do limite."""
+        finished = [
+            job_id for job_id, job in self._jobs.items() if job["status"] in ("done", "failed")
+        ]
+        for job_id in finished[: max(0, len(self._jobs) - MAX_SIMULATION_JOBS)]:
+            del self._jobs[job_id]
+
+    def get_simulation(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Estado de um job (local) ou resultado em cache (de qualquer worker)."""
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return dict(job)
+
+        cached = self.service.cache.get(self._simulation_key(job_id))
+        if cached is not None:
+            return {"id": job_id, "status": "done", "result": cached}
+        return None
+
+    def close(self) -> None:
+        """Interrompe os jobs pendentes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Instância global do serviço de análises
+_analytics_service: Optional[AnalyticsService] = None
+
+
+def get_analytics_service(service) -> AnalyticsService:
+    """Obtém a instância global do serviço de análises."""
+    global _analytics_service
+
+    if _analytics_service is None:
+        _analytics_service = AnalyticsService(service)
+
+    return _analytics_service
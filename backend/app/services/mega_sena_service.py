@@ -4,21 +4,23 @@ Consome APIs públicas e processa os dados históricos.
 Versão refatorada com cache, circuit breaker e logging estruturado.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, TypedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.config import settings
-from app.utils.data_processor import (
-    normalize_data,
-    filter_last_two_years,
-    calculate_frequencies,
-    generate_estimates
-)
+from app.analytics.decay import DecayedFrequencies
+from app.analytics.strategies import DEFAULT_STRATEGY, STRATEGIES, compute_estimates
+from app.analytics.window import SlidingWindowFeatures
+from app.utils.data_processor import iter_draws, two_year_cutoff
 from app.utils.cache import get_cache
+from app.utils.draw import Draw, DrawStore, parse_iso_date
 from app.utils.circuit_breaker import get_api_circuit_breaker
 from app.utils.logger import get_logger
+from app.utils.shared_dataset import read_shared_dataset
 from app.exceptions import (
     APIConnectionError,
     DataProcessingError,
@@ -29,6 +31,14 @@ from app.exceptions import (
 logger = get_logger(__name__)
 
 
+class EstimateBundle(TypedDict):
+    """Estimativas de todas as estratégias, guardadas em `mega_sena:estimate`."""
+    data: str
+    draws: int
+    latest_contest: int
+    strategies: Dict[str, Dict[str, List[int]]]
+
+
 class MegaSenaService:
     """Serviço para gerenciar dados da Mega-Sena."""
     
@@ -36,22 +46,112 @@ class MegaSenaService:
         self.base_url = settings.mega_sena_api_url
         self.cache = get_cache()
         self.circuit_breaker = get_api_circuit_breaker()
+        self._session: Optional[requests.Session] = None
+        self._data_listeners: List[Callable[[List[Draw]], None]] = []
+        # Estado das estimativas mantido entre atualizações (O(60) por concurso novo)
+        self.window = SlidingWindowFeatures(verify_every=settings.window_verify_interval)
+        self.decay = DecayedFrequencies(settings.decay_half_lives)
         logger.info(f"MegaSenaService initialized with cache type: {self.cache.get_type()}")
     
-    def _fetch_single_draw(self, num: int, cutoff_date: datetime) -> Optional[Dict]:
+    @property
+    def session(self) -> requests.Session:
+        """Sessão HTTP com pool de conexões reutilizáveis para a API externa."""
+        return self._session or self.init_http_pool()
+    
+    def init_http_pool(self) -> requests.Session:
+        """Cria (uma única vez) a sessão HTTP com pool dimensionado para a ingestão paralela."""
+        if self._session is not None:
+            return self._session
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.http_pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._session = session
+        logger.info(f"HTTP pool initialized with {settings.http_pool_size} connections")
+        return session
+    
+    def close(self) -> None:
+        """Fecha as conexões HTTP abertas."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def add_data_listener(self, listener: Callable[[List[Draw]], None]) -> None:
+        """
+        Registra uma função chamada com os concursos processados sempre que
+        eles são recarregados ou recebem concursos novos.
+        """
+        self._data_listeners.append(listener)
+    
+    def _notify_data_changed(self, data: List[Draw]) -> None:
+        """Avisa os ouvintes; falhas são registradas e não interrompem a ingestão."""
+        for listener in self._data_listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                logger.error(f"Data listener failed: {e}")
+    
+    @property
+    def data_ttl(self) -> int:
+        """
+        TTL dos dados processados e da estimativa.
+        
+        Com o agendador de atualização ativo, os concursos são renovados
+        quando um novo resultado é detectado, e o TTL é apenas uma rede de
+        segurança longa; sem ele, vale o `cache_ttl` configurado.
+        """
+        if settings.refresh_scheduler_enabled:
+            return settings.refresh_data_ttl
+        return settings.cache_ttl
+    
+    def _fetch_latest(self) -> Dict:
+        """Busca o último concurso na API externa (protegido pelo circuit breaker)."""
+        def fetch_latest():
+            response = self.session.get(
+                self.base_url,
+                timeout=settings.circuit_breaker_timeout
+            )
+            response.raise_for_status()
+            return response.json()
+        
+        return self.circuit_breaker.call(fetch_latest)
+    
+    def fetch_latest_contest(self) -> int:
+        """
+        Retorna o número do último concurso publicado.
+        
+        Raises:
+            APIConnectionError: Se não conseguir consultar a API
+        """
+        try:
+            last_draw = self._fetch_latest()
+        except CircuitBreakerOpenError:
+            raise APIConnectionError("Circuit breaker is open, API temporarily unavailable")
+        except requests.RequestException as e:
+            raise APIConnectionError(f"Failed to connect to Mega-Sena API: {str(e)}")
+        
+        return int(last_draw.get('numero', last_draw.get('numeroConcurso', 0)))
+    
+    def _fetch_single_draw(self, num: int) -> Optional[Dict]:
         """
         Busca um único concurso com proteção de circuit breaker.
         
+        A validação e o filtro por data ficam no pipeline de ingestão
+        (`iter_draws`), que interpreta cada payload uma única vez.
+        
         Args:
             num: Número do concurso
-            cutoff_date: Data de corte para filtrar concursos
         
         Returns:
-            Dados do concurso ou None se não encontrado
+            Payload do concurso ou None se não encontrado
         """
         try:
             def make_request():
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/{num}",
                     timeout=settings.circuit_breaker_timeout
                 )
@@ -59,36 +159,7 @@ class MegaSenaService:
                 return response.json()
             
             # Usa circuit breaker para proteger a chamada
-            draw_data = self.circuit_breaker.call(make_request)
-            
-            # Verifica se a data do concurso está dentro do período
-            data_apuracao = draw_data.get(
-                'dataApuracao',
-                draw_data.get('data', draw_data.get('dataApuracaoStr', ''))
-            )
-            
-            if data_apuracao:
-                try:
-                    # Tenta diferentes formatos de data
-                    try:
-                        draw_date = datetime.strptime(data_apuracao, '%d/%m/%Y')
-                    except ValueError:
-                        try:
-                            draw_date = datetime.strptime(data_apuracao, '%Y-%m-%d')
-                        except ValueError:
-                            logger.warning(f"Could not parse date for draw {num}: {data_apuracao}")
-                            return draw_data
-                    
-                    if draw_date >= cutoff_date:
-                        return draw_data
-                    else:
-                        logger.debug(f"Draw {num} is before cutoff date")
-                        return None
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Error parsing date for draw {num}: {e}")
-                    return draw_data
-            
-            return None
+            return self.circuit_breaker.call(make_request)
             
         except CircuitBreakerOpenError:
             logger.warning("Circuit breaker is open, skipping request")
@@ -100,12 +171,61 @@ class MegaSenaService:
             logger.error(f"Unexpected error fetching draw {num}: {e}")
             return None
     
-    def fetch_historical_data(self) -> List[Dict]:
+    def _iter_fetched(self, contests: Iterable[int]) -> Iterator[Dict]:
         """
-        Busca dados históricos da Mega-Sena dos últimos 2 anos.
+        Busca concursos em paralelo e produz os payloads à medida que chegam.
+        
+        No máximo `ingest_max_in_flight` requisições ficam em andamento, de
+        modo que a memória não cresce com o tamanho da faixa buscada. Se o
+        circuit breaker abrir, as buscas pendentes são canceladas e a
+        ingestão segue com o que já chegou.
+        
+        Args:
+            contests: Números dos concursos
+        
+        Yields:
+            Payloads recebidos da API externa
+        """
+        contests = iter(contests)
+        max_in_flight = max(1, settings.ingest_max_in_flight)
+        
+        with ThreadPoolExecutor(max_workers=settings.http_pool_size, thread_name_prefix="mega-sena-ingest") as executor:
+            pending = {
+                executor.submit(self._fetch_single_draw, num)
+                for num in islice(contests, max_in_flight)
+            }
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    try:
+                        result = future.result()
+                    except CircuitBreakerOpenError:
+                        logger.warning("Circuit breaker opened during batch fetch")
+                        for other in pending:
+                            other.cancel()
+                        return
+                    except Exception as e:
+                        logger.error(f"Error in future result: {e}")
+                        result = None
+                    
+                    next_num = next(contests, None)
+                    if next_num is not None:
+                        pending.add(executor.submit(self._fetch_single_draw, next_num))
+                    
+                    if result:
+                        yield result
+    
+    def fetch_historical_data(self) -> List[Draw]:
+        """
+        Busca os concursos da Mega-Sena dos últimos 2 anos.
+        
+        Cada payload é normalizado, filtrado pela data e inserido no
+        `DrawStore` assim que chega, sem listas intermediárias.
         
         Returns:
-            Lista de dicionários com dados dos concursos
+            Concursos ordenados pelo número
         
         Raises:
             APIConnectionError: Se não conseguir conectar à API
@@ -114,47 +234,21 @@ class MegaSenaService:
         
         try:
             # Busca o último concurso para saber quantos concursos existem
-            def fetch_latest():
-                response = requests.get(
-                    self.base_url,
-                    timeout=settings.circuit_breaker_timeout
-                )
-                response.raise_for_status()
-                return response.json()
+            last_draw = self._fetch_latest()
             
-            last_draw = self.circuit_breaker.call(fetch_latest)
-            
-            cutoff_date = datetime.now() - timedelta(days=730)
             concurso_num = last_draw.get('numero', last_draw.get('numeroConcurso', 1))
             start_num = max(1, concurso_num - 180)
             
             logger.info(f"Fetching draws from {start_num} to {concurso_num}")
             
-            all_draws = []
+            store = DrawStore()
+            store.extend(iter_draws(
+                self._iter_fetched(range(start_num, concurso_num + 1)),
+                cutoff=two_year_cutoff()
+            ))
             
-            # Usa ThreadPoolExecutor para buscar em paralelo
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                future_to_num = {
-                    executor.submit(self._fetch_single_draw, num, cutoff_date): num 
-                    for num in range(start_num, concurso_num + 1)
-                }
-                
-                for future in as_completed(future_to_num):
-                    try:
-                        result = future.result()
-                        if result:
-                            all_draws.append(result)
-                    except CircuitBreakerOpenError:
-                        logger.warning("Circuit breaker opened during batch fetch")
-                        break
-                    except Exception as e:
-                        logger.error(f"Error in future result: {e}")
-            
-            # Ordena por número do concurso para garantir consistência
-            all_draws.sort(key=lambda x: x.get('numero', x.get('numeroConcurso', 0)))
-            
-            logger.info(f"Successfully fetched {len(all_draws)} draws")
-            return all_draws
+            logger.info(f"Successfully fetched {len(store)} draws")
+            return store.to_list()
             
         except CircuitBreakerOpenError:
             raise APIConnectionError("Circuit breaker is open, API temporarily unavailable")
@@ -165,7 +259,7 @@ class MegaSenaService:
             logger.error(f"Unexpected error fetching historical data: {e}")
             raise DataProcessingError(f"Error fetching historical data: {str(e)}")
     
-    def get_processed_data(self, force_refresh: bool = False) -> List[Dict]:
+    def get_processed_data(self, force_refresh: bool = False) -> List[Draw]:
         """
         Obtém e processa os dados históricos com cache.
         
@@ -173,7 +267,7 @@ class MegaSenaService:
             force_refresh: Se True, força atualização dos dados
         
         Returns:
-            Lista processada com dados dos últimos 2 anos
+            Concursos dos últimos 2 anos, ordenados pelo número
         """
         cache_key = "mega_sena:processed_data"
         
@@ -184,39 +278,46 @@ class MegaSenaService:
                 logger.info("Returning processed data from cache")
                 return cached_data
         
-        logger.info("Processing fresh data from API")
-        
-        # Busca dados históricos
-        raw_data = self.fetch_historical_data()
-        
-        # Normaliza os dados
-        data = normalize_data(raw_data)
-        
-        # Filtra últimos 2 anos
-        data_filtered = filter_last_two_years(data)
-        
-        # Atualiza cache
-        self.cache.set(cache_key, data_filtered, ttl=settings.cache_ttl)
-        logger.info(f"Cached {len(data_filtered)} processed draws")
+        data_filtered = self._load_fresh_data()
+        self._store_processed_data(data_filtered)
         
         return data_filtered
     
-    def get_estimate(self) -> Dict:
+    def _load_fresh_data(self) -> List[Draw]:
+        """Busca, normaliza e filtra os concursos na API externa (sem cache)."""
+        logger.info("Processing fresh data from API")
+        return self.fetch_historical_data()
+    
+    def _store_processed_data(self, data: List[Draw]) -> None:
+        """Grava os dados processados e as chaves de busca por data."""
+        self.cache.set("mega_sena:processed_data", data, ttl=self.data_ttl)
+        self._cache_draws(data)
+        logger.info(f"Cached {len(data)} processed draws")
+        self._notify_data_changed(data)
+    
+    def get_estimates(self) -> EstimateBundle:
         """
-        Gera estimativa de números mais prováveis.
+        Gera as estimativas de todas as estratégias registradas.
+        
+        São calculadas juntas, em uma passada sobre os concursos, e
+        guardadas em uma única chave; recalculadas quando os dados mudam ou
+        quando o pacote em cache não tem todas as estratégias registradas
+        (ex.: gerado antes de uma mudança em DECAY_HALF_LIVES).
         
         Returns:
-            Dicionário com quadra, quina e sorte
+            Dicionário com data, concursos usados e a estimativa de cada estratégia
         """
-        logger.info("Generating number estimates")
-        
         cache_key = "mega_sena:estimate"
         
         # Verifica cache
-        cached_estimate = self.cache.get(cache_key)
-        if cached_estimate is not None:
-            logger.info("Returning estimate from cache")
-            return cached_estimate
+        cached_estimates: Optional[EstimateBundle] = self.cache.get(cache_key)
+        if cached_estimates is not None:
+            if set(self.strategy_names()) <= set(cached_estimates.get('strategies', {})):
+                logger.info("Returning estimates from cache")
+                return cached_estimates
+            logger.info("Cached estimates predate the registered strategies; rebuilding")
+        
+        logger.info("Generating number estimates")
         
         # Busca dados processados
         data = self.get_processed_data()
@@ -225,22 +326,187 @@ class MegaSenaService:
             logger.warning("No data available for estimate")
             raise DataProcessingError("No historical data available")
         
-        # Calcula frequências
-        frequencies = calculate_frequencies(data)
+        estimates: EstimateBundle = {
+            'data': datetime.now().strftime('%Y-%m-%d'),
+            'draws': len(data),
+            'latest_contest': max(draw.contest for draw in data),
+            'strategies': compute_estimates(self._window_features(data), extra_scores=self._decayed_scores(data))
+        }
         
-        # Gera estimativas
-        estimates = generate_estimates(frequencies)
+        # Renovada junto com os dados processados
+        self.cache.set(cache_key, estimates, ttl=self.data_ttl)
         
-        # Adiciona data atual
-        estimates['data'] = datetime.now().strftime('%Y-%m-%d')
+        logger.info(f"Estimates generated for {len(estimates['strategies'])} strategies")
+        return estimates
+    
+    def _window_features(self, data: List[Draw]):
+        """Atributos da janela, atualizados apenas com os concursos que entraram ou saíram."""
+        mode = self.window.sync(data)
+        logger.debug(f"Window features {mode} ({len(self.window)} draws)")
+        return self.window.features()
+    
+    def _decayed_scores(self, data: List[Draw]) -> Dict:
+        """Frequências decaídas, atualizadas apenas com os concursos novos."""
+        mode = self.decay.sync(data)
+        logger.debug(f"Decayed frequencies {mode} ({self.decay.draws} draws)")
+        return self.decay.strategy_scores()
+    
+    def strategy_names(self) -> List[str]:
+        """Estratégias disponíveis em /api/estimate."""
+        return [*STRATEGIES, *(f"decay_{half_life}" for half_life in self.decay.half_lives)]
+    
+    def get_estimate(self, strategy: str = DEFAULT_STRATEGY) -> Dict:
+        """
+        Estimativa de números mais prováveis segundo uma estratégia.
         
-        # Cache por menos tempo (30 minutos)
-        self.cache.set(cache_key, estimates, ttl=1800)
+        Args:
+            strategy: Estratégia registrada (ver `STRATEGIES`)
         
-        logger.info("Estimate generated successfully")
-        return estimates
+        Returns:
+            Dicionário com data, estratégia, quadra, quina e sorte
+        """
+        estimates = self.get_estimates()
+        return {
+            'data': estimates['data'],
+            'strategy': strategy,
+            **estimates['strategies'][strategy]
+        }
+    
+    def get_latest_cached_contest(self) -> Optional[int]:
+        """
+        Retorna o maior número de concurso presente nos dados em cache.
+        
+        Returns:
+            Número do concurso ou None se os dados não estão em cache
+        """
+        data = self.cache.get("mega_sena:processed_data")
+        if not data:
+            return None
+        
+        return max(draw.contest for draw in data)
+    
+    def ingest_new_draws(self, latest_contest: int) -> int:
+        """
+        Ingestão incremental: busca apenas os concursos ainda não
+        carregados, incorpora-os aos dados processados e reconstrói a
+        estimativa.
+        
+        Sem dados em cache, faz a carga completa.
+        
+        Args:
+            latest_contest: Último concurso publicado
+        
+        Returns:
+            Quantidade de concursos novos incorporados
+        """
+        known_contest = self.get_latest_cached_contest()
+        
+        if known_contest is None:
+            logger.info("No cached draws, running full ingest")
+            data = self.get_processed_data(force_refresh=True)
+            self._rebuild_estimate()
+            return len(data)
+        
+        if latest_contest <= known_contest:
+            return 0
+        
+        logger.info(f"Fetching new draws from {known_contest + 1} to {latest_contest}")
+        cutoff = two_year_cutoff()
+        store = DrawStore(self.cache.get("mega_sena:processed_data") or [])
+        
+        try:
+            new_draws = [
+                draw for draw in iter_draws(
+                    (self._fetch_single_draw(num) for num in range(known_contest + 1, latest_contest + 1)),
+                    cutoff=cutoff
+                )
+                if store.add(draw)
+            ]
+        except CircuitBreakerOpenError:
+            raise APIConnectionError("Circuit breaker is open, API temporarily unavailable")
+        
+        if not new_draws:
+            logger.warning(f"No new draws could be fetched up to contest {latest_contest}")
+            return 0
+        
+        store.prune_before(cutoff)
+        data = store.to_list()
+        self.cache.set("mega_sena:processed_data", data, ttl=self.data_ttl)
+        self._cache_draws(new_draws)
+        self._rebuild_estimate()
+        self._notify_data_changed(data)
+        
+        logger.info(f"Ingested {len(new_draws)} new draws")
+        return len(new_draws)
+    
+    def _rebuild_estimate(self) -> None:
+        """Descarta e recalcula a estimativa a partir dos dados em cache."""
+        self.cache.delete("mega_sena:estimate")
+        self.get_estimates()
     
-    def get_draw_by_date(self, date: str) -> Optional[Dict]:
+    @staticmethod
+    def _draw_key(date: str) -> str:
+        """Chave de cache de um concurso pela data (YYYY-MM-DD)."""
+        return f"mega_sena:draw:{date}"
+    
+    def _cache_draws(self, draws: Iterable[Draw]) -> None:
+        """Grava as chaves de busca por data de vários concursos de uma vez."""
+        mapping = {self._draw_key(draw.date_iso): draw for draw in draws}
+        
+        if mapping:
+            self.cache.set_many(mapping, ttl=86400)
+            logger.debug(f"Cached {len(mapping)} draw lookups")
+    
+    def get_draws_by_dates(self, dates: List[str]) -> Dict[str, Optional[Draw]]:
+        """
+        Busca vários concursos por data com uma única leitura em lote.
+        
+        Datas ausentes do cache são resolvidas pelos dados processados (sem
+        busca concurso a concurso na API externa).
+        
+        Args:
+            dates: Datas no formato YYYY-MM-DD
+        
+        Returns:
+            Dicionário data -> concurso (None se não houver concurso na data)
+        """
+        keys = {date: self._draw_key(date) for date in dates}
+        cached = self.cache.get_many(keys.values())
+        result = {date: cached.get(key) for date, key in keys.items()}
+        
+        missing = [date for date, draw in result.items() if draw is None]
+        if not missing:
+            return result
+        
+        by_date = {draw.ordinal: draw for draw in self.get_processed_data()}
+        found = {}
+        for date in missing:
+            ordinal = parse_iso_date(date)
+            if ordinal is None:
+                # Data inválida: fica como "sem concurso"
+                continue
+            draw = by_date.get(ordinal)
+            if draw is not None:
+                result[date] = found[keys[date]] = draw
+        
+        if found:
+            self.cache.set_many(found, ttl=86400)
+        
+        return result
+    
+    def is_estimate_cached(self) -> bool:
+        """Indica se a estimativa pode ser servida sem acessar a API externa."""
+        return self.cache.exists("mega_sena:estimate") or self.cache.exists("mega_sena:processed_data")
+    
+    def is_data_cached(self) -> bool:
+        """Indica se os concursos processados estão em cache (qualquer data pode ser resolvida)."""
+        return self.cache.exists("mega_sena:processed_data")
+    
+    def is_draw_cached(self, date: str) -> bool:
+        """Indica se a busca por data pode ser servida sem acessar a API externa."""
+        return self.cache.exists(f"mega_sena:draw:{date}") or self.cache.exists("mega_sena:processed_data")
+    
+    def get_draw_by_date(self, date: str) -> Draw:
         """
         Busca os números sorteados em uma data específica.
         
@@ -248,14 +514,14 @@ class MegaSenaService:
             date: Data no formato YYYY-MM-DD
         
         Returns:
-            Dicionário com dados do concurso
+            Concurso sorteado na data
         
         Raises:
             DrawNotFoundError: Se não encontrar concurso para a data
         """
         logger.info(f"Searching for draw on date: {date}")
         
-        cache_key = f"mega_sena:draw:{date}"
+        cache_key = self._draw_key(date)
         
         # Verifica cache
         cached_draw = self.cache.get(cache_key)
@@ -263,61 +529,51 @@ class MegaSenaService:
             logger.info(f"Returning draw from cache for date {date}")
             return cached_draw
         
-        try:
-            # Converte data para formato brasileiro
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            date_br = date_obj.strftime('%d/%m/%Y')
-            
-            # Busca dados históricos
-            data = self.get_processed_data()
-            
-            if not data:
-                logger.warning("No historical data available")
-                raise DrawNotFoundError(date)
-            
-            # Busca concurso na data especificada
-            for row in data:
-                row_date = row.get('data', '')
-                if row_date == date_br:
-                    result = {
-                        'data': date_br,
-                        'numero_concurso': str(row['numero_concurso']),
-                        'numeros': row['numeros']
-                    }
-                    # Cache permanente para dados históricos
-                    self.cache.set(cache_key, result, ttl=86400)  # 24 horas
-                    logger.info(f"Found draw for date {date}: concurso {result['numero_concurso']}")
-                    return result
-            
-            # Se não encontrou nos dados em cache, tenta buscar diretamente
-            logger.info(f"Draw not found in cache, searching API for date {date}")
-            result = self._search_draw_in_api(date_br)
-            
-            if result:
-                self.cache.set(cache_key, result, ttl=86400)
-                return result
-            
-            logger.warning(f"No draw found for date {date}")
-            raise DrawNotFoundError(date)
-            
-        except ValueError as e:
+        ordinal = parse_iso_date(date)
+        if ordinal is None:
             logger.error(f"Invalid date format: {date}")
             raise DrawNotFoundError(date)
+        
+        # Busca dados históricos
+        data = self.get_processed_data()
+        
+        if not data:
+            logger.warning("No historical data available")
+            raise DrawNotFoundError(date)
+        
+        # Busca concurso na data especificada
+        for draw in data:
+            if draw.ordinal == ordinal:
+                # Cache permanente para dados históricos
+                self.cache.set(cache_key, draw, ttl=86400)  # 24 horas
+                logger.info(f"Found draw for date {date}: concurso {draw.contest}")
+                return draw
+        
+        # Se não encontrou nos dados em cache, tenta buscar diretamente
+        logger.info(f"Draw not found in cache, searching API for date {date}")
+        result = self._search_draw_in_api(ordinal)
+        
+        if result:
+            self.cache.set(cache_key, result, ttl=86400)
+            return result
+        
+        logger.warning(f"No draw found for date {date}")
+        raise DrawNotFoundError(date)
     
-    def _search_draw_in_api(self, date_br: str) -> Optional[Dict]:
+    def _search_draw_in_api(self, ordinal: int) -> Optional[Draw]:
         """
         Busca um concurso diretamente na API por data.
         
         Args:
-            date_br: Data no formato brasileiro (DD/MM/YYYY)
+            ordinal: Data do concurso (`date.toordinal()`)
         
         Returns:
-            Dados do concurso ou None
+            Concurso ou None
         """
         try:
             # Busca último concurso
             def fetch_latest():
-                response = requests.get(self.base_url, timeout=10)
+                response = self.session.get(self.base_url, timeout=10)
                 response.raise_for_status()
                 return response.json()
             
@@ -328,25 +584,14 @@ class MegaSenaService:
             for num in range(max(1, concurso_num - 100), concurso_num + 1):
                 try:
                     def fetch_draw():
-                        response = requests.get(f"{self.base_url}/{num}", timeout=5)
+                        response = self.session.get(f"{self.base_url}/{num}", timeout=5)
                         response.raise_for_status()
                         return response.json()
                     
-                    draw_data = self.circuit_breaker.call(fetch_draw)
-                    draw_date = draw_data.get('dataApuracao', draw_data.get('data', ''))
+                    draw = Draw.from_payload(self.circuit_breaker.call(fetch_draw))
                     
-                    if draw_date == date_br:
-                        numeros = []
-                        if 'dezenas' in draw_data:
-                            numeros = [int(n) for n in draw_data['dezenas']]
-                        elif 'listaDezenas' in draw_data:
-                            numeros = [int(n) for n in draw_data['listaDezenas']]
-                        
-                        return {
-                            'data': date_br,
-                            'numero_concurso': str(draw_data.get('numero', draw_data.get('numeroConcurso', ''))),
-                            'numeros': numeros
-                        }
+                    if draw is not None and draw.ordinal == ordinal:
+                        return draw
                 except (requests.RequestException, CircuitBreakerOpenError):
                     continue
             
@@ -356,10 +601,95 @@ class MegaSenaService:
             logger.error(f"Error searching draw in API: {e}")
             return None
     
-    def clear_cache(self):
-        """Limpa todo o cache do serviço."""
+    def load_shared_dataset(self) -> int:
+        """
+        Carrega no cache o dataset publicado pelo launcher, se houver.
+        
+        Returns:
+            Quantidade de concursos carregados (0 sem dataset compartilhado)
+        """
+        dataset = read_shared_dataset()
+        if dataset is None or self.cache.exists("mega_sena:processed_data"):
+            return 0
+        
+        self.cache.set("mega_sena:processed_data", dataset["processed_data"], ttl=self.data_ttl)
+        if dataset.get("estimate") is not None:
+            self.cache.set("mega_sena:estimate", dataset["estimate"], ttl=self.data_ttl)
+        
+        logger.info(f"Loaded {len(dataset['processed_data'])} draws from shared dataset")
+        return len(dataset["processed_data"])
+    
+    def warmup(self, state) -> None:
+        """
+        Carrega os concursos e constrói os artefatos derivados,
+        registrando o progresso no estado de inicialização.
+        
+        Args:
+            state: StartupState do worker
+        """
+        state.begin("shared_dataset")
+        try:
+            shared = self.load_shared_dataset()
+        except Exception as e:
+            state.fail("shared_dataset", e)
+            raise
+        state.end("shared_dataset", draws=shared)
+        
+        state.begin("processed_data")
+        try:
+            data = self.get_processed_data()
+        except Exception as e:
+            state.fail("processed_data", e)
+            raise
+        state.end("processed_data", draws=len(data))
+        state.set_draws_loaded(len(data))
+        
+        state.begin("estimate")
+        try:
+            self.get_estimates()
+        except Exception as e:
+            state.fail("estimate", e)
+            raise
+        state.end("estimate")
+        state.mark_artifact("estimate")
+    
+    def clear_cache(self, rewarm: bool = False):
+        """
+        Limpa todo o cache do serviço (troca de geração).
+        
+        Args:
+            rewarm: Se True, busca os dados antes de trocar a geração e os
+                grava logo em seguida, para que nenhuma requisição pague o
+                caminho frio. Se a busca falhar, o cache é limpo mesmo assim.
+        """
+        data = None
+        if rewarm:
+            try:
+                data = self._load_fresh_data()
+            except Exception as e:
+                logger.warning(f"Cache rewarm failed, clearing without it: {e}")
+        
         self.cache.clear()
-        logger.info("Service cache cleared")
+        
+        if data is not None:
+            self._store_processed_data(data)
+            self._rebuild_estimate()
+        
+        logger.info("Service cache cleared" + (" and rewarmed" if data is not None else ""))
+    
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Remove apenas as chaves do serviço com o prefixo informado.
+        
+        Args:
+            prefix: Prefixo relativo a "mega_sena:" (ex.: "draw:")
+        
+        Returns:
+            Quantidade de chaves removidas
+        """
+        removed = self.cache.invalidate_prefix(f"mega_sena:{prefix}")
+        logger.info(f"Invalidated {removed} keys with prefix {prefix}")
+        return removed
     
     def get_stats(self) -> Dict:
         """
@@ -370,5 +700,7 @@ class MegaSenaService:
         """
         return {
             "cache_type": self.cache.get_type(),
+            "cache_generation": self.cache.get_generation(),
+            "cache_metrics": self.cache.metrics.snapshot(),
             "circuit_breaker": self.circuit_breaker.get_stats()
         }
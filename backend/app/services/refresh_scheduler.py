@@ -0,0 +1,185 @@
+"""
+Agendador de atualização baseado no calendário de sorteios da Mega-Sena.
+Consulta apenas o último concurso perto dos horários de sorteio e dispara
+a ingestão incremental quando um novo concurso é publicado.
+"""
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+from typing import Iterator, Optional, Tuple
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Horário de Brasília (sem horário de verão desde 2019)
+BRASILIA_TZ = timezone(timedelta(hours=-3), "BRT")
+
+# Sorteios regulares: terça, quinta e sábado às 20h
+DRAW_WEEKDAYS: Tuple[int, ...] = (1, 3, 5)
+DRAW_TIME = time(20, 0)
+
+
+class DrawSchedule:
+    """Calendário de sorteios com janela de consulta ao redor de cada sorteio."""
+
+    def __init__(
+        self,
+        weekdays: Tuple[int, ...] = DRAW_WEEKDAYS,
+        draw_time: time = DRAW_TIME,
+        tz: timezone = BRASILIA_TZ,
+        window_before: timedelta = timedelta(minutes=15),
+        window_after: timedelta = timedelta(hours=6),
+    ):
+        self.weekdays = weekdays
+        self.draw_time = draw_time
+        self.tz = tz
+        self.window_before = window_before
+        self.window_after = window_after
+
+    def _draws_around(self, now: datetime) -> Iterator[datetime]:
+        """Horários de sorteio de ontem até a próxima semana."""
+        local = now.astimezone(self.tz)
+        for offset in range(-1, 8):
+            day = (local + timedelta(days=offset)).date()
+            if day.weekday() in self.weekdays:
+                yield datetime.combine(day, self.draw_time, tzinfo=self.tz)
+
+    def current_window(self, now: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """Retorna a janela de consulta em andamento, se houver."""
+        for draw_at in self._draws_around(now):
+            start, end = draw_at - self.window_before, draw_at + self.window_after
+            if start <= now < end:
+                return start, end
+        return None
+
+    def next_window_start(self, now: datetime) -> datetime:
+        """Início da próxima janela de consulta."""
+        return min(
+            draw_at - self.window_before
+            for draw_at in self._draws_around(now)
+            if draw_at - self.window_before > now
+        )
+
+    def seconds_until_next_check(
+        self, now: datetime, poll_interval: float, safety_interval: float
+    ) -> float:
+        """
+        Tempo até a próxima consulta.
+
+        Dentro da janela, consulta a cada `poll_interval`; fora dela, dorme
+        até a próxima janela, limitado a `safety_interval` para detectar
+        sorteios fora do calendário regular (ex.: Mega da Virada).
+        """
+        if self.current_window(now) is not None:
+            return poll_interval
+
+        until_window = (self.next_window_start(now) - now).total_seconds()
+        return max(1.0, min(until_window, safety_interval))
+
+
+class RefreshScheduler:
+    """Detecta novos concursos e dispara a ingestão incremental."""
+
+    def __init__(
+        self,
+        service,
+        schedule: Optional[DrawSchedule] = None,
+        poll_interval: float = 300.0,
+        safety_interval: float = 21600.0,
+    ):
+        self.service = service
+        self.schedule = schedule or DrawSchedule()
+        self.poll_interval = poll_interval
+        self.safety_interval = safety_interval
+
+        self.checks = 0
+        self.refreshes = 0
+        self.last_check: Optional[str] = None
+        self.last_refresh: Optional[str] = None
+        self.last_contest: Optional[int] = None
+        self.last_error: Optional[str] = None
+
+    def check_once(self) -> bool:
+        """
+        Consulta o último concurso e ingere os novos, se houver.
+
+        Returns:
+            True se novos concursos foram incorporados
+        """
+        self.checks += 1
+        self.last_check = datetime.now().isoformat()
+
+        try:
+            latest = self.service.fetch_latest_contest()
+            known = self.service.get_latest_cached_contest()
+            self.last_contest = latest
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning(f"Refresh check failed: {e}")
+            return False
+
+        if known is not None and latest <= known:
+            logger.debug(f"No new contest (latest {latest})")
+            return False
+
+        logger.info(f"New contest detected: {latest} (cached {known})")
+        ingested: int = self.service.ingest_new_draws(latest)
+        if ingested:
+            self.refreshes += 1
+            self.last_refresh = datetime.now().isoformat()
+        return ingested > 0
+
+    async def run(self) -> None:
+        """Laço do agendador (executado como task no lifespan)."""
+        while True:
+            delay = self.schedule.seconds_until_next_check(
+                datetime.now(timezone.utc), self.poll_interval, self.safety_interval
+            )
+            logger.debug(f"Next refresh check in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+            try:
+                await asyncio.to_thread(self.check_once)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Refresh error: {e}")
+
+    def get_stats(self) -> dict:
+        """Retorna estatísticas do agendador."""
+        now = datetime.now(timezone.utc)
+        return {
+            "enabled": settings.refresh_scheduler_enabled,
+            "in_draw_window": self.schedule.current_window(now) is not None,
+            "next_window": self.schedule.next_window_start(now).isoformat(),
+            "checks": self.checks,
+            "refreshes": self.refreshes,
+            "last_check": self.last_check,
+            "last_refresh": self.last_refresh,
+            "last_contest": self.last_contest,
+            "last_error": self.last_error,
+        }
+
+
+# Instância global do agendador
+_refresh_scheduler: Optional[RefreshScheduler] = None
+
+
+def get_refresh_scheduler(service) -> RefreshScheduler:
+    """Obtém a instância global do agendador de atualização."""
+    global _refresh_scheduler
+
+    if _refresh_scheduler is None:
+        _refresh_scheduler = RefreshScheduler(
+            service,
+            schedule=DrawSchedule(
+                window_before=timedelta(minutes=settings.refresh_window_before_minutes),
+                window_after=timedelta(minutes=settings.refresh_window_after_minutes),
+            ),
+            poll_interval=settings.refresh_poll_interval,
+            safety_interval=settings.refresh_safety_interval,
+        )
+
+    return _refresh_scheduler
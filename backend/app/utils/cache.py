@@ -4,19 +4,40 @@ Implementa interface comum para diferentes backends de cache.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
+import asyncio
 from datetime import datetime, timedelta
 import json
+import os
 import pickle
+import tempfile
+import threading
+import time
+import zlib
+from app.utils.cache_metrics import CacheMetrics
 from app.utils.logger import get_logger
 from app.exceptions import CacheError
 
 logger = get_logger(__name__)
 
+# Cabeçalho dos arquivos de snapshot do cache em memória
+SNAPSHOT_MAGIC = b"MSCACHE1"
+
 
 class CacheBackend(ABC):
     """Interface abstrata para backends de cache."""
     
+    # Chamado com (chave, bytes, segundos) pelos backends que serializam o valor
+    on_write: Optional[Callable[[str, int, float], None]] = None
+    
+    def _serialize(self, key: str, value: Any) -> bytes:
+        """Serializa o valor e informa tamanho e tempo a `on_write`."""
+        started = time.perf_counter()
+        serialized = pickle.dumps(value)
+        if self.on_write is not None:
+            self.on_write(key, len(serialized), time.perf_counter() - started)
+        return serialized
+    
     @abstractmethod
     def get(self, key: str) -> Optional[Any]:
         """Obtém um valor do cache."""
@@ -41,6 +62,43 @@ class CacheBackend(ABC):
     def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
         pass
+    
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Incrementa atomicamente um contador e retorna o novo valor."""
+        pass
+    
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """Lê um contador (0 se inexistente)."""
+        pass
+    
+    @abstractmethod
+    def delete_prefix(self, prefix: str, batch_size: int = 500) -> int:
+        """Remove as chaves que começam com o prefixo e retorna quantas."""
+        pass
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Obtém vários valores do cache.
+        
+        Returns:
+            Dicionário apenas com as chaves encontradas
+        """
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Define vários valores com o mesmo TTL."""
+        return all([self.set(key, value, ttl) for key, value in mapping.items()])
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Remove várias chaves e retorna quantas foram processadas."""
+        return sum(1 for key in keys if self.delete(key))
 
 
 class MemoryCache(CacheBackend):
@@ -49,6 +107,9 @@ class MemoryCache(CacheBackend):
     def __init__(self):
         self._cache: dict = {}
         self._expiry: dict = {}
+        self._counter_lock = threading.Lock()
+        # Chamado com a chave quando uma leitura encontra a entrada expirada
+        self.on_expire: Optional[Callable[[str], None]] = None
         logger.info("Memory cache initialized")
     
     def _is_expired(self, key: str) -> bool:
@@ -67,6 +128,8 @@ class MemoryCache(CacheBackend):
             if self._is_expired(key):
                 logger.debug(f"Cache expired: {key}")
                 self.delete(key)
+                if self.on_expire is not None:
+                    self.on_expire(key)
                 return None
             
             logger.debug(f"Cache hit: {key}")
@@ -113,15 +176,156 @@ class MemoryCache(CacheBackend):
     def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
         return key in self._cache and not self._is_expired(key)
+    
+    def incr(self, key: str) -> int:
+        """Incrementa um contador (sem expiração)."""
+        with self._counter_lock:
+            value = int(self._cache.get(key, 0)) + 1
+            self._cache[key] = value
+            self._expiry.pop(key, None)
+            return value
+    
+    def get_counter(self, key: str) -> int:
+        """Lê um contador (0 se inexistente)."""
+        return int(self._cache.get(key, 0))
+    
+    def delete_prefix(self, prefix: str, batch_size: int = 500) -> int:
+        """Remove as chaves que começam com o prefixo."""
+        keys = [key for key in list(self._cache) if key.startswith(prefix)]
+        for key in keys:
+            self._cache.pop(key, None)
+            self._expiry.pop(key, None)
+        logger.debug(f"Cache prefix deleted: {prefix} ({len(keys)} keys)")
+        return len(keys)
+    
+    def save_snapshot(self, path: str) -> int:
+        """
+        Grava as entradas válidas em um arquivo (pickle + zlib).
+        
+        A escrita é atômica: o conteúdo vai para um arquivo temporário no
+        mesmo diretório, que então substitui o snapshot anterior.
+        
+        Args:
+            path: Caminho do arquivo de snapshot
+            
+        Returns:
+            Quantidade de entradas gravadas
+        """
+        now = datetime.now()
+        wall_now = time.time()
+        # Cópias rasas: o GIL garante que a cópia do dict é consistente
+        cache = dict(self._cache)
+        expiry = dict(self._expiry)
+        
+        entries = []
+        for key, value in cache.items():
+            expires_at = expiry.get(key)
+            if expires_at is not None and expires_at <= now:
+                continue
+            # Expiração em epoch, independente do relógio do processo
+            expires_epoch = None
+            if expires_at is not None:
+                expires_epoch = wall_now + (expires_at - now).total_seconds()
+            entries.append((key, value, expires_epoch))
+        
+        payload = zlib.compress(
+            pickle.dumps({"saved_at": wall_now, "entries": entries}, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cache-snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(SNAPSHOT_MAGIC)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        
+        logger.info(f"Cache snapshot saved: {len(entries)} entries ({len(payload)} bytes)")
+        return len(entries)
+    
+    def load_snapshot(self, path: str) -> int:
+        """
+        Carrega um snapshot, mantendo o TTL restante de cada entrada.
+        
+        Entradas já expiradas são descartadas e chaves já presentes no
+        cache não são sobrescritas.
+        
+        Args:
+            path: Caminho do arquivo de snapshot
+            
+        Returns:
+            Quantidade de entradas carregadas
+        """
+        if not os.path.exists(path):
+            return 0
+        
+        with open(path, "rb") as f:
+            header = f.read(len(SNAPSHOT_MAGIC))
+            if header != SNAPSHOT_MAGIC:
+                raise CacheError(f"Invalid cache snapshot: {path}")
+            snapshot = pickle.loads(zlib.decompress(f.read()))
+        
+        now = datetime.now()
+        wall_now = time.time()
+        loaded = 0
+        
+        for key, value, expires_epoch in snapshot["entries"]:
+            if key in self._cache:
+                continue
+            if expires_epoch is not None:
+                remaining = expires_epoch - wall_now
+                if remaining <= 0:
+                    continue
+                self._expiry[key] = now + timedelta(seconds=remaining)
+            self._cache[key] = value
+            loaded += 1
+        
+        logger.info(f"Cache snapshot loaded: {loaded} entries")
+        return loaded
+
+
+def _escape_glob(value: str) -> str:
+    """Escapa caracteres especiais do padrão MATCH do Redis."""
+    for char in "\\*?[]":
+        value = value.replace(char, "\\" + char)
+    return value
 
 
 class RedisCache(CacheBackend):
-    """Implementação de cache usando Redis."""
+    """
+    Implementação de cache usando Redis.
+    
+    Usa um pool de conexões dimensionado para os workers de ingestão e
+    operações em lote (MGET e pipelines) com uma única ida ao servidor.
+    """
     
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        connect_timeout: float = 2.0,
+        socket_timeout: float = 1.0,
+        max_connections: int = 50,
+        health_check_interval: int = 30
+    ):
         try:
             import redis
-            self._redis = redis.from_url(redis_url, decode_responses=False)
+            self._redis = redis.from_url(
+                redis_url,
+                decode_responses=False,
+                socket_connect_timeout=connect_timeout,
+                socket_timeout=socket_timeout,
+                socket_keepalive=True,
+                retry_on_timeout=True,
+                max_connections=max_connections,
+                health_check_interval=health_check_interval
+            )
             # Testa conexão
             self._redis.ping()
             logger.info(f"Redis cache initialized: {redis_url}")
@@ -148,7 +352,7 @@ class RedisCache(CacheBackend):
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Define um valor no cache com TTL."""
         try:
-            serialized = pickle.dumps(value)
+            serialized = self._serialize(key, value)
             self._redis.setex(key, ttl, serialized)
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
@@ -183,58 +387,519 @@ class RedisCache(CacheBackend):
         except Exception as e:
             logger.error(f"Error checking Redis key existence: {e}")
             return False
+    
+    def incr(self, key: str) -> int:
+        """Incrementa um contador com INCR (valor bruto, não serializado)."""
+        return int(self._redis.incr(key))
+    
+    def get_counter(self, key: str) -> int:
+        """Lê um contador (0 se inexistente)."""
+        value = self._redis.get(key)
+        return int(value) if value is not None else 0
+    
+    def delete_prefix(self, prefix: str, batch_size: int = 500) -> int:
+        """
+        Remove as chaves do prefixo com SCAN + UNLINK em lotes,
+        sem bloquear o servidor como KEYS ou FLUSHDB.
+        """
+        pattern = _escape_glob(prefix) + "*"
+        deleted = 0
+        batch = []
+        try:
+            for key in self._redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += int(self._redis.unlink(*batch))
+                    batch = []
+            if batch:
+                deleted += int(self._redis.unlink(*batch))
+            logger.info(f"Redis prefix deleted: {prefix} ({deleted} keys)")
+        except Exception as e:
+            logger.error(f"Error deleting Redis prefix {prefix}: {e}")
+        return deleted
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Obtém vários valores com um único MGET."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            values = self._redis.mget(keys)
+            return {
+                key: pickle.loads(value)
+                for key, value in zip(keys, values)
+                if value is not None
+            }
+        except Exception as e:
+            logger.error(f"Error getting many from Redis: {e}")
+            return {}
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Define vários valores em um pipeline (uma ida ao servidor)."""
+        if not mapping:
+            return True
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, self._serialize(key, value))
+            pipe.execute()
+            logger.debug(f"Cache set many: {len(mapping)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Error setting many in Redis: {e}")
+            return False
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Remove várias chaves com um único DEL."""
+        keys = list(keys)
+        if not keys:
+            return 0
+        try:
+            return int(self._redis.delete(*keys))
+        except Exception as e:
+            logger.error(f"Error deleting many from Redis: {e}")
+            return 0
+
+
+class AsyncRedisCache:
+    """
+    Cliente Redis assíncrono (redis.asyncio) para as rotas async.
+    
+    Evita ocupar threads do pool com I/O de cache nas leituras em lote.
+    O cliente fica associado ao loop de eventos em que foi criado.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str,
+        connect_timeout: float = 2.0,
+        socket_timeout: float = 1.0,
+        max_connections: int = 50,
+        health_check_interval: int = 30
+    ):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise CacheError("Redis package not installed. Install with: pip install redis")
+        
+        self._redis = aioredis.from_url(
+            redis_url,
+            decode_responses=False,
+            socket_connect_timeout=connect_timeout,
+            socket_timeout=socket_timeout,
+            socket_keepalive=True,
+            retry_on_timeout=True,
+            max_connections=max_connections,
+            health_check_interval=health_check_interval
+        )
+    
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Obtém vários valores com um único MGET."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = await self._redis.mget(keys)
+        return {
+            key: pickle.loads(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+    
+    async def close(self) -> None:
+        """Fecha o pool de conexões."""
+        await self._redis.aclose()
 
 
 class CacheManager:
-    """Gerenciador de cache com fallback automático."""
+    """
+    Gerenciador de cache com fallback automático.
+    
+    Sempre inicia com cache em memória, sem bloquear a importação da
+    aplicação. A conexão ao Redis é feita por `connect()` (chamado no
+    lifespan); se falhar, uma thread em background tenta novamente e
+    promove o backend para Redis quando ele ficar disponível.
     
-    def __init__(self, cache_type: str = "memory", redis_url: str = None):
+    As chaves são gravadas sob `<namespace>:<geração>:<chave>`. Limpar o
+    cache incrementa a geração (O(1)), sem FLUSHDB: as chaves da geração
+    anterior deixam de ser lidas e expiram pelo próprio TTL.
+    """
+    
+    def __init__(
+        self,
+        cache_type: str = "memory",
+        redis_url: str = None,
+        connect_timeout: float = 2.0,
+        retry_interval: float = 30.0,
+        snapshot_path: Optional[str] = None,
+        redis_options: Optional[Dict[str, Any]] = None,
+        namespace: str = "cache",
+        generation_refresh_interval: float = 1.0,
+        metrics_enabled: bool = True
+    ):
         """
         Inicializa o gerenciador de cache.
         
         Args:
             cache_type: Tipo de cache ('memory' ou 'redis')
             redis_url: URL do Redis (necessário se cache_type='redis')
+            connect_timeout: Timeout de conexão com o Redis em segundos
+            retry_interval: Intervalo entre novas tentativas de conexão (0 desabilita)
+            snapshot_path: Arquivo de snapshot do cache em memória (None desabilita)
+            redis_options: Ajustes do pool Redis (socket_timeout, max_connections,
+                health_check_interval)
+            namespace: Prefixo de todas as chaves da aplicação
+            generation_refresh_interval: Intervalo para reler a geração
+                compartilhada (s); outros workers veem uma limpeza nesse prazo
+            metrics_enabled: Coleta métricas por prefixo (o tamanho vem da
+                serialização que o backend já faz)
         """
-        self.cache_type = cache_type
+        self.cache_type = "memory"
+        self.requested_type = cache_type
+        self.redis_url = redis_url
+        self.connect_timeout = connect_timeout
+        self.retry_interval = retry_interval
+        self.snapshot_path = snapshot_path
+        self.redis_options = redis_options or {}
+        self.namespace = namespace
+        self.generation_refresh_interval = generation_refresh_interval
+        
+        self.metrics_enabled = metrics_enabled
+        self.metrics = CacheMetrics()
+        
+        self._backend: CacheBackend = MemoryCache()
+        self._backend.on_expire = self._on_expire
+        self._backend.on_write = self._on_write
+        self._generation: Optional[int] = None
+        self._generation_checked_at = 0.0
+        self._async_backend: Optional[AsyncRedisCache] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._retry_thread: Optional[threading.Thread] = None
+        self._stop_retry = threading.Event()
+        self._connect_lock = threading.Lock()
         
         if cache_type == "redis" and redis_url:
+            logger.info("Using memory cache until Redis connects")
+        else:
+            logger.info("Using memory cache")
+    
+    def connect(self) -> bool:
+        """
+        Conecta ao backend configurado.
+        
+        Em caso de falha, mantém o cache em memória e agenda novas
+        tentativas em background.
+        
+        Returns:
+            True se o backend configurado está em uso
+        """
+        if self.requested_type != "redis" or not self.redis_url:
+            return True
+        
+        if self._try_connect():
+            return True
+        
+        self._start_retry()
+        return False
+    
+    def _try_connect(self) -> bool:
+        """Tenta conectar ao Redis e promover o backend."""
+        with self._connect_lock:
+            if self.cache_type == "redis":
+                return True
+            
             try:
-                self._backend = RedisCache(redis_url)
+                self._backend = RedisCache(
+                    self.redis_url,
+                    connect_timeout=self.connect_timeout,
+                    **self.redis_options
+                )
+                self._backend.on_write = self._on_write
+                self.cache_type = "redis"
+                # A geração passa a ser a compartilhada no Redis
+                self._generation = None
                 logger.info("Using Redis cache")
+                return True
             except CacheError as e:
-                logger.warning(f"Redis unavailable, falling back to memory cache: {e}")
-                self._backend = MemoryCache()
-                self.cache_type = "memory"
-        else:
-            self._backend = MemoryCache()
-            logger.info("Using memory cache")
+                logger.warning(f"Redis unavailable, using memory cache: {e}")
+                return False
+    
+    def _start_retry(self) -> None:
+        """Inicia a thread de reconexão ao Redis."""
+        if self.retry_interval <= 0 or self._retry_thread is not None:
+            return
+        
+        def retry_loop():
+            while not self._stop_retry.wait(self.retry_interval):
+                if self._try_connect():
+                    break
+            self._retry_thread = None
+        
+        self._retry_thread = threading.Thread(
+            target=retry_loop,
+            name="redis-reconnect",
+            daemon=True
+        )
+        self._retry_thread.start()
+    
+    def close(self) -> None:
+        """Interrompe a reconexão em background."""
+        self._stop_retry.set()
+    
+    def save_snapshot(self) -> int:
+        """
+        Grava o snapshot do cache em memória, se habilitado.
+        
+        Returns:
+            Quantidade de entradas gravadas (0 se desabilitado ou em Redis)
+        """
+        if not self.snapshot_path or not isinstance(self._backend, MemoryCache):
+            return 0
+        
+        try:
+            return self._backend.save_snapshot(self.snapshot_path)
+        except Exception as e:
+            logger.error(f"Error saving cache snapshot: {e}")
+            return 0
+    
+    def load_snapshot(self) -> int:
+        """
+        Restaura o snapshot no cache em memória, se habilitado.
+        
+        Returns:
+            Quantidade de entradas carregadas
+        """
+        if not self.snapshot_path or not isinstance(self._backend, MemoryCache):
+            return 0
+        
+        try:
+            return self._backend.load_snapshot(self.snapshot_path)
+        except Exception as e:
+            logger.error(f"Error loading cache snapshot: {e}")
+            return 0
+    
+    @property
+    def generation_key(self) -> str:
+        """Chave do contador de geração."""
+        return f"{self.namespace}:generation"
+    
+    def get_generation(self) -> int:
+        """Geração atual (relida do backend a cada `generation_refresh_interval`)."""
+        now = time.monotonic()
+        if self._generation is None or now - self._generation_checked_at >= self.generation_refresh_interval:
+            try:
+                self._generation = self._backend.get_counter(self.generation_key)
+            except Exception as e:
+                logger.error(f"Error reading cache generation: {e}")
+                if self._generation is None:
+                    self._generation = 0
+            self._generation_checked_at = now
+        return self._generation
+    
+    def _key(self, key: str) -> str:
+        """Chave física (namespace + geração) de uma chave lógica."""
+        return f"{self.namespace}:{self.get_generation()}:{key}"
+    
+    def _logical_key(self, physical_key: str) -> str:
+        """Chave lógica de uma chave física (sem namespace e geração)."""
+        return physical_key[len(self.namespace) + 1:].split(":", 1)[-1]
+    
+    def _on_expire(self, physical_key: str) -> None:
+        """Registra entradas expiradas encontradas pelo cache em memória."""
+        if self.metrics_enabled:
+            self.metrics.record_expired(self._logical_key(physical_key))
+    
+    def _on_write(self, physical_key: str, size: int, seconds: float) -> None:
+        """Registra o tamanho serializado informado pelo backend."""
+        if self.metrics_enabled:
+            self.metrics.record_serialization(self._logical_key(physical_key), size, seconds)
     
     def get(self, key: str) -> Optional[Any]:
         """Obtém um valor do cache."""
-        return self._backend.get(key)
+        started = time.perf_counter()
+        value = self._backend.get(self._key(key))
+        if self.metrics_enabled:
+            self.metrics.record_read(key, value is not None, time.perf_counter() - started)
+        return value
     
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Define um valor no cache com TTL."""
-        return self._backend.set(key, value, ttl)
+        started = time.perf_counter()
+        result = self._backend.set(self._key(key), value, ttl)
+        if self.metrics_enabled and result:
+            self.metrics.record_write(key, time.perf_counter() - started)
+        return result
     
     def delete(self, key: str) -> bool:
         """Remove um valor do cache."""
-        return self._backend.delete(key)
+        result = self._backend.delete(self._key(key))
+        if self.metrics_enabled:
+            self.metrics.record_eviction(key)
+        return result
     
     def clear(self) -> bool:
-        """Limpa todo o cache."""
-        return self._backend.clear()
+        """
+        Invalida todo o cache da aplicação incrementando a geração.
+        
+        No Redis é um único INCR: outros dados do banco (inclusive o estado
+        do rate limiting) não são afetados. Em memória, as entradas da
+        geração anterior também são descartadas para liberar espaço.
+        """
+        try:
+            previous = self.get_generation()
+            self._generation = self._backend.incr(self.generation_key)
+            self._generation_checked_at = time.monotonic()
+            
+            if isinstance(self._backend, MemoryCache):
+                self._backend.delete_prefix(f"{self.namespace}:{previous}:")
+            if self.metrics_enabled:
+                self.metrics.record_clear()
+            
+            logger.info(f"Cache generation bumped to {self._generation}")
+            return True
+        except Exception as e:
+            logger.error(f"Error bumping cache generation: {e}")
+            return False
+    
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Remove as chaves lógicas que começam com o prefixo na geração atual.
+        
+        Args:
+            prefix: Prefixo lógico (ex.: "mega_sena:draw:")
+        
+        Returns:
+            Quantidade de chaves removidas
+        """
+        removed = self._backend.delete_prefix(self._key(prefix))
+        if self.metrics_enabled:
+            self.metrics.record_prefix_eviction(prefix, removed)
+        return removed
     
     def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
-        return self._backend.exists(key)
+        return self._backend.exists(self._key(key))
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Obtém vários valores do cache."""
+        physical = {self._key(key): key for key in keys}
+        started = time.perf_counter()
+        found = self._backend.get_many(physical)
+        result = {physical[key]: value for key, value in found.items()}
+        if self.metrics_enabled:
+            self._record_bulk_read(physical.values(), result, started)
+        return result
+    
+    def _record_bulk_read(self, keys: Iterable[str], found: Dict[str, Any], started: float) -> None:
+        """Registra uma leitura em lote (latência dividida entre as chaves)."""
+        keys = list(keys)
+        per_key = (time.perf_counter() - started) / max(1, len(keys))
+        for key in keys:
+            self.metrics.record_read(key, key in found, per_key)
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Define vários valores com o mesmo TTL."""
+        started = time.perf_counter()
+        result = self._backend.set_many(
+            {self._key(key): value for key, value in mapping.items()}, ttl
+        )
+        if self.metrics_enabled and result:
+            per_key = (time.perf_counter() - started) / max(1, len(mapping))
+            for key in mapping:
+                self.metrics.record_write(key, per_key)
+        return result
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Remove várias chaves."""
+        keys = list(keys)
+        result = self._backend.delete_many([self._key(key) for key in keys])
+        if self.metrics_enabled:
+            for key in keys:
+                self.metrics.record_eviction(key)
+        return result
+    
+    def _discard_async_backend(self) -> None:
+        """
+        Descarta o cliente assíncrono de outro loop.
+        
+        O pool só pode ser fechado no loop em que foi criado: se ele ainda
+        está rodando, o fechamento é agendado nele; se já terminou, não há
+        onde aguardar o fechamento e as conexões são liberadas junto com o
+        cliente descartado.
+        """
+        backend, loop = self._async_backend, self._async_loop
+        self._async_backend = None
+        self._async_loop = None
+        if backend is None or loop is None or loop.is_closed() or not loop.is_running():
+            return
+        
+        async def close() -> None:
+            try:
+                await backend.close()
+            except Exception as e:
+                logger.debug(f"Error closing async Redis client: {e}")
+        
+        asyncio.run_coroutine_threadsafe(close(), loop)
+    
+    def _get_async_backend(self) -> Optional[AsyncRedisCache]:
+        """Cliente assíncrono para o loop atual (apenas com Redis em uso)."""
+        if self.cache_type != "redis":
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._async_backend is None or self._async_loop is not loop:
+            self._discard_async_backend()
+            self._async_backend = AsyncRedisCache(
+                self.redis_url,
+                connect_timeout=self.connect_timeout,
+                **self.redis_options
+            )
+            self._async_loop = loop
+        return self._async_backend
+    
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Versão assíncrona de `get_many`.
+        
+        Com Redis, usa redis.asyncio sem ocupar threads; em memória, a
+        leitura é local e feita diretamente.
+        """
+        backend = self._get_async_backend()
+        if backend is None:
+            return self.get_many(keys)
+        
+        physical = {self._key(key): key for key in keys}
+        started = time.perf_counter()
+        try:
+            found = await backend.get_many(physical)
+        except Exception as e:
+            logger.error(f"Error getting many from async Redis: {e}")
+            return {}
+        result = {physical[key]: value for key, value in found.items()}
+        if self.metrics_enabled:
+            self._record_bulk_read(physical.values(), result, started)
+        return result
+    
+    async def aclose(self) -> None:
+        """Fecha o cliente assíncrono, se criado."""
+        if self._async_backend is not None:
+            try:
+                await self._async_backend.close()
+            except Exception as e:
+                logger.debug(f"Error closing async Redis client: {e}")
+            self._async_backend = None
+            self._async_loop = None
     
     def get_type(self) -> str:
         """Retorna o tipo de cache em uso."""
         return self.cache_type
 
 
+# Versão do formato dos valores gravados pelo serviço; faz parte do
+# namespace para que valores de versões anteriores nunca sejam lidos
+# (2: concursos como `Draw` em vez de dicionários; 3: `Draw.mask`;
+# 4: estimativa com todas as estratégias)
+CACHE_SCHEMA_VERSION = 4
+
 # Instância global de cache
 _cache_manager: Optional[CacheManager] = None
 
@@ -247,7 +912,17 @@ def get_cache() -> CacheManager:
         from app.config import settings
         _cache_manager = CacheManager(
             cache_type=settings.cache_type,
-            redis_url=settings.redis_url
+            redis_url=settings.redis_url,
+            connect_timeout=settings.redis_connect_timeout,
+            retry_interval=settings.redis_retry_interval,
+            snapshot_path=settings.cache_snapshot_path or None,
+            redis_options={
+                "socket_timeout": settings.redis_socket_timeout,
+                "max_connections": settings.redis_max_connections,
+                "health_check_interval": settings.redis_health_check_interval
+            },
+            namespace=f"{settings.cache_namespace}:v{CACHE_SCHEMA_VERSION}",
+            metrics_enabled=settings.cache_metrics_enabled
         )
     
     return _cache_manager
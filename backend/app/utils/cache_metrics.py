@@ -0,0 +1,212 @@
+"""
+Métricas do cache por prefixo de chave.
+Contabiliza acertos, falhas, entradas expiradas, remoções, bytes
+armazenados, tempo de serialização e latência do backend, para embasar a
+escolha de TTLs e orçamentos de memória. Tamanho e tempo de serialização
+são os informados pelo backend (o cache em memória não serializa).
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Amostras de latência mantidas por prefixo e operação
+LATENCY_SAMPLES = 1024
+
+# Limite de chaves acompanhadas individualmente (top keys)
+MAX_TRACKED_KEYS = 10_000
+
+
+def key_prefix(key: str) -> str:
+    """
+    Agrupa uma chave lógica pelo prefixo.
+
+    Examples:
+        "mega_sena:processed_data" -> "processed_data"
+        "mega_sena:draw:2024-01-15" -> "draw:*"
+    """
+    parts = key.split(":")
+    if parts[0] == "mega_sena" and len(parts) > 1:
+        parts = parts[1:]
+    if len(parts) > 1:
+        return f"{parts[0]}:*"
+    return parts[0]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Percentil pelo método do vizinho mais próximo."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class PrefixStats:
+    """Contadores de um prefixo."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.writes = 0
+        self.serialized = 0
+        self.serialize_seconds = 0.0
+        self.latency: Dict[str, Deque[float]] = {
+            "read": deque(maxlen=LATENCY_SAMPLES),
+            "write": deque(maxlen=LATENCY_SAMPLES),
+        }
+
+    def to_dict(self, bytes_stored: int, keys: int) -> Dict[str, Any]:
+        reads = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / reads, 4) if reads else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "writes": self.writes,
+            "keys": keys,
+            "bytes_stored": bytes_stored,
+            "serialize_ms_avg": (
+                round(self.serialize_seconds / self.serialized * 1000, 4)
+                if self.serialized
+                else 0.0
+            ),
+            "latency_ms": {
+                op: {
+                    "p50": round(_percentile(list(samples), 50) * 1000, 4),
+                    "p95": round(_percentile(list(samples), 95) * 1000, 4),
+                    "p99": round(_percentile(list(samples), 99) * 1000, 4),
+                    "samples": len(samples),
+                }
+                for op, samples in self.latency.items()
+            },
+        }
+
+
+class CacheMetrics:
+    """
+    Métricas agregadas por prefixo e por chave.
+
+    `bytes_stored` é o tamanho serializado informado pelo backend na escrita
+    (0 no cache em memória, que guarda os objetos sem serializar) e deixa
+    de contar a chave quando ela é removida pela aplicação; entradas que
+    expiram sozinhas no Redis continuam contadas até serem regravadas.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zera todas as métricas."""
+        with self._lock:
+            self._prefixes: Dict[str, PrefixStats] = {}
+            # chave -> [bytes, acessos]
+            self._keys: Dict[str, List[int]] = {}
+
+    def _prefix(self, key: str) -> PrefixStats:
+        prefix = key_prefix(key)
+        stats = self._prefixes.get(prefix)
+        if stats is None:
+            stats = self._prefixes[prefix] = PrefixStats()
+        return stats
+
+    def _track_key(self, key: str) -> Optional[List[int]]:
+        entry = self._keys.get(key)
+        if entry is None and len(self._keys) < MAX_TRACKED_KEYS:
+            entry = self._keys[key] = [0, 0]
+        return entry
+
+    def record_read(self, key: str, hit: bool, seconds: float) -> None:
+        """Registra uma leitura."""
+        with self._lock:
+            stats = self._prefix(key)
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            stats.latency["read"].append(seconds)
+            entry = self._track_key(key)
+            if entry is not None:
+                entry[1] += 1
+
+    def record_write(self, key: str, seconds: float) -> None:
+        """Registra uma escrita e sua latência."""
+        with self._lock:
+            stats = self._prefix(key)
+            stats.writes += 1
+            stats.latency["write"].append(seconds)
+            self._track_key(key)
+
+    def record_serialization(self, key: str, size: int, seconds: float) -> None:
+        """Registra o tamanho e o tempo de serialização informados pelo backend."""
+        with self._lock:
+            stats = self._prefix(key)
+            stats.serialized += 1
+            stats.serialize_seconds += seconds
+            entry = self._track_key(key)
+            if entry is not None:
+                entry[0] = size
+
+    def record_expired(self, key: str) -> None:
+        """Registra uma leitura que encontrou a entrada já expirada (e a descartou)."""
+        with self._lock:
+            stats = self._prefix(key)
+            stats.expired += 1
+            stats.evictions += 1
+            self._keys.pop(key, None)
+
+    def record_eviction(self, key: str) -> None:
+        """Registra a remoção de uma chave."""
+        with self._lock:
+            self._prefix(key).evictions += 1
+            self._keys.pop(key, None)
+
+    def record_prefix_eviction(self, prefix: str, removed: int) -> None:
+        """Registra a remoção de todas as chaves de um prefixo lógico."""
+        with self._lock:
+            keys = [key for key in self._keys if key.startswith(prefix)]
+            for key in keys:
+                del self._keys[key]
+            self._prefix(prefix + "*").evictions += removed
+
+    def record_clear(self) -> None:
+        """Registra a invalidação total (troca de geração)."""
+        with self._lock:
+            for key in list(self._keys):
+                self._prefix(key).evictions += 1
+            self._keys.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Métricas por prefixo."""
+        with self._lock:
+            sizes: Dict[str, List[int]] = {}
+            for key, (size, _) in self._keys.items():
+                if not size:
+                    continue
+                total = sizes.setdefault(key_prefix(key), [0, 0])
+                total[0] += size
+                total[1] += 1
+            return {
+                prefix: stats.to_dict(*sizes.get(prefix, (0, 0)))
+                for prefix, stats in sorted(self._prefixes.items())
+            }
+
+    def top_keys(self, limit: int = 20, sort: str = "bytes") -> List[Dict[str, Any]]:
+        """
+        Chaves com maior tamanho ou mais acessos.
+
+        Args:
+            limit: Quantidade de chaves
+            sort: "bytes" ou "accesses"
+        """
+        index = 0 if sort == "bytes" else 1
+        with self._lock:
+            ordered = sorted(self._keys.items(), key=lambda item: item[1][index], reverse=True)
+            return [
+                {"key": key, "prefix": key_prefix(key), "bytes": size, "accesses": accesses}
+                for key, (size, accesses) in ordered[:limit]
+            ]
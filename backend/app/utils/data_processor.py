@@ -4,60 +4,63 @@ Calcula frequências e probabilidades dos números.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Iterable, Iterator, Optional
 
-def normalize_data(data: List[Dict]) -> List[Dict]:
+from app.utils.draw import Draw
+
+# Janela de histórico considerada pelo serviço
+HISTORY_DAYS = 730
+
+
+def two_year_cutoff() -> int:
+    """Ordinal da data de corte (2 anos atrás)."""
+    return (datetime.now() - timedelta(days=HISTORY_DAYS)).toordinal()
+
+
+def iter_draws(payloads: Iterable[Optional[Dict]], cutoff: Optional[int] = None) -> Iterator[Draw]:
+    """
+    Pipeline de ingestão em uma passada: cada payload é validado,
+    normalizado e filtrado pela data à medida que chega, sem listas
+    intermediárias.
+    
+    Args:
+        payloads: Payloads da API externa (None é ignorado)
+        cutoff: Ordinal mínimo da data do concurso (None não filtra)
+        
+    Yields:
+        Concursos válidos dentro da janela
+    """
+    for item in payloads:
+        if not item:
+            continue
+        draw = Draw.from_payload(item)
+        if draw is not None and (cutoff is None or draw.ordinal >= cutoff):
+            yield draw
+
+
+def normalize_data(data: List[Dict]) -> List[Draw]:
     """
-    Normaliza os dados dos concursos em uma lista de dicionários.
+    Normaliza os dados dos concursos em registros compactos.
     
     Args:
         data: Lista de dicionários com dados dos concursos
         
     Returns:
-        Lista de dicionários com chaves: data, numero_concurso, numeros
+        Lista de Draw; registros sem número, data válida ou pelo menos
+        4 dezenas (quadra) são descartados
     """
     if not data:
         return []
     
-    records = []
-    for item in data:
-        # Extrai os números sorteados
-        numeros = []
-        
-        # Tenta diferentes formatos de resposta da API
-        if 'dezenas' in item and isinstance(item['dezenas'], list):
-            try:
-                numeros = [int(n) for n in item['dezenas']]
-            except (ValueError, TypeError):
-                pass
-        elif 'listaDezenas' in item and isinstance(item['listaDezenas'], list):
-            try:
-                numeros = [int(n) for n in item['listaDezenas']]
-            except (ValueError, TypeError):
-                pass
-        elif 'numeros' in item and isinstance(item['numeros'], list):
-            try:
-                numeros = [int(n) for n in item['numeros']]
-            except (ValueError, TypeError):
-                pass
-        
-        # Se encontrou números válidos, adiciona ao registro
-        if numeros and len(numeros) >= 4:  # Pelo menos 4 números (quadra)
-            records.append({
-                'data': item.get('dataApuracao', item.get('data', item.get('dataApuracaoStr', ''))),
-                'numero_concurso': str(item.get('numero', item.get('numeroConcurso', item.get('concurso', '')))),
-                'numeros': numeros
-            })
-    
-    return records
+    return list(iter_draws(data))
 
 
-def filter_last_two_years(data: List[Dict]) -> List[Dict]:
+def filter_last_two_years(data: List[Draw]) -> List[Draw]:
     """
     Filtra apenas os concursos dos últimos 2 anos.
     
     Args:
-        data: Lista de dicionários com dados dos concursos
+        data: Lista de concursos
         
     Returns:
         Lista filtrada
@@ -65,36 +68,18 @@ def filter_last_two_years(data: List[Dict]) -> List[Dict]:
     if not data:
         return data
     
-    # Data de corte: 2 anos atrás
-    cutoff_date = datetime.now() - timedelta(days=730)
+    # Comparação direta entre ordinais
+    cutoff = two_year_cutoff()
     
-    filtered_data = []
-    
-    for item in data:
-        date_str = item.get('data', '')
-        if not date_str:
-            continue
-            
-        try:
-            # Tenta converter a data
-            date_obj = datetime.strptime(date_str, '%d/%m/%Y')
-            
-            if date_obj >= cutoff_date:
-                # Adiciona o objeto datetime para facilitar uso posterior, ou mantém string?
-                # Vamos manter string para compatibilidade, mas a comparação foi feita
-                filtered_data.append(item)
-        except ValueError:
-            pass
-            
-    return filtered_data
-
-
-def calculate_frequencies(data: List[Dict]) -> Dict[int, int]:
+    return [draw for draw in data if draw.ordinal >= cutoff]
+
+
+def calculate_frequencies(data: Iterable[Draw]) -> Dict[int, int]:
     """
     Calcula a frequência de cada número (1 a 60).
     
     Args:
-        data: Lista de dicionários com dados dos concursos
+        data: Concursos
         
     Returns:
         Dicionário com frequência de cada número
@@ -105,12 +90,10 @@ def calculate_frequencies(data: List[Dict]) -> Dict[int, int]:
         return frequencies
     
     # Conta a frequência de cada número
-    for row in data:
-        numeros = row.get('numeros', [])
-        if isinstance(numeros, list):
-            for num in numeros:
-                if 1 <= num <= 60:
-                    frequencies[num] += 1
+    for draw in data:
+        for num in draw.numbers:
+            if 1 <= num <= 60:
+                frequencies[num] += 1
     
     return frequencies
 
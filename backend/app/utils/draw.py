@@ -0,0 +1,240 @@
+"""
+Representação compacta de um concurso da Mega-Sena.
+Datas são guardadas como ordinal (`date.toordinal()`), o número do concurso
+como inteiro e as dezenas como tupla ordenada e como máscara de bits; a
+conversão para os formatos de texto da API acontece apenas na resposta.
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+# Campos de data aceitos nos payloads da API da Caixa
+DATE_FIELDS = ("dataApuracao", "data", "dataApuracaoStr")
+
+# Campos de dezenas aceitos, em ordem de preferência
+NUMBER_FIELDS = ("dezenas", "listaDezenas", "numeros")
+
+# Campos do número do concurso
+CONTEST_FIELDS = ("numero", "numeroConcurso", "concurso")
+
+# Maior dezena da Mega-Sena
+MAX_NUMBER = 60
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> Optional[int]:
+    """
+    Converte uma data 'dd/mm/YYYY' ou 'YYYY-MM-DD' em ordinal.
+
+    Memoizada: há no máximo algumas milhares de datas de sorteio distintas.
+
+    Returns:
+        Ordinal da data ou None se o formato for inválido
+    """
+    if not value or len(value) != 10:
+        return None
+    try:
+        if value[2] == "/" and value[5] == "/":
+            if not (value[:2] + value[3:5] + value[6:]).isdigit():
+                return None
+            return date(int(value[6:]), int(value[3:5]), int(value[:2])).toordinal()
+        return parse_iso_date(value)
+    except ValueError:
+        return None
+
+
+def parse_iso_date(value: str) -> Optional[int]:
+    """
+    Converte uma data 'YYYY-MM-DD' (formato das rotas) em ordinal.
+
+    Returns:
+        Ordinal da data ou None se o formato for inválido
+    """
+    if not value or len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return None
+    if not (value[:4] + value[5:7] + value[8:]).isdigit():
+        return None
+    try:
+        return date(int(value[:4]), int(value[5:7]), int(value[8:])).toordinal()
+    except ValueError:
+        return None
+
+
+def ordinal_to_br(ordinal: int) -> str:
+    """Ordinal -> 'dd/mm/YYYY'."""
+    day = date.fromordinal(ordinal)
+    return f"{day.day:02d}/{day.month:02d}/{day.year:04d}"
+
+
+def ordinal_to_iso(ordinal: int) -> str:
+    """Ordinal -> 'YYYY-MM-DD'."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+def today_ordinal() -> int:
+    """Ordinal da data atual."""
+    return datetime.now().toordinal()
+
+
+def numbers_to_mask(numbers: Iterable[int]) -> int:
+    """Dezenas -> máscara de 64 bits (bit n-1 = dezena n); ignora valores fora de 1..60."""
+    mask = 0
+    for num in numbers:
+        if 1 <= num <= MAX_NUMBER:
+            mask |= 1 << (num - 1)
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class Draw:
+    """Concurso imutável: número, data (ordinal), dezenas ordenadas e sua máscara."""
+
+    contest: int
+    ordinal: int
+    numbers: Tuple[int, ...]
+    mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "mask", numbers_to_mask(self.numbers))
+
+    @property
+    def date(self) -> date:
+        """Data do concurso."""
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def date_br(self) -> str:
+        """Data no formato da API ('dd/mm/YYYY')."""
+        return ordinal_to_br(self.ordinal)
+
+    @property
+    def date_iso(self) -> str:
+        """Data no formato 'YYYY-MM-DD'."""
+        return ordinal_to_iso(self.ordinal)
+
+    def to_api(self) -> Dict[str, Any]:
+        """Formato de resposta da API."""
+        return {
+            "data": self.date_br,
+            "numero_concurso": str(self.contest),
+            "numeros": list(self.numbers),
+        }
+
+    @classmethod
+    def from_payload(cls, item: Dict[str, Any]) -> Optional["Draw"]:
+        """
+        Cria um concurso a partir de um payload da API externa.
+
+        Returns:
+            Draw ou None se faltar número, data ou dezenas válidas
+            (pelo menos 4 dezenas)
+        """
+        numbers = _extract_numbers(item)
+        if numbers is None or len(numbers) < 4:
+            return None
+
+        ordinal = parse_date(_first(item, DATE_FIELDS) or "")
+        if ordinal is None:
+            return None
+
+        try:
+            contest = int(_first(item, CONTEST_FIELDS))
+        except (TypeError, ValueError):
+            return None
+
+        return cls(contest, ordinal, tuple(sorted(numbers)))
+
+
+def draws_signature(draws: Sequence[Draw]) -> Tuple[int, int, int]:
+    """
+    Resumo barato (quantidade, primeiro e último concurso) para detectar
+    que uma lista de concursos ordenada não mudou.
+    """
+    if not draws:
+        return (0, 0, 0)
+    return (len(draws), draws[0].contest, draws[-1].contest)
+
+
+class DrawStore:
+    """
+    Concursos ordenados pelo número, sem duplicatas.
+
+    Recebe os concursos um a um conforme chegam da ingestão (em qualquer
+    ordem) e mantém a lista ordenada por inserção binária, sem reordenar
+    tudo ao final. `version` muda a cada alteração.
+    """
+
+    def __init__(self, draws: Iterable[Draw] = ()):
+        self._draws: List[Draw] = []
+        self._contests: Set[int] = set()
+        self.version = 0
+        self.extend(draws)
+
+    def add(self, draw: Draw) -> bool:
+        """Insere um concurso; retorna False se ele já existia."""
+        if draw.contest in self._contests:
+            return False
+        self._contests.add(draw.contest)
+        if not self._draws or draw.contest > self._draws[-1].contest:
+            self._draws.append(draw)
+        else:
+            bisect.insort(self._draws, draw, key=_contest_of)
+        self.version += 1
+        return True
+
+    def extend(self, draws: Iterable[Draw]) -> int:
+        """Insere vários concursos; retorna quantos eram novos."""
+        return sum(1 for draw in draws if self.add(draw))
+
+    def prune_before(self, ordinal: int) -> int:
+        """Remove os concursos anteriores à data; retorna quantos saíram."""
+        kept = [draw for draw in self._draws if draw.ordinal >= ordinal]
+        removed = len(self._draws) - len(kept)
+        if removed:
+            self._draws = kept
+            self._contests = {draw.contest for draw in kept}
+            self.version += 1
+        return removed
+
+    @property
+    def latest_contest(self) -> Optional[int]:
+        """Maior número de concurso armazenado."""
+        return self._draws[-1].contest if self._draws else None
+
+    def to_list(self) -> List[Draw]:
+        """Cópia da lista ordenada."""
+        return list(self._draws)
+
+    def __len__(self) -> int:
+        return len(self._draws)
+
+    def __iter__(self) -> Iterator[Draw]:
+        return iter(self._draws)
+
+
+def _contest_of(draw: Draw) -> int:
+    return draw.contest
+
+
+def _first(item: Dict[str, Any], fields: Iterable[str]) -> Any:
+    """Primeiro campo presente no payload."""
+    for key in fields:
+        value = item.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _extract_numbers(item: Dict[str, Any]) -> Optional[Tuple[int, ...]]:
+    """Extrai as dezenas do primeiro campo de lista encontrado."""
+    for key in NUMBER_FIELDS:
+        value = item.get(key)
+        if isinstance(value, list):
+            try:
+                return tuple(int(n) for n in value)
+            except (TypeError, ValueError):
+                return None
+    return None
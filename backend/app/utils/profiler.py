@@ -0,0 +1,253 @@
+"""
+Profiler estatístico por amostragem para workers em produção.
+Coleta pilhas de todas as threads do processo em intervalos fixos e
+exporta o resultado em formato "collapsed stacks" ou JSON do speedscope.
+"""
+
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SamplingProfiler:
+    """
+    Profiler por amostragem baseado em `sys._current_frames()`.
+
+    Uma thread daemon captura periodicamente a pilha de cada thread do
+    processo (loop de eventos, threads de ingestão etc.) e agrega as pilhas
+    idênticas. O custo fica restrito à thread de amostragem, sem
+    instrumentar o código perfilado.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        thread_ids: Optional[Iterable[int]] = None,
+        max_depth: int = 128,
+    ):
+        """
+        Inicializa o profiler.
+
+        Args:
+            interval: Intervalo entre amostras em segundos
+            thread_ids: Restringe a amostragem a estas threads (None = todas)
+            max_depth: Profundidade máxima de pilha registrada
+        """
+        self.interval = interval
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.max_depth = max_depth
+
+        self._samples: Counter = Counter()
+        self._sample_count = 0
+        self._started_at: Optional[float] = None
+        self._duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def sample_count(self) -> int:
+        """Número de amostras coletadas."""
+        return self._sample_count
+
+    @property
+    def duration(self) -> float:
+        """Duração efetiva da amostragem em segundos."""
+        if self._started_at is not None and self._thread is not None:
+            return time.perf_counter() - self._started_at
+        return self._duration
+
+    def start(self) -> "SamplingProfiler":
+        """Inicia a thread de amostragem."""
+        if self._thread is not None:
+            return self
+
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        """Interrompe a amostragem e aguarda a thread terminar."""
+        if self._thread is None:
+            return self
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._duration = time.perf_counter() - (self._started_at or 0.0)
+        self._started_at = None
+        return self
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        """Loop da thread de amostragem."""
+        own_ident = threading.get_ident()
+
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if self.thread_ids is not None and ident not in self.thread_ids:
+                    continue
+
+                stack = self._extract_stack(frame)
+                if stack:
+                    thread_name = names.get(ident, f"thread-{ident}")
+                    self._samples[(thread_name,) + stack] += 1
+
+            self._sample_count += 1
+
+    def _extract_stack(self, frame) -> Tuple[str, ...]:
+        """Converte um frame em uma tupla de funções da raiz até a folha."""
+        stack: List[str] = []
+
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+
+        stack.reverse()
+        return tuple(stack)
+
+    def collapsed(self) -> str:
+        """
+        Exporta as amostras no formato "collapsed stacks".
+
+        Cada linha contém `thread;frame1;frame2;... contagem`, formato aceito
+        por flamegraph.pl, speedscope e inferno.
+        """
+        lines = [f"{';'.join(stack)} {count}" for stack, count in sorted(self._samples.items())]
+        return "\n".join(lines)
+
+    def speedscope(self, name: str = "mega-sena worker") -> Dict:
+        """
+        Exporta as amostras no formato JSON do speedscope.
+
+        Gera um perfil "sampled" por thread, com pesos em número de amostras.
+        """
+        frames: List[Dict] = []
+        frame_index: Dict[str, int] = {}
+        profiles: Dict[str, Dict] = {}
+
+        for stack, count in sorted(self._samples.items()):
+            thread_name, frames_in_stack = stack[0], stack[1:]
+
+            indexes = []
+            for frame_name in frames_in_stack:
+                if frame_name not in frame_index:
+                    frame_index[frame_name] = len(frames)
+                    func, _, location = frame_name.partition(" (")
+                    file, _, line = location.rstrip(")").rpartition(":")
+                    frames.append({"name": func, "file": file, "line": int(line or 0)})
+                indexes.append(frame_index[frame_name])
+
+            profile = profiles.setdefault(
+                thread_name,
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append(indexes)
+            profile["weights"].append(count)
+            profile["endValue"] += count
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "mega-sena-api",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+    def export(self, fmt: str = "collapsed"):
+        """Exporta no formato solicitado ('collapsed' ou 'speedscope')."""
+        if fmt == "speedscope":
+            return self.speedscope()
+        return self.collapsed()
+
+
+class ProfileStore:
+    """Armazena os perfis mais recentes gerados por requisição."""
+
+    def __init__(self, max_profiles: int = 20):
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, SamplingProfiler]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profiler: SamplingProfiler) -> str:
+        """Guarda um perfil e retorna seu identificador."""
+        profile_id = uuid.uuid4().hex[:12]
+
+        with self._lock:
+            self._profiles[profile_id] = profiler
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[SamplingProfiler]:
+        """Obtém um perfil pelo identificador."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict]:
+        """Lista os perfis armazenados (mais recentes por último)."""
+        with self._lock:
+            return [
+                {
+                    "id": profile_id,
+                    "samples": profiler.sample_count,
+                    "duration_ms": round(profiler.duration * 1000, 2),
+                }
+                for profile_id, profiler in self._profiles.items()
+            ]
+
+
+# Garante um único profiler de worker por vez
+_worker_profile_lock = threading.Lock()
+
+# Instância global de perfis por requisição
+_profile_store: Optional[ProfileStore] = None
+
+
+def acquire_worker_profile() -> bool:
+    """Tenta reservar o profiler do worker (não bloqueante)."""
+    return _worker_profile_lock.acquire(blocking=False)
+
+
+def release_worker_profile() -> None:
+    """Libera o profiler do worker."""
+    _worker_profile_lock.release()
+
+
+def get_profile_store() -> ProfileStore:
+    """Obtém a instância global de perfis por requisição."""
+    global _profile_store
+
+    if _profile_store is None:
+        from app.config import settings
+
+        _profile_store = ProfileStore(max_profiles=settings.profiler_max_request_profiles)
+
+    return _profile_store
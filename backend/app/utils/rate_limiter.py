@@ -0,0 +1,336 @@
+"""
+Rate limiting distribuído baseado em GCRA (Generic Cell Rate Algorithm).
+Suporta Redis (estado compartilhado entre workers, em um único script
+atômico) com fallback para memória, e pré-reserva local de tokens para
+evitar uma ida ao Redis por requisição. Nas rotas async, a ida ao Redis
+roda fora do event loop.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+
+from app.exceptions import RateLimitExceededError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Reserva até ARGV[3] tokens de uma vez. Retorna {concedidos, retry_after_ms}.
+GCRA_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+
+local allowed = math.floor((now + tolerance - tat) / interval) + 1
+if allowed > requested then
+    allowed = requested
+end
+
+if allowed <= 0 then
+    return {0, tat - tolerance - now}
+end
+
+local new_tat = tat + allowed * interval
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {allowed, 0}
+"""
+
+
+class RateLimit:
+    """Limite de requisições por minuto com rajada igual ao limite."""
+
+    def __init__(self, name: str, per_minute: int):
+        self.name = name
+        self.per_minute = max(1, per_minute)
+        # Intervalo de emissão (ms) e tolerância de rajada (ms)
+        self.interval_ms = 60_000 / self.per_minute
+        self.tolerance_ms = self.interval_ms * (self.per_minute - 1)
+
+    def __repr__(self) -> str:
+        return f"RateLimit({self.name!r}, {self.per_minute}/minute)"
+
+
+class RateLimitBackend(ABC):
+    """Interface para armazenamento do estado GCRA."""
+
+    # Backends com I/O de rede são chamados fora do event loop
+    blocking = False
+
+    @abstractmethod
+    def reserve(self, key: str, limit: RateLimit, tokens: int) -> Tuple[int, float]:
+        """
+        Reserva até `tokens` tokens.
+
+        Returns:
+            Tupla (tokens concedidos, segundos até o próximo token)
+        """
+        pass
+
+    def reset(self) -> None:
+        """Remove o estado local, se houver."""
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """GCRA em memória (estado por processo)."""
+
+    def __init__(self):
+        self._tat: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, limit: RateLimit, tokens: int) -> Tuple[int, float]:
+        now = time.monotonic() * 1000
+
+        with self._lock:
+            tat = max(self._tat.get(key, now), now)
+            allowed = min(
+                tokens, math.floor((now + limit.tolerance_ms - tat) / limit.interval_ms) + 1
+            )
+
+            if allowed <= 0:
+                return 0, (tat - limit.tolerance_ms - now) / 1000
+
+            self._tat[key] = tat + allowed * limit.interval_ms
+
+            # Limpeza ocasional de chaves cujo estado já expirou
+            if len(self._tat) > 10_000:
+                self._tat = {k: v for k, v in self._tat.items() if v > now}
+
+            return allowed, 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tat.clear()
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """GCRA no Redis, executado em um único script Lua atômico."""
+
+    blocking = True
+
+    def __init__(self, redis_url: str, prefix: str = "ratelimit"):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("Redis package not installed. Install with: pip install redis")
+
+        self.prefix = prefix
+        self._redis = redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        self._script = self._redis.register_script(GCRA_SCRIPT)
+
+    def reserve(self, key: str, limit: RateLimit, tokens: int) -> Tuple[int, float]:
+        allowed, retry_after_ms = self._script(
+            keys=[f"{self.prefix}:{key}"], args=[limit.interval_ms, limit.tolerance_ms, tokens]
+        )
+        return int(allowed), max(0.0, float(retry_after_ms)) / 1000
+
+
+class RateLimiter:
+    """
+    Rate limiter com pré-reserva local de tokens.
+
+    Cada worker reserva no backend compartilhado os tokens que o limite
+    repõe durante `lease_seconds` (até `prefetch`) e os consome localmente
+    nesse período. Tokens não usados expiram, o que pode reduzir levemente
+    a vazão, mas nunca permite ultrapassar o limite global.
+
+    Se o backend falhar, o estado em memória é usado por `cooldown_seconds`
+    antes de uma nova tentativa, para que as requisições não esperem o
+    timeout do backend uma a uma.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        prefetch: int = 5,
+        lease_seconds: float = 5.0,
+        fallback: Optional[RateLimitBackend] = None,
+        cooldown_seconds: float = 30.0,
+    ):
+        self.backend = backend
+        self.prefetch = max(1, prefetch)
+        self.lease_seconds = lease_seconds
+        self.fallback = fallback or MemoryRateLimitBackend()
+        self.cooldown_seconds = cooldown_seconds
+
+        # (chave) -> [tokens locais, expiração]
+        self._local: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._backend_down_until = 0.0
+
+    def _batch_size(self, limit: RateLimit) -> int:
+        """Tokens repostos pelo limite durante a reserva (limites apertados reservam 1 por vez)."""
+        refilled = math.floor(limit.per_minute * self.lease_seconds / 60)
+        return max(1, min(self.prefetch, refilled))
+
+    def _take_local(self, key: str, now: float) -> bool:
+        with self._lock:
+            local = self._local.get(key)
+            if local is not None and local[0] > 0 and local[1] > now:
+                local[0] -= 1
+                return True
+        return False
+
+    def _use_backend(self) -> bool:
+        return time.monotonic() >= self._backend_down_until
+
+    def _backend_failed(self, error: Exception) -> None:
+        self._backend_down_until = time.monotonic() + self.cooldown_seconds
+        logger.warning(
+            f"Rate limit backend unavailable, using local state for {self.cooldown_seconds:.0f}s: {error}"
+        )
+
+    def _settle(
+        self, key: str, limit: RateLimit, granted: int, retry_after: float, now: float
+    ) -> None:
+        if granted <= 0:
+            raise RateLimitExceededError(
+                f"Limite de {limit.per_minute} requisições por minuto excedido",
+                retry_after=max(1, math.ceil(retry_after)),
+            )
+
+        with self._lock:
+            if granted > 1:
+                self._local[key] = [granted - 1, now + self.lease_seconds]
+            else:
+                self._local.pop(key, None)
+
+            if len(self._local) > 10_000:
+                self._local = {k: v for k, v in self._local.items() if v[1] > now}
+
+    def _reserve(self, key: str, limit: RateLimit) -> Tuple[int, float]:
+        """Reserva um lote no backend ou, durante o cooldown, na memória."""
+        batch = self._batch_size(limit)
+        if self._use_backend():
+            try:
+                return self.backend.reserve(key, limit, batch)
+            except Exception as e:
+                self._backend_failed(e)
+        return self.fallback.reserve(key, limit, batch)
+
+    def hit(self, limit: RateLimit, identity: str) -> None:
+        """
+        Consome um token para a identidade no limite informado.
+
+        Raises:
+            RateLimitExceededError: Se o limite foi excedido
+        """
+        key = f"{limit.name}:{identity}"
+        now = time.monotonic()
+        if self._take_local(key, now):
+            return
+
+        granted, retry_after = self._reserve(key, limit)
+        self._settle(key, limit, granted, retry_after, now)
+
+    async def ahit(self, limit: RateLimit, identity: str) -> None:
+        """Como `hit`, sem bloquear o event loop na ida ao backend."""
+        key = f"{limit.name}:{identity}"
+        now = time.monotonic()
+        if self._take_local(key, now):
+            return
+
+        if self.backend.blocking and self._use_backend():
+            granted, retry_after = await asyncio.to_thread(self._reserve, key, limit)
+        else:
+            granted, retry_after = self._reserve(key, limit)
+        self._settle(key, limit, granted, retry_after, now)
+
+    def reset(self) -> None:
+        """Limpa os tokens locais e o estado em memória."""
+        with self._lock:
+            self._local.clear()
+        self._backend_down_until = 0.0
+        self.backend.reset()
+        self.fallback.reset()
+
+
+# Instância global do rate limiter
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Obtém a instância global do rate limiter."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        from app.config import settings
+
+        storage = settings.rate_limit_storage
+        if storage == "auto":
+            storage = "redis" if settings.cache_type == "redis" else "memory"
+
+        backend: RateLimitBackend
+        if storage == "redis":
+            try:
+                backend = RedisRateLimitBackend(settings.redis_url)
+                logger.info("Using Redis rate limiting")
+            except ImportError as e:
+                logger.warning(f"{e}; falling back to memory rate limiting")
+                backend = MemoryRateLimitBackend()
+        else:
+            backend = MemoryRateLimitBackend()
+            logger.info("Using memory rate limiting")
+
+        _rate_limiter = RateLimiter(
+            backend,
+            prefetch=settings.rate_limit_prefetch,
+            lease_seconds=settings.rate_limit_lease_seconds,
+            cooldown_seconds=settings.rate_limit_backend_cooldown,
+        )
+
+    return _rate_limiter
+
+
+def get_client_identity(request: Request) -> str:
+    """Identifica o cliente pelo endereço remoto."""
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(
+    name: str, per_minute: Callable[[], int], uncached: Optional[Callable[[Request], bool]] = None
+):
+    """
+    Cria uma dependência FastAPI que aplica o limite da rota.
+
+    Args:
+        name: Nome do limite (compõe a chave no backend)
+        per_minute: Função que retorna o limite da rota (lida das configurações)
+        uncached: Função que indica se a requisição vai cair no caminho sem
+            cache; nesse caso aplica o limite `rate_limit_uncached_per_minute`.
+            Pode consultar o cache (Redis), então roda fora do event loop
+
+    Example:
+        @router.get("/estimate", dependencies=[Depends(rate_limit("estimate", ...))])
+    """
+
+    async def dependency(request: Request):
+        from app.config import settings
+
+        if not settings.rate_limit_enabled:
+            return
+
+        limiter = get_rate_limiter()
+        identity = get_client_identity(request)
+
+        await limiter.ahit(RateLimit(name, per_minute()), identity)
+
+        if uncached is not None and await asyncio.to_thread(uncached, request):
+            await limiter.ahit(
+                RateLimit(f"{name}:uncached", settings.rate_limit_uncached_per_minute), identity
+            )
+
+    return dependency
@@ -0,0 +1,73 @@
+"""
+Publicação do dataset pré-carregado em memória compartilhada.
+O launcher carrega os concursos uma única vez e a primeira geração de
+workers lê o mesmo segmento (somente leitura) em vez de cada um buscar a
+API externa.
+"""
+
+import os
+import pickle
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Variável de ambiente com o nome do segmento, herdada pelos workers
+SHARED_DATASET_ENV = "MEGA_SENA_SHARED_DATASET"
+
+# Cabeçalho: tamanho do payload (o segmento pode ser maior que o pedido)
+_HEADER = struct.Struct("<Q")
+
+
+def publish_dataset(dataset: Dict[str, Any]) -> shared_memory.SharedMemory:
+    """
+    Grava o dataset em um novo segmento de memória compartilhada e
+    exporta seu nome na variável de ambiente para os workers.
+
+    Args:
+        dataset: Dicionário serializável (dados processados, estimativa, ...)
+
+    Returns:
+        Segmento criado; o chamador deve fechá-lo e removê-lo (`unlink`)
+    """
+    payload = pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL)
+    segment = shared_memory.SharedMemory(create=True, size=_HEADER.size + len(payload))
+    _HEADER.pack_into(segment.buf, 0, len(payload))
+    segment.buf[_HEADER.size : _HEADER.size + len(payload)] = payload
+
+    os.environ[SHARED_DATASET_ENV] = segment.name
+    logger.info(f"Shared dataset published: {segment.name} ({len(payload)} bytes)")
+    return segment
+
+
+def read_shared_dataset(name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Lê o dataset publicado pelo launcher, se houver.
+
+    Args:
+        name: Nome do segmento (padrão: variável de ambiente)
+
+    Returns:
+        Dataset ou None se não houver segmento publicado
+    """
+    name = name or os.environ.get(SHARED_DATASET_ENV)
+    if not name:
+        return None
+
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        logger.warning(f"Shared dataset not found: {name}")
+        return None
+
+    # Os workers são criados pelo launcher e compartilham seu resource
+    # tracker, então apenas o launcher remove o segmento ao encerrar
+    try:
+        (size,) = _HEADER.unpack_from(segment.buf, 0)
+        dataset: Dict[str, Any] = pickle.loads(segment.buf[_HEADER.size : _HEADER.size + size])
+        return dataset
+    finally:
+        segment.close()
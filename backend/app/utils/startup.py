@@ -0,0 +1,132 @@
+"""
+Rastreamento do estado de inicialização e aquecimento do worker.
+Alimenta o endpoint de readiness e as métricas de warmup.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class StartupPhase:
+    """Fases de inicialização do worker."""
+
+    STARTING = "starting"  # Processo importado, lifespan ainda não executou
+    CONNECTING = "connecting"  # Conectando cache e pool HTTP
+    WARMING = "warming"  # Carregando concursos e artefatos derivados
+    READY = "ready"  # Pronto para receber tráfego
+    DEGRADED = "degraded"  # Warmup falhou; nova tentativa agendada
+
+
+class StartupState:
+    """
+    Estado de inicialização de um worker.
+
+    Registra a fase atual, a duração de cada etapa, a quantidade de
+    concursos carregados e os artefatos derivados já construídos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Volta ao estado inicial."""
+        with self._lock:
+            self.phase = StartupPhase.STARTING
+            self.draws_loaded = 0
+            self.artifacts: Dict[str, Dict[str, Any]] = {}
+            self.steps: Dict[str, Dict[str, Any]] = {}
+            self.attempts = 0
+            self.last_error: Optional[str] = None
+            self.ready_at: Optional[str] = None
+            self._created = time.perf_counter()
+            self._running: Dict[str, float] = {}
+
+    def set_phase(self, phase: str) -> None:
+        """Altera a fase atual."""
+        with self._lock:
+            self.phase = phase
+            if phase == StartupPhase.READY:
+                self.ready_at = datetime.now().isoformat()
+                self.last_error = None
+        logger.info(f"Startup phase: {phase}")
+
+    def begin_attempt(self) -> int:
+        """Inicia uma nova tentativa de warmup e retorna seu número."""
+        with self._lock:
+            self.attempts += 1
+            return self.attempts
+
+    def begin(self, step: str) -> None:
+        """Marca o início de uma etapa."""
+        with self._lock:
+            self._running[step] = time.perf_counter()
+
+    def end(self, step: str, **details: Any) -> None:
+        """Marca o fim de uma etapa bem-sucedida."""
+        with self._lock:
+            started = self._running.pop(step, time.perf_counter())
+            self.steps[step] = {
+                "status": "ok",
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                **details,
+            }
+
+    def fail(self, step: str, error: Exception) -> None:
+        """Marca a falha de uma etapa."""
+        with self._lock:
+            started = self._running.pop(step, time.perf_counter())
+            self.steps[step] = {
+                "status": "error",
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "error": str(error),
+            }
+            self.last_error = f"{step}: {error}"
+
+    def set_draws_loaded(self, count: int) -> None:
+        """Registra a quantidade de concursos carregados."""
+        with self._lock:
+            self.draws_loaded = count
+
+    def mark_artifact(self, name: str, **details: Any) -> None:
+        """Registra um artefato derivado construído."""
+        with self._lock:
+            self.artifacts[name] = {"built_at": datetime.now().isoformat(), **details}
+
+    def is_ready(self) -> bool:
+        """Indica se o worker está pronto para receber tráfego."""
+        return self.phase == StartupPhase.READY
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável do estado."""
+        with self._lock:
+            return {
+                "phase": self.phase,
+                "ready": self.phase == StartupPhase.READY,
+                "draws_loaded": self.draws_loaded,
+                "artifacts": dict(self.artifacts),
+                "steps": dict(self.steps),
+                "warmup_attempts": self.attempts,
+                "last_error": self.last_error,
+                "ready_at": self.ready_at,
+                "uptime_s": round(time.perf_counter() - self._created, 2),
+            }
+
+
+# Instância global do estado de inicialização
+_startup_state: Optional[StartupState] = None
+
+
+def get_startup_state() -> StartupState:
+    """Obtém a instância global do estado de inicialização."""
+    global _startup_state
+
+    if _startup_state is None:
+        _startup_state = StartupState()
+
+    return _startup_state
@@ -0,0 +1,132 @@
+"""
+Benchmarks das análises (vetorizado x laços em Python puro).
+"""
+
+from itertools import combinations
+
+from app.analytics.backtest import backtest
+from app.analytics.bitmask import MaskIndex
+from app.analytics.features import FeatureTable, distributions
+from app.analytics.tickets import TicketBatchChecker
+from app.analytics.cooccurrence import CooccurrenceIndex, pair_matrix, triple_counts
+from app.utils.data_processor import calculate_frequencies, generate_estimates, normalize_data
+from app.utils.draw import numbers_to_mask
+
+# Aposta de 15 dezenas (o máximo permitido)
+TICKET = [2, 5, 11, 17, 23, 28, 31, 36, 40, 42, 47, 50, 53, 57, 60]
+
+
+def naive_counts(draws):
+    """Referência: pares e trincas com laços aninhados em Python puro."""
+    pairs = {}
+    triples = {}
+    for draw in draws:
+        for combo in combinations(draw.numbers, 2):
+            pairs[combo] = pairs.get(combo, 0) + 1
+        for combo in combinations(draw.numbers, 3):
+            triples[combo] = triples.get(combo, 0) + 1
+    return pairs, triples
+
+
+class BenchCooccurrence:
+    """Pares e trincas sobre o histórico."""
+
+    def bench_naive_counts(self, benchmark, raw_draws, rounds):
+        draws = normalize_data(raw_draws)
+        pairs, _ = benchmark.pedantic(naive_counts, args=(draws,), rounds=rounds)
+        assert sum(pairs.values()) == 15 * len(draws)
+
+    def bench_vectorized_counts(self, benchmark, raw_draws, rounds):
+        draws = normalize_data(raw_draws)
+        pairs, _ = benchmark.pedantic(
+            lambda: (pair_matrix(draws), triple_counts(draws)), rounds=rounds
+        )
+        assert int(pairs.trace()) == 6 * len(draws)
+
+    def bench_incremental_sync(self, benchmark, raw_draws, rounds):
+        """Custo de incorporar um concurso novo a um índice já montado."""
+        draws = sorted(normalize_data(raw_draws), key=lambda draw: draw.contest)
+
+        def setup():
+            index = CooccurrenceIndex()
+            index.sync(draws[:-1])
+            return (index,), {}
+
+        result = benchmark.pedantic(lambda index: index.sync(draws), setup=setup, rounds=rounds)
+        assert result == (1, 0)
+
+
+def naive_backtest(draws, window):
+    """Referência: recalcula a estimativa da janela a cada concurso (O(n·w))."""
+    hits = 0
+    for t in range(window, len(draws)):
+        estimate = generate_estimates(calculate_frequencies(draws[t - window : t]))["sorte"]
+        hits += len(set(estimate) & set(draws[t].numbers))
+    return hits
+
+
+class BenchBacktest:
+    """Backtest walk-forward da estimativa."""
+
+    def bench_naive_backtest(self, benchmark, raw_draws, rounds):
+        draws = sorted(normalize_data(raw_draws), key=lambda draw: draw.contest)
+        benchmark.pedantic(naive_backtest, args=(draws, 100), rounds=rounds)
+
+    def bench_vectorized_backtest(self, benchmark, raw_draws, rounds):
+        """Quatro janelas, incluindo todo o histórico anterior."""
+        draws = sorted(normalize_data(raw_draws), key=lambda draw: draw.contest)
+        result = benchmark.pedantic(backtest, args=(draws, [50, 100, 200, 0]), rounds=rounds)
+        assert result[-1]["tested"] == len(draws) - 1
+
+
+class BenchTicketCheck:
+    """Conferência de uma aposta contra todo o histórico."""
+
+    def bench_naive_check(self, benchmark, raw_draws, rounds):
+        draws = normalize_data(raw_draws)
+        ticket = set(TICKET)
+        hits = benchmark.pedantic(
+            lambda: [len(ticket.intersection(draw.numbers)) for draw in draws], rounds=rounds
+        )
+        assert len(hits) == len(draws)
+
+    def bench_bitmask_check(self, benchmark, raw_draws, rounds):
+        index = MaskIndex()
+        index.sync(normalize_data(raw_draws))
+        mask = numbers_to_mask(TICKET)
+        _, hits = benchmark.pedantic(index.hits, args=(mask,), rounds=rounds)
+        assert len(hits) == len(index)
+
+    def bench_batch_check(self, benchmark, raw_draws, rounds):
+        """Um lote de 1.000 apostas (CSV) contra todos os concursos."""
+        index = MaskIndex()
+        index.sync(normalize_data(raw_draws))
+        checker = TicketBatchChecker(*index.snapshot())
+        lines = [(i, ",".join(str((i + k * 7) % 60 + 1) for k in range(6))) for i in range(1000)]
+        results = benchmark.pedantic(checker.check, args=(lines,), rounds=rounds)
+        assert len(results) == 1000
+
+
+class BenchFeatures:
+    """Histogramas de atributos (soma, ímpares, décadas...) do histórico inteiro."""
+
+    def bench_naive_features(self, benchmark, raw_draws, rounds):
+        draws = normalize_data(raw_draws)
+
+        def run():
+            sums, odd = {}, {}
+            for draw in draws:
+                total = sum(draw.numbers)
+                sums[total // 10] = sums.get(total // 10, 0) + 1
+                count = sum(1 for n in draw.numbers if n % 2)
+                odd[count] = odd.get(count, 0) + 1
+            return sums, odd
+
+        sums, _ = benchmark.pedantic(run, rounds=rounds)
+        assert sum(sums.values()) == len(draws)
+
+    def bench_table_features(self, benchmark, raw_draws, rounds):
+        table = FeatureTable()
+        table.sync(normalize_data(raw_draws))
+        result = benchmark.pedantic(lambda: distributions(table.window(), 6, 10), rounds=rounds)
+        assert sum(result["odd"].values()) == len(table)
@@ -0,0 +1,80 @@
+"""
+Benchmarks dos backends de cache com payloads realistas.
+"""
+
+import pytest
+
+from app.utils.cache import MemoryCache, RedisCache
+from app.utils.data_processor import normalize_data, filter_last_two_years
+
+
+@pytest.fixture
+def payload(raw_draws):
+    """Payload equivalente a `mega_sena:processed_data`."""
+    return filter_last_two_years(normalize_data(raw_draws))
+
+
+@pytest.fixture
+def redis_cache(request, monkeypatch):
+    """RedisCache apontando para fakeredis ou para um redis-server local."""
+    redis_url = request.config.getoption("--redis-url")
+
+    if redis_url is None:
+        fakeredis = pytest.importorskip("fakeredis")
+        import redis
+
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)
+        )
+        redis_url = "redis://fakeredis"
+
+    cache = RedisCache(redis_url)
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    """Backend de cache parametrizado."""
+    if request.param == "memory":
+        return MemoryCache()
+    return request.getfixturevalue("redis_cache")
+
+
+class BenchCache:
+    """Benchmarks de get/set dos backends de cache."""
+
+    def bench_set_processed_data(self, benchmark, cache, payload, rounds):
+        result = benchmark.pedantic(
+            cache.set, args=("mega_sena:processed_data", payload, 3600), rounds=rounds
+        )
+        assert result is True
+
+    def bench_get_processed_data(self, benchmark, cache, payload, rounds):
+        cache.set("mega_sena:processed_data", payload, 3600)
+        result = benchmark.pedantic(cache.get, args=("mega_sena:processed_data",), rounds=rounds)
+        assert len(result) == len(payload)
+
+    def bench_get_estimate(self, benchmark, cache, scale):
+        estimate = {
+            "data": "2024-01-15",
+            "quadra": [5, 12, 23, 45],
+            "quina": [5, 12, 23, 45, 58],
+            "sorte": [5, 12, 23, 45, 58, 60],
+        }
+        cache.set("mega_sena:estimate", estimate, 1800)
+        result = benchmark(cache.get, "mega_sena:estimate")
+        assert result == estimate
+
+    @pytest.mark.parametrize("mode", ["per_key", "bulk"])
+    def bench_draw_lookups(self, benchmark, cache, mode):
+        """180 chaves `mega_sena:draw:*`: uma ida por chave vs. um MGET."""
+        keys = [f"mega_sena:draw:{i}" for i in range(180)]
+        cache.set_many({key: {"numeros": [1, 2, 3, 4, 5, 6]} for key in keys}, 3600)
+
+        if mode == "bulk":
+            result = benchmark(cache.get_many, keys)
+        else:
+            result = benchmark(lambda: {key: cache.get(key) for key in keys})
+        assert len(result) == len(keys)
@@ -0,0 +1,45 @@
+"""
+Benchmarks do overhead do CircuitBreaker.call, com e sem contenção de threads.
+"""
+
+import threading
+
+import pytest
+
+from app.utils.circuit_breaker import CircuitBreaker
+
+CALLS_PER_THREAD = 10_000
+
+
+def noop():
+    return None
+
+
+def run_contended(breaker: CircuitBreaker, threads: int) -> None:
+    """Executa CALLS_PER_THREAD chamadas em cada uma das threads."""
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(CALLS_PER_THREAD):
+            breaker.call(noop)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+class BenchCircuitBreaker:
+    """Benchmarks do circuit breaker."""
+
+    def bench_call_baseline(self, benchmark):
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+        benchmark(breaker.call, noop)
+
+    @pytest.mark.parametrize("threads", [1, 4, 10])
+    def bench_call_contention(self, benchmark, threads):
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+        benchmark.extra_info["calls"] = threads * CALLS_PER_THREAD
+        benchmark.pedantic(run_contended, args=(breaker, threads), rounds=5)
@@ -0,0 +1,47 @@
+"""
+Benchmarks das funções de processamento de dados.
+"""
+
+from app.utils.data_processor import (
+    iter_draws,
+    two_year_cutoff,
+    normalize_data,
+    filter_last_two_years,
+    calculate_frequencies,
+    generate_estimates,
+)
+from app.utils.draw import DrawStore
+
+
+class BenchDataProcessor:
+    """Benchmarks do pipeline normalize -> filter -> frequencies -> estimates."""
+
+    def bench_normalize_data(self, benchmark, raw_draws, rounds):
+        result = benchmark.pedantic(normalize_data, args=(raw_draws,), rounds=rounds)
+        assert len(result) == len(raw_draws)
+
+    def bench_filter_last_two_years(self, benchmark, raw_draws, rounds):
+        normalized = normalize_data(raw_draws)
+        result = benchmark.pedantic(filter_last_two_years, args=(normalized,), rounds=rounds)
+        assert 0 < len(result) <= len(normalized)
+
+    def bench_ingest_pipeline(self, benchmark, raw_draws, rounds):
+        """normalize + filter + inserção ordenada em uma única passada."""
+
+        def ingest():
+            store = DrawStore()
+            store.extend(iter_draws(raw_draws, cutoff=two_year_cutoff()))
+            return store
+
+        result = benchmark.pedantic(ingest, rounds=rounds)
+        assert 0 < len(result) <= len(raw_draws)
+
+    def bench_calculate_frequencies(self, benchmark, raw_draws, rounds):
+        normalized = normalize_data(raw_draws)
+        result = benchmark.pedantic(calculate_frequencies, args=(normalized,), rounds=rounds)
+        assert sum(result.values()) == 6 * len(normalized)
+
+    def bench_generate_estimates(self, benchmark, raw_draws, rounds):
+        frequencies = calculate_frequencies(normalize_data(raw_draws))
+        result = benchmark.pedantic(generate_estimates, args=(frequencies,), rounds=rounds)
+        assert len(result["sorte"]) == 6
@@ -0,0 +1,78 @@
+"""
+Fixtures compartilhadas para os benchmarks.
+Geram dados sintéticos determinísticos para rodar offline.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import pytest
+
+# Escalas: 180 (janela padrão), 2.700 (histórico completo) e 1M (sintético)
+DEFAULT_SCALES = [180, 2700]
+LARGE_SCALE = 1_000_000
+
+# Período máximo coberto pelas datas sintéticas (100 anos); acima disso,
+# vários concursos compartilham a mesma data
+MAX_SPAN_DAYS = 36_500
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-large",
+        action="store_true",
+        default=False,
+        help="Inclui a escala sintética de 1 milhão de concursos",
+    )
+    parser.addoption(
+        "--redis-url", default=None, help="Usa um redis-server local em vez do fakeredis"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = list(DEFAULT_SCALES)
+        if metafunc.config.getoption("--bench-large"):
+            scales.append(LARGE_SCALE)
+        metafunc.parametrize("scale", scales, ids=[f"{s}draws" for s in scales])
+
+
+def make_raw_draws(count: int, seed: int = 42) -> List[Dict]:
+    """Gera concursos no formato da API da Caixa."""
+    rng = random.Random(seed)
+    today = datetime.now()
+    population = range(1, 61)
+
+    # Três sorteios por semana, do mais recente para o mais antigo
+    span = min(count * 7 // 3, MAX_SPAN_DAYS)
+
+    draws = []
+    for i in range(count):
+        draw_date = today - timedelta(days=i * span // count)
+        draws.append(
+            {
+                "numero": count - i,
+                "dataApuracao": draw_date.strftime("%d/%m/%Y"),
+                "dezenas": [f"{n:02d}" for n in sorted(rng.sample(population, 6))],
+            }
+        )
+
+    return draws
+
+
+_raw_cache: Dict[int, List[Dict]] = {}
+
+
+@pytest.fixture
+def raw_draws(scale) -> List[Dict]:
+    """Concursos brutos na escala solicitada (memoizados entre benchmarks)."""
+    if scale not in _raw_cache:
+        _raw_cache[scale] = make_raw_draws(scale)
+    return _raw_cache[scale]
+
+
+@pytest.fixture
+def rounds(scale) -> int:
+    """Número de rodadas compatível com a escala."""
+    return 3 if scale >= LARGE_SCALE else 20
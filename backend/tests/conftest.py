@@ -2,13 +2,18 @@
 Fixtures compartilhadas para testes.
 """
 
+import random
+
 import pytest
 from fastapi.testclient import TestClient
-from datetime import datetime
-from typing import List, Dict
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List
 
+from app.config import settings
 from app.main import app
 from app.services.mega_sena_service import MegaSenaService
+from app.utils.draw import Draw
+from app.utils.rate_limiter import get_rate_limiter
 
 
 @pytest.fixture
@@ -40,27 +45,40 @@ def mock_draw_data() -> List[Dict]:
 
 
 @pytest.fixture
-def mock_normalized_data() -> List[Dict]:
+def mock_normalized_data() -> List[Draw]:
     """Dados normalizados mockados."""
     return [
-        {
-            "data": "15/01/2024",
-            "numero_concurso": "2650",
-            "numeros": [5, 12, 23, 45, 58, 60]
-        },
-        {
-            "data": "13/01/2024",
-            "numero_concurso": "2649",
-            "numeros": [3, 12, 23, 35, 45, 58]
-        },
-        {
-            "data": "10/01/2024",
-            "numero_concurso": "2648",
-            "numeros": [5, 10, 23, 30, 45, 58]
-        }
+        Draw(2650, date(2024, 1, 15).toordinal(), (5, 12, 23, 45, 58, 60)),
+        Draw(2649, date(2024, 1, 13).toordinal(), (3, 12, 23, 35, 45, 58)),
+        Draw(2648, date(2024, 1, 10).toordinal(), (5, 10, 23, 30, 45, 58))
     ]
 
 
+@pytest.fixture
+def make_draw() -> Callable[..., Draw]:
+    """Cria um concurso com as dezenas dadas em um dia de janeiro de 2024."""
+    def _make(contest: int, numbers: Iterable[int], day: int = 1) -> Draw:
+        return Draw(contest, date(2024, 1, day).toordinal(), tuple(sorted(numbers)))
+    return _make
+
+
+@pytest.fixture
+def random_draws() -> Callable[..., List[Draw]]:
+    """
+    Gera concursos aleatórios (1..count) a partir de 2022, com 3 ou 4 dias
+    entre sorteios, como no calendário da Mega-Sena.
+    """
+    def _generate(count: int, seed: int = 7) -> List[Draw]:
+        rng = random.Random(seed)
+        ordinal = date(2022, 1, 1).toordinal()
+        draws = []
+        for contest in range(1, count + 1):
+            ordinal += rng.choice((3, 4))
+            draws.append(Draw(contest, ordinal, tuple(sorted(rng.sample(range(1, 61), 6)))))
+        return draws
+    return _generate
+
+
 @pytest.fixture
 def mock_frequencies() -> Dict[int, int]:
     """Frequências mockadas."""
@@ -97,9 +115,22 @@ def service():
     return MegaSenaService()
 
 
+@pytest.fixture(autouse=True)
+def no_rewarm_on_clear(monkeypatch):
+    """Os testes não devem acessar a API externa ao limpar o cache."""
+    monkeypatch.setattr(settings, "cache_rewarm_on_clear", False)
+
+
 @pytest.fixture(autouse=True)
 def clear_cache(service):
     """Limpa o cache antes de cada teste."""
     service.clear_cache()
     yield
     service.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Zera o estado do rate limiter entre os testes."""
+    get_rate_limiter().reset()
+    yield
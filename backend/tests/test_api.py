@@ -2,9 +2,14 @@
 Testes de integração para endpoints da API.
 """
 
+import json
+
 import pytest
+from datetime import date
 from fastapi import status
 
+from app.utils.draw import Draw
+
 
 class TestHealthEndpoint:
     """Testes para o endpoint /api/health."""
@@ -134,11 +139,7 @@ class TestDrawEndpoint:
     
     def test_get_draw_success(self, client, mocker):
         """Testa busca de concurso com sucesso."""
-        mock_draw = {
-            "data": "15/01/2024",
-            "numero_concurso": "2650",
-            "numeros": [5, 12, 23, 45, 58, 60]
-        }
+        mock_draw = Draw(2650, date(2024, 1, 15).toordinal(), (5, 12, 23, 45, 58, 60))
         
         mocker.patch(
             'app.routes.api.service.get_draw_by_date',
@@ -155,6 +156,177 @@ class TestDrawEndpoint:
         assert len(data["numeros"]) == 6
 
 
+class TestDrawBatchEndpoint:
+    """Testes para o endpoint /api/draws."""
+    
+    def test_get_draws_by_dates(self, client, mocker, mock_normalized_data):
+        """Testa busca de vários concursos, incluindo datas sem concurso."""
+        mocker.patch(
+            'app.routes.api.service.get_processed_data',
+            return_value=mock_normalized_data
+        )
+        
+        response = client.get("/api/draws?dates=2024-01-15,2024-01-10,2024-01-14")
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        assert [draw["numero_concurso"] for draw in data["draws"]] == ["2650", "2648"]
+        assert data["not_found"] == ["2024-01-14"]
+    
+    def test_cached_draws_skip_service(self, client, mocker, service):
+        """Testa que datas em cache são servidas pela leitura em lote."""
+        service.cache.set_many({
+            "mega_sena:draw:2024-01-15": Draw(
+                2650, date(2024, 1, 15).toordinal(), (5, 12, 23, 45, 58, 60)
+            )
+        })
+        lookup = mocker.patch('app.routes.api.service.get_draws_by_dates')
+        
+        response = client.get("/api/draws?dates=2024-01-15")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["draws"][0]["numero_concurso"] == "2650"
+        lookup.assert_not_called()
+    
+    def test_rate_limit_probes_cache_once(self, client, mocker, service):
+        """Testa que o limite sem cache não consulta o cache data a data."""
+        exists = mocker.spy(service.cache.__class__, "exists")
+        mocker.patch('app.routes.api.service.get_draws_by_dates', return_value={})
+        dates = ",".join(f"2024-01-{day:02d}" for day in range(1, 21))
+        
+        response = client.get(f"/api/draws?dates={dates}")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert exists.call_count == 1
+    
+    def test_get_draws_invalid_date(self, client):
+        """Testa rejeição de datas inválidas."""
+        response = client.get("/api/draws?dates=2024-01-15,15/01/2024")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_get_draws_too_many_dates(self, client):
+        """Testa o limite de datas por consulta."""
+        dates = ",".join(f"2024-01-{day:02d}" for day in range(1, 31))
+        dates += "," + ",".join(f"2024-02-{day:02d}" for day in range(1, 29))
+        
+        response = client.get(f"/api/draws?dates={dates}")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestCheckEndpoint:
+    """Testes para o endpoint /api/check."""
+    
+    def test_check_ticket(self, client, mocker, mock_normalized_data):
+        """Testa a conferência de uma aposta de 7 dezenas."""
+        mocker.patch(
+            'app.routes.api.service.get_processed_data',
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest)
+        )
+        
+        response = client.get("/api/check?numbers=5,12,23,45,58,60,3")
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        assert data["ticket"] == [3, 5, 12, 23, 45, 58, 60]
+        assert data["draws"] == 3
+        assert data["hits"] == {"0": 0, "1": 0, "2": 0, "3": 0, "4": 1, "5": 1, "6": 1}
+        assert [draw["numero_concurso"] for draw in data["sena"]] == ["2650"]
+        assert [draw["numero_concurso"] for draw in data["quina"]] == ["2649"]
+        assert [draw["numero_concurso"] for draw in data["quadra"]] == ["2648"]
+    
+    @pytest.mark.parametrize("numbers", [
+        "1,2,3,4,5",
+        "1,2,3,4,5,61",
+        "1,1,2,3,4,5",
+        "1,2,3,4,5,x",
+        ",".join(str(n) for n in range(1, 17))
+    ])
+    def test_check_invalid_ticket(self, client, numbers):
+        """Testa a validação das dezenas da aposta."""
+        response = client.get(f"/api/check?numbers={numbers}")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error_code"] == "INVALID_TICKET"
+
+
+class TestCheckBulkEndpoint:
+    """Testes para o endpoint /api/check/bulk."""
+    
+    @pytest.fixture(autouse=True)
+    def processed_data(self, mocker, mock_normalized_data):
+        mocker.patch(
+            'app.routes.api.service.get_processed_data',
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest)
+        )
+    
+    def _lines(self, response):
+        return [json.loads(line) for line in response.text.splitlines()]
+    
+    def test_csv_upload_in_chunks(self, client, mocker):
+        """Testa o upload CSV em pedaços, com lotes menores que o upload."""
+        mocker.patch('app.routes.api.settings.bulk_check_batch_size', 2)
+        
+        def body():
+            yield b"joao,5,12,23,45,58,60\n3,5,12,"
+            yield b"23,45,58,60\n1,2,3\n\n1,2,3,4,5,6"
+        
+        response = client.post(
+            "/api/check/bulk?start=2648",
+            content=body(),
+            headers={"content-type": "text/csv"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        lines = self._lines(response)
+        assert [line.get("line") for line in lines[:-1]] == [1, 2, 3, 5]
+        assert lines[0]["id"] == "joao"
+        assert lines[0]["best"] == 6
+        assert [prize["tier"] for prize in lines[1]["prizes"]] == ["quadra", "quina", "sena"]
+        assert "error" in lines[2]
+        assert lines[3]["prizes"] == []
+        assert lines[-1]["summary"] == {
+            "tickets": 3, "invalid": 1, "contests": 3,
+            "quadra": 3, "quina": 1, "sena": 2, "truncated": False
+        }
+    
+    def test_ndjson_upload_latest_contest(self, client):
+        """Testa o upload NDJSON conferido contra o concurso mais recente."""
+        body = b'{"id": "a", "numbers": [5, 12, 23, 45, 58, 60]}\n[3, 12, 23, 35, 45, 58]\n'
+        
+        response = client.post(
+            "/api/check/bulk",
+            content=body,
+            headers={"content-type": "application/x-ndjson"}
+        )
+        
+        lines = self._lines(response)
+        assert lines[0]["prizes"] == [{"contest": 2650, "hits": 6, "tier": "sena"}]
+        assert lines[1]["best"] == 4
+        assert lines[-1]["summary"]["contests"] == 1
+    
+    def test_limits(self, client, mocker):
+        """Testa o limite de apostas e de tamanho de linha."""
+        mocker.patch('app.routes.api.settings.bulk_check_max_tickets', 2)
+        body = b"9" * 5000 + b"\n1,2,3,4,5,6\n1,2,3,4,5,6\n"
+        
+        response = client.post("/api/check/bulk", content=body)
+        
+        lines = self._lines(response)
+        assert lines[0] == {"line": 1, "error": "Linha muito longa"}
+        assert lines[-1]["summary"]["truncated"] is True
+        assert len(lines) == 3
+    
+    def test_unknown_contest(self, client):
+        """Testa um concurso fora do histórico."""
+        response = client.post("/api/check/bulk?contest=1", content=b"1,2,3,4,5,6\n")
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestStatsEndpoint:
     """Testes para o endpoint /api/stats."""
     
@@ -182,6 +354,18 @@ class TestCacheClearEndpoint:
         
         assert "message" in data
         assert "timestamp" in data
+    
+    def test_clear_cache_by_prefix(self, client, service):
+        """Testa a limpeza seletiva por prefixo."""
+        service.cache.set("mega_sena:draw:2024-01-15", {"numero_concurso": "2650"})
+        service.cache.set("mega_sena:estimate", {"sorte": [1, 2, 3, 4, 5, 6]})
+        
+        response = client.post("/api/cache/clear?prefix=draw:")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["prefix"] == "draw:"
+        assert service.cache.get("mega_sena:draw:2024-01-15") is None
+        assert service.cache.get("mega_sena:estimate") is not None
 
 
 class TestMiddleware:
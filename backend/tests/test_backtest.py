@@ -0,0 +1,68 @@
+"""
+Testes do backtest das estratégias de estimativa.
+"""
+
+import numpy as np
+from fastapi import status
+
+from app.analytics.backtest import backtest
+from app.analytics.bitmask import masks_from_indices, popcount
+from app.utils.data_processor import calculate_frequencies, generate_estimates
+
+
+class TestBacktest:
+    """Testes do backtest walk-forward."""
+
+    def test_matches_naive_walk_forward(self, random_draws):
+        """Testa que o backtest equivale a recalcular a estimativa a cada concurso."""
+        draws = random_draws(120)
+
+        for window, result in zip((10, 0), backtest(draws, [10, 0])):
+            start = window or 1
+            expected = {str(k): 0 for k in range(7)}
+            for t in range(start, len(draws)):
+                history = draws[t - window : t] if window else draws[:t]
+                estimate = generate_estimates(calculate_frequencies(history))["sorte"]
+                expected[str(len(set(estimate) & set(draws[t].numbers)))] += 1
+
+            assert result["hits"] == expected
+            assert result["tested"] == len(draws) - start
+            assert result["first_contest"] == draws[start].contest
+
+    def test_window_larger_than_history(self, random_draws):
+        """Testa uma janela maior que o histórico disponível."""
+        result = backtest(random_draws(5), [10])[0]
+
+        assert result["tested"] == 0
+        assert result["first_contest"] is None
+
+    def test_popcount(self):
+        """Testa a contagem de acertos por máscara."""
+        masks = masks_from_indices(np.array([[0, 1, 2, 3, 4, 5], [54, 55, 56, 57, 58, 59]]))
+
+        assert popcount(masks).tolist() == [6, 6]
+        assert popcount(masks[:1] & masks[1:]).tolist() == [0]
+
+
+class TestBacktestEndpoint:
+    """Testes do endpoint /api/analytics/backtest."""
+
+    def test_get_backtest(self, client, mocker, mock_normalized_data):
+        """Testa o backtest com janelas informadas."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/backtest?windows=1,0")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 3
+        assert [item["tested"] for item in data["windows"]] == [2, 2]
+
+    def test_invalid_windows(self, client):
+        """Testa a validação das janelas."""
+        response = client.get("/api/analytics/backtest?windows=10,-1")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
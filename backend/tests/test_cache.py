@@ -0,0 +1,393 @@
+"""
+Testes para o sistema de cache.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.exceptions import CacheError
+from app.utils import cache as cache_module
+from app.utils.cache import CacheManager, MemoryCache
+
+
+class TestCacheManagerStartup:
+    """Testes da inicialização não bloqueante do CacheManager."""
+
+    def test_starts_with_memory_without_connecting(self, mocker):
+        """Testa que o construtor não conecta ao Redis."""
+        redis_cache = mocker.patch.object(cache_module, "RedisCache")
+
+        manager = CacheManager(cache_type="redis", redis_url="redis://localhost:6379/0")
+
+        assert manager.get_type() == "memory"
+        assert isinstance(manager._backend, MemoryCache)
+        redis_cache.assert_not_called()
+
+    def test_connect_failure_keeps_memory(self):
+        """Testa que a falha de conexão mantém o cache em memória."""
+        manager = CacheManager(
+            cache_type="redis",
+            redis_url="redis://127.0.0.1:1/0",
+            connect_timeout=0.2,
+            retry_interval=0,
+        )
+
+        started = time.perf_counter()
+        assert manager.connect() is False
+        assert time.perf_counter() - started < 2
+        assert manager.get_type() == "memory"
+
+    def test_background_retry_upgrades_to_redis(self, mocker):
+        """Testa que a reconexão em background promove o backend para Redis."""
+        attempts = []
+
+        def fake_redis_cache(redis_url, connect_timeout):
+            attempts.append(redis_url)
+            if len(attempts) < 3:
+                raise CacheError("Connection refused")
+            return MemoryCache()
+
+        mocker.patch.object(cache_module, "RedisCache", side_effect=fake_redis_cache)
+        manager = CacheManager(
+            cache_type="redis", redis_url="redis://localhost:6379/0", retry_interval=0.01
+        )
+
+        assert manager.connect() is False
+        deadline = time.perf_counter() + 2
+        while manager.get_type() != "redis" and time.perf_counter() < deadline:
+            time.sleep(0.01)
+
+        assert manager.get_type() == "redis"
+        assert len(attempts) == 3
+        manager.close()
+
+    def test_memory_cache_type_needs_no_connection(self):
+        """Testa que o cache em memória não precisa de conexão."""
+        manager = CacheManager(cache_type="memory")
+
+        assert manager.connect() is True
+        assert manager.get_type() == "memory"
+
+
+class TestMemoryCacheSnapshot:
+    """Testes do snapshot do cache em memória."""
+
+    def test_snapshot_roundtrip_keeps_values(self, tmp_path):
+        """Testa que o snapshot restaura os valores gravados."""
+        path = str(tmp_path / "cache.snapshot")
+        source = MemoryCache()
+        source.set("estimate", {"numbers": [1, 2, 3]}, ttl=600)
+        source.set("processed_data", [{"concurso": 1}], ttl=600)
+
+        assert source.save_snapshot(path) == 2
+
+        target = MemoryCache()
+        assert target.load_snapshot(path) == 2
+        assert target.get("estimate") == {"numbers": [1, 2, 3]}
+        assert target.get("processed_data") == [{"concurso": 1}]
+
+    def test_snapshot_keeps_remaining_ttl(self, tmp_path):
+        """Testa que o TTL restante é preservado."""
+        path = str(tmp_path / "cache.snapshot")
+        source = MemoryCache()
+        source.set("estimate", 1, ttl=100)
+        source.save_snapshot(path)
+
+        target = MemoryCache()
+        target.load_snapshot(path)
+
+        remaining = (target._expiry["estimate"] - datetime.now()).total_seconds()
+        assert 90 < remaining <= 100
+
+    def test_expired_entries_are_skipped(self, tmp_path, mocker):
+        """Testa que entradas expiradas não são gravadas nem carregadas."""
+        path = str(tmp_path / "cache.snapshot")
+        source = MemoryCache()
+        source.set("old", 1, ttl=-1)
+        source.set("short", 2, ttl=10)
+        source.set("fresh", 3, ttl=600)
+
+        assert source.save_snapshot(path) == 2
+
+        # Simula um reinício 60s depois: "short" expira no caminho
+        mocker.patch("app.utils.cache.time.time", return_value=time.time() + 60)
+        target = MemoryCache()
+        assert target.load_snapshot(path) == 1
+        assert target.get("fresh") == 3
+        assert target.get("short") is None
+
+    def test_missing_snapshot_loads_nothing(self, tmp_path):
+        """Testa que a ausência do arquivo não é um erro."""
+        assert MemoryCache().load_snapshot(str(tmp_path / "missing")) == 0
+
+    def test_invalid_snapshot_raises(self, tmp_path):
+        """Testa que um arquivo inválido é rejeitado."""
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"garbage")
+
+        with pytest.raises(CacheError):
+            MemoryCache().load_snapshot(str(path))
+
+    def test_manager_snapshot_disabled_without_path(self):
+        """Testa que o snapshot é ignorado sem caminho configurado."""
+        manager = CacheManager(cache_type="memory")
+        manager.set("key", "value")
+
+        assert manager.save_snapshot() == 0
+        assert manager.load_snapshot() == 0
+
+    def test_manager_survives_restart(self, tmp_path):
+        """Testa que um novo gerenciador recupera o estado anterior."""
+        path = str(tmp_path / "cache.snapshot")
+        first = CacheManager(cache_type="memory", snapshot_path=path)
+        first.set("estimate", {"numbers": [4, 8, 15]})
+        first.save_snapshot()
+
+        second = CacheManager(cache_type="memory", snapshot_path=path)
+        assert second.load_snapshot() == 1
+        assert second.get("estimate") == {"numbers": [4, 8, 15]}
+
+    def test_manager_ignores_corrupt_snapshot(self, tmp_path):
+        """Testa que um snapshot corrompido não impede o startup."""
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"MSCACHE1not-zlib")
+
+        manager = CacheManager(cache_type="memory", snapshot_path=str(path))
+        assert manager.load_snapshot() == 0
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Aponta os clientes Redis síncrono e assíncrono para o mesmo fakeredis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    import fakeredis.aioredis
+    import redis
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(
+        redis.asyncio, "from_url", lambda url, **kwargs: fakeredis.aioredis.FakeRedis(server=server)
+    )
+    return "redis://fakeredis"
+
+
+class TestBulkOperations:
+    """Testes das operações em lote."""
+
+    @pytest.fixture(params=["memory", "redis"])
+    def backend(self, request, fake_redis):
+        if request.param == "memory":
+            return MemoryCache()
+        return cache_module.RedisCache(fake_redis)
+
+    def test_set_many_and_get_many(self, backend):
+        """Testa a gravação e leitura de várias chaves."""
+        assert backend.set_many({"a": 1, "b": [2, 3], "c": {"d": 4}}, ttl=60) is True
+
+        assert backend.get_many(["a", "b", "c"]) == {"a": 1, "b": [2, 3], "c": {"d": 4}}
+
+    def test_get_many_omits_missing_keys(self, backend):
+        """Testa que chaves ausentes não aparecem no resultado."""
+        backend.set("a", 1)
+
+        assert backend.get_many(["a", "missing"]) == {"a": 1}
+        assert backend.get_many([]) == {}
+
+    def test_delete_many(self, backend):
+        """Testa a remoção de várias chaves."""
+        backend.set_many({"a": 1, "b": 2, "c": 3})
+
+        backend.delete_many(["a", "b"])
+
+        assert backend.get_many(["a", "b", "c"]) == {"c": 3}
+
+    def test_redis_get_many_is_one_round_trip(self, fake_redis, mocker):
+        """Testa que o RedisCache usa um único MGET."""
+        backend = cache_module.RedisCache(fake_redis)
+        backend.set_many({f"k{i}": i for i in range(100)})
+        mget = mocker.spy(backend._redis, "mget")
+        get = mocker.spy(backend._redis, "get")
+
+        assert len(backend.get_many([f"k{i}" for i in range(100)])) == 100
+        assert mget.call_count == 1
+        assert get.call_count == 0
+
+    async def test_async_client_reads_sync_writes(self, fake_redis):
+        """Testa o cliente assíncrono sobre os mesmos dados."""
+        manager = CacheManager(cache_type="redis", redis_url=fake_redis, retry_interval=0)
+        manager.connect()
+        manager.set_many({"a": 1, "b": 2})
+
+        assert await manager.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+        await manager.aclose()
+
+    def test_async_client_closed_on_loop_change(self, fake_redis, mocker):
+        """Testa que o cliente de um loop ainda ativo é fechado nele ao trocar de loop."""
+        manager = CacheManager(cache_type="redis", redis_url=fake_redis, retry_interval=0)
+        manager.connect()
+        manager.set("a", 1)
+
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(manager.aget_many(["a"]), other_loop).result(timeout=5)
+            old_backend = manager._async_backend
+            close = mocker.spy(old_backend, "close")
+
+            assert asyncio.run(manager.aget_many(["a"])) == {"a": 1}
+
+            assert manager._async_backend is not old_backend
+            deadline = time.time() + 5
+            while not close.call_count and time.time() < deadline:
+                time.sleep(0.01)
+            assert close.call_count == 1
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+
+    async def test_async_falls_back_to_memory(self):
+        """Testa que sem Redis as operações assíncronas usam a memória."""
+        manager = CacheManager(cache_type="memory")
+        manager.set("a", 1)
+
+        assert await manager.aget_many(["a"]) == {"a": 1}
+
+
+class TestGenerations:
+    """Testes da invalidação por geração e por prefixo."""
+
+    @pytest.fixture(params=["memory", "redis"])
+    def manager(self, request, fake_redis):
+        if request.param == "memory":
+            return CacheManager(cache_type="memory", generation_refresh_interval=0)
+        manager = CacheManager(
+            cache_type="redis",
+            redis_url=fake_redis,
+            retry_interval=0,
+            generation_refresh_interval=0,
+        )
+        manager.connect()
+        return manager
+
+    def test_clear_bumps_generation(self, manager):
+        """Testa que limpar o cache troca a geração e esconde as chaves antigas."""
+        manager.set("mega_sena:estimate", {"sorte": [1, 2, 3, 4, 5, 6]})
+        generation = manager.get_generation()
+
+        assert manager.clear() is True
+
+        assert manager.get_generation() == generation + 1
+        assert manager.get("mega_sena:estimate") is None
+        assert manager.exists("mega_sena:estimate") is False
+
+    def test_keys_are_namespaced(self, manager):
+        """Testa o formato da chave física."""
+        manager.set("mega_sena:estimate", 1)
+
+        physical = f"{manager.namespace}:{manager.get_generation()}:mega_sena:estimate"
+        assert manager._backend.get(physical) == 1
+
+    def test_clear_keeps_foreign_redis_keys(self, fake_redis):
+        """Testa que a limpeza não apaga dados de outros serviços no Redis."""
+        import redis
+
+        manager = CacheManager(cache_type="redis", redis_url=fake_redis, retry_interval=0)
+        manager.connect()
+        client = redis.from_url(fake_redis)
+        client.set("ratelimit:estimate:127.0.0.1", 123)
+
+        manager.clear()
+
+        assert client.get("ratelimit:estimate:127.0.0.1") == b"123"
+
+    def test_generation_is_shared_between_workers(self, fake_redis):
+        """Testa que a limpeza em um worker vale para os demais."""
+        first, second = (
+            CacheManager(
+                cache_type="redis",
+                redis_url=fake_redis,
+                retry_interval=0,
+                generation_refresh_interval=0,
+            )
+            for _ in range(2)
+        )
+        first.connect()
+        second.connect()
+        first.set("mega_sena:estimate", 1)
+        assert second.get("mega_sena:estimate") == 1
+
+        first.clear()
+
+        assert second.get("mega_sena:estimate") is None
+
+    def test_invalidate_prefix(self, manager):
+        """Testa a remoção seletiva por prefixo."""
+        manager.set_many({f"mega_sena:draw:2024-01-{day:02d}": day for day in range(1, 21)})
+        manager.set("mega_sena:estimate", 1)
+
+        assert manager.invalidate_prefix("mega_sena:draw:") == 20
+
+        assert manager.get("mega_sena:estimate") == 1
+        assert manager.get("mega_sena:draw:2024-01-01") is None
+
+    def test_redis_prefix_deletion_in_batches(self, fake_redis):
+        """Testa o SCAN em lotes menores que a quantidade de chaves."""
+        backend = cache_module.RedisCache(fake_redis)
+        backend.set_many({f"p:{i}": i for i in range(25)})
+        backend.set("other", 1)
+
+        assert backend.delete_prefix("p:", batch_size=10) == 25
+        assert backend.get("other") == 1
+
+    def test_escape_glob(self):
+        """Testa o escape de caracteres especiais do MATCH."""
+        assert cache_module._escape_glob("a*b?[c]") == "a\\*b\\?\\[c\\]"
+
+
+class TestServiceClear:
+    """Testes da limpeza com reaquecimento no serviço."""
+
+    def test_clear_with_rewarm_keeps_data_available(self, service, mocker, mock_normalized_data):
+        """Testa que após a limpeza com reaquecimento os dados já estão em cache."""
+        load = mocker.patch.object(service, "_load_fresh_data", return_value=mock_normalized_data)
+        mocker.patch.object(service, "_rebuild_estimate")
+
+        service.clear_cache(rewarm=True)
+
+        load.assert_called_once()
+        assert service.cache.get("mega_sena:processed_data") == mock_normalized_data
+
+    def test_clear_with_failed_rewarm_still_clears(self, service, mocker):
+        """Testa que falhas no reaquecimento não impedem a limpeza."""
+        service.cache.set("mega_sena:estimate", 1)
+        mocker.patch.object(service, "_load_fresh_data", side_effect=RuntimeError("down"))
+
+        service.clear_cache(rewarm=True)
+
+        assert service.cache.get("mega_sena:estimate") is None
+
+
+class TestLifespan:
+    """Testes do lifespan da aplicação."""
+
+    def test_startup_timings_are_recorded(self, mocker):
+        """Testa que o startup mede os tempos de importação e inicialização."""
+        from app.main import app
+
+        mocker.patch("app.routes.api.service.get_processed_data", return_value=[])
+
+        with TestClient(app) as client:
+            timings = client.app.state.startup_timings
+
+        assert timings["import_ms"] > 0
+        assert timings["startup_ms"] >= 0
+        assert timings["cache_type"] in ("memory", "redis")
@@ -0,0 +1,176 @@
+"""
+Testes das métricas do cache por prefixo.
+"""
+
+import time
+
+import pytest
+
+from app.config import settings
+from app.utils.cache import CacheManager
+from app.utils.cache_metrics import CacheMetrics, key_prefix
+
+
+class TestKeyPrefix:
+    """Testes do agrupamento de chaves por prefixo."""
+
+    def test_service_keys(self):
+        """Testa os prefixos das chaves do serviço."""
+        assert key_prefix("mega_sena:processed_data") == "processed_data"
+        assert key_prefix("mega_sena:estimate") == "estimate"
+        assert key_prefix("mega_sena:draw:2024-01-15") == "draw:*"
+
+    def test_other_keys(self):
+        """Testa chaves fora do namespace do serviço."""
+        assert key_prefix("standalone") == "standalone"
+        assert key_prefix("other:a:b") == "other:*"
+
+
+class TestCacheMetrics:
+    """Testes dos contadores."""
+
+    def test_hits_and_misses(self):
+        """Testa a contagem de acertos e falhas."""
+        metrics = CacheMetrics()
+        metrics.record_read("mega_sena:estimate", True, 0.001)
+        metrics.record_read("mega_sena:estimate", False, 0.002)
+
+        stats = metrics.snapshot()["estimate"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["latency_ms"]["read"]["samples"] == 2
+
+    def test_bytes_follow_writes_and_evictions(self):
+        """Testa que bytes armazenados acompanham escritas e remoções."""
+        metrics = CacheMetrics()
+        metrics.record_write("mega_sena:draw:2024-01-13", 0.0)
+        metrics.record_serialization("mega_sena:draw:2024-01-13", 100, 0.0)
+        metrics.record_write("mega_sena:draw:2024-01-15", 0.0)
+        metrics.record_serialization("mega_sena:draw:2024-01-15", 150, 0.0)
+
+        assert metrics.snapshot()["draw:*"]["bytes_stored"] == 250
+        assert metrics.snapshot()["draw:*"]["keys"] == 2
+
+        metrics.record_eviction("mega_sena:draw:2024-01-13")
+
+        stats = metrics.snapshot()["draw:*"]
+        assert stats["bytes_stored"] == 150
+        assert stats["evictions"] == 1
+
+    def test_top_keys(self):
+        """Testa a ordenação das principais chaves."""
+        metrics = CacheMetrics()
+        metrics.record_write("mega_sena:processed_data", 0.0)
+        metrics.record_serialization("mega_sena:processed_data", 5000, 0.0)
+        metrics.record_write("mega_sena:estimate", 0.0)
+        metrics.record_serialization("mega_sena:estimate", 80, 0.0)
+        for _ in range(3):
+            metrics.record_read("mega_sena:estimate", True, 0.0)
+
+        assert metrics.top_keys(sort="bytes")[0]["key"] == "mega_sena:processed_data"
+        assert metrics.top_keys(sort="accesses")[0]["key"] == "mega_sena:estimate"
+        assert len(metrics.top_keys(limit=1)) == 1
+
+
+class TestManagerMetrics:
+    """Testes da instrumentação do CacheManager."""
+
+    def test_manager_records_operations(self):
+        """Testa que get/set/get_many alimentam as métricas."""
+        manager = CacheManager(cache_type="memory")
+        manager.set("mega_sena:processed_data", [{"numeros": [1, 2, 3, 4, 5, 6]}] * 10)
+        manager.get("mega_sena:processed_data")
+        manager.get_many(["mega_sena:draw:2024-01-15"])
+
+        stats = manager.metrics.snapshot()
+        assert stats["processed_data"]["hits"] == 1
+        assert stats["processed_data"]["bytes_stored"] == 0
+        assert stats["processed_data"]["writes"] == 1
+        assert stats["draw:*"]["misses"] == 1
+
+    def test_redis_reports_serialized_size(self, monkeypatch):
+        """Testa que o tamanho vem da serialização feita pelo Redis."""
+        fakeredis = pytest.importorskip("fakeredis")
+        import redis
+
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server)
+        )
+        manager = CacheManager(cache_type="redis", redis_url="redis://fakeredis")
+        assert manager.connect() is True
+
+        manager.set("mega_sena:processed_data", [{"numeros": [1, 2, 3, 4, 5, 6]}] * 10)
+        manager.set_many({"mega_sena:draw:2024-01-13": 1, "mega_sena:draw:2024-01-15": 2})
+
+        stats = manager.metrics.snapshot()
+        assert stats["processed_data"]["bytes_stored"] > 0
+        assert stats["processed_data"]["writes"] == 1
+        assert stats["draw:*"]["bytes_stored"] > 0
+        assert stats["draw:*"]["keys"] == 2
+
+    def test_expired_reads_are_counted(self):
+        """Testa a contagem de leituras de entradas expiradas."""
+        manager = CacheManager(cache_type="memory")
+        manager.set("mega_sena:estimate", 1, ttl=0)
+        time.sleep(0.01)
+
+        assert manager.get("mega_sena:estimate") is None
+
+        stats = manager.metrics.snapshot()["estimate"]
+        assert stats["expired"] == 1
+        assert stats["misses"] == 1
+
+    def test_clear_evicts_tracked_keys(self):
+        """Testa que a troca de geração zera os bytes armazenados."""
+        manager = CacheManager(cache_type="memory")
+        manager.set("mega_sena:estimate", {"sorte": [1, 2, 3, 4, 5, 6]})
+
+        manager.clear()
+
+        stats = manager.metrics.snapshot()["estimate"]
+        assert stats["bytes_stored"] == 0
+        assert stats["evictions"] == 1
+
+    def test_metrics_can_be_disabled(self):
+        """Testa que a coleta pode ser desabilitada."""
+        manager = CacheManager(cache_type="memory", metrics_enabled=False)
+        manager.set("mega_sena:estimate", 1)
+        manager.get("mega_sena:estimate")
+
+        assert manager.metrics.snapshot() == {}
+
+
+class TestMetricsEndpoints:
+    """Testes da exposição das métricas."""
+
+    def test_stats_include_cache_prefixes(self, client, service):
+        """Testa a seção de cache em /api/stats."""
+        service.cache.set("mega_sena:estimate", {"sorte": [1, 2, 3, 4, 5, 6]})
+        service.cache.get("mega_sena:estimate")
+
+        data = client.get("/api/stats").json()
+
+        assert "generation" in data["cache"]
+        assert data["cache"]["prefixes"]["estimate"]["hits"] >= 1
+
+    def test_admin_top_keys(self, client, service, mocker):
+        """Testa o endpoint administrativo de principais chaves."""
+        mocker.patch.object(settings, "admin_token", "secret")
+        service.cache.set("mega_sena:processed_data", list(range(1000)))
+        for _ in range(3):
+            service.cache.get("mega_sena:processed_data")
+
+        response = client.get(
+            "/api/admin/cache/keys?sort=accesses&limit=5", headers={"X-Admin-Token": "secret"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["keys"][0]["key"] == "mega_sena:processed_data"
+
+    def test_admin_top_keys_requires_token(self, client, mocker):
+        """Testa que o endpoint exige o token administrativo."""
+        mocker.patch.object(settings, "admin_token", "secret")
+
+        assert client.get("/api/admin/cache/keys").status_code == 401
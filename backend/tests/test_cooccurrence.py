@@ -0,0 +1,149 @@
+"""
+Testes das análises de coocorrência de pares e trincas.
+"""
+
+from datetime import date
+from itertools import combinations
+
+import numpy as np
+from fastapi import status
+
+from app.analytics.cooccurrence import (
+    TRIPLE_NUMBERS,
+    TRIPLE_SPACE,
+    CooccurrenceIndex,
+    expected_count,
+    one_hot,
+    pair_matrix,
+    top_pairs,
+    top_triples,
+    triple_counts,
+    triple_rank,
+)
+from app.services.analytics_service import select_window
+
+
+class TestCooccurrence:
+    """Testes das contagens vetorizadas."""
+
+    def test_matches_nested_loops(self, mock_normalized_data):
+        """Testa que as contagens batem com a contagem ingênua."""
+        pairs = pair_matrix(mock_normalized_data)
+        triples = triple_counts(mock_normalized_data)
+
+        expected_pairs = np.zeros((60, 60), dtype=np.int64)
+        expected_triples = {}
+        for draw in mock_normalized_data:
+            for a in draw.numbers:
+                for b in draw.numbers:
+                    expected_pairs[a - 1, b - 1] += 1
+            for combo in combinations(draw.numbers, 3):
+                expected_triples[combo] = expected_triples.get(combo, 0) + 1
+
+        assert np.array_equal(pairs, expected_pairs)
+        assert int(triples.sum()) == sum(expected_triples.values())
+        for item in top_triples(triples, 100):
+            assert expected_triples[tuple(item["numbers"])] == item["count"]
+
+    def test_triple_rank_is_dense(self):
+        """Testa que cada trinca tem um posto único entre 0 e C(60, 3) - 1."""
+        combos = np.array(list(combinations(range(60), 3)))
+        ranks = triple_rank(combos[:, 0], combos[:, 1], combos[:, 2])
+
+        assert TRIPLE_SPACE == 34220
+        assert sorted(ranks.tolist()) == list(range(TRIPLE_SPACE))
+        assert np.array_equal(TRIPLE_NUMBERS[ranks], combos)
+
+    def test_one_hot_ignores_out_of_range(self, make_draw):
+        """Testa que dezenas fora de 1..60 não entram na matriz."""
+        matrix = one_hot([make_draw(1, (0, 1, 60, 61))])
+
+        assert matrix.sum() == 2
+        assert matrix[0, 0] == 1 and matrix[0, 59] == 1
+
+    def test_top_pairs_order(self, make_draw):
+        """Testa a ordenação dos top-k por contagem."""
+        draws = [make_draw(1, (1, 2, 3, 4, 5, 6)), make_draw(2, (1, 2, 7, 8, 9, 10))]
+
+        result = top_pairs(pair_matrix(draws), 2)
+
+        assert result[0] == {"numbers": [1, 2], "count": 2}
+        assert result[1]["count"] == 1
+
+    def test_expected_count(self):
+        """Testa a contagem esperada de um par sob sorteio uniforme."""
+        assert expected_count(59 * 2, 2) == 1.0
+
+
+class TestCooccurrenceIndex:
+    """Testes da manutenção incremental do índice."""
+
+    def test_sync_reports_added_and_removed(self, make_draw):
+        """Testa as quantidades de concursos adicionados e removidos."""
+        draws = [make_draw(n, ((n + k * 7) % 60 + 1 for k in range(6)), n) for n in range(1, 21)]
+        index = CooccurrenceIndex()
+
+        assert index.sync(draws[:10]) == (10, 0)
+        assert index.sync(draws[5:]) == (10, 5)
+
+    def test_sync_without_changes(self, mock_normalized_data):
+        """Testa que o mesmo conjunto não recalcula nada."""
+        index = CooccurrenceIndex()
+        index.sync(mock_normalized_data)
+
+        assert index.sync(list(mock_normalized_data)) == (0, 0)
+
+    def test_select_window(self, mock_normalized_data):
+        """Testa os recortes por quantidade e por data."""
+        draws = sorted(mock_normalized_data, key=lambda draw: draw.contest)
+
+        assert [d.contest for d in select_window(draws, last=2)] == [2649, 2650]
+        assert [
+            d.contest
+            for d in select_window(
+                draws, start=date(2024, 1, 11).toordinal(), end=date(2024, 1, 14).toordinal()
+            )
+        ] == [2649]
+        assert select_window(draws) is draws
+
+
+class TestPairsEndpoint:
+    """Testes do endpoint /api/analytics/pairs."""
+
+    def test_get_pairs(self, client, mocker, mock_normalized_data):
+        """Testa o top-k de pares e trincas do histórico completo."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/pairs?top=3")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 3
+        assert data["pairs"][0] == {"numbers": [23, 45], "count": 3}
+        assert data["triples"][0] == {"numbers": [23, 45, 58], "count": 3}
+        assert data["matrix"] is None
+
+    def test_get_pairs_window_with_matrix(self, client, mocker, mock_normalized_data):
+        """Testa a janela dos últimos concursos com a matriz completa."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/pairs?last=1&matrix=true&triples=false")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 1
+        assert data["start"] == data["end"] == "2024-01-15"
+        assert data["triples"] is None
+        assert data["matrix"][4][11] == 1
+
+    def test_get_pairs_invalid_date(self, client):
+        """Testa a rejeição de datas inválidas na janela."""
+        response = client.get("/api/analytics/pairs?start=15/01/2024")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -2,10 +2,16 @@
 Testes unitários para funções de processamento de dados.
 """
 
+import threading
+import time
+
 import pytest
 from datetime import datetime, timedelta
 
+from app.utils.draw import Draw
+from app.exceptions import CircuitBreakerOpenError
 from app.utils.data_processor import (
+    iter_draws,
     normalize_data,
     filter_last_two_years,
     calculate_frequencies,
@@ -26,9 +32,9 @@ class TestNormalizeData:
         result = normalize_data(mock_draw_data)
         
         assert len(result) == 3
-        assert result[0]["data"] == "15/01/2024"
-        assert result[0]["numero_concurso"] == "2650"
-        assert result[0]["numeros"] == [5, 12, 23, 45, 58, 60]
+        assert result[0].date_br == "15/01/2024"
+        assert result[0].contest == 2650
+        assert result[0].numbers == (5, 12, 23, 45, 58, 60)
     
     def test_normalize_with_lista_dezenas(self):
         """Testa normalização com campo 'listaDezenas'."""
@@ -40,7 +46,7 @@ class TestNormalizeData:
         
         result = normalize_data(data)
         assert len(result) == 1
-        assert result[0]["numeros"] == [5, 12, 23, 45, 58, 60]
+        assert result[0].numbers == (5, 12, 23, 45, 58, 60)
     
     def test_normalize_filters_invalid_data(self):
         """Testa que dados inválidos são filtrados."""
@@ -52,7 +58,94 @@ class TestNormalizeData:
         
         result = normalize_data(data)
         assert len(result) == 1
-        assert result[0]["numero_concurso"] == "3"
+        assert result[0].contest == 3
+    
+    def test_normalize_filters_invalid_date_and_contest(self):
+        """Testa que registros sem data ou número válidos são descartados."""
+        dezenas = ["01", "02", "03", "04", "05", "06"]
+        data = [
+            {"numero": 1, "dataApuracao": "", "dezenas": dezenas},
+            {"numero": 2, "dataApuracao": "31/02/2024", "dezenas": dezenas},
+            {"numero": "x", "dataApuracao": "03/01/2024", "dezenas": dezenas},
+            {"numero": 4, "dataApuracao": "2024-01-04", "dezenas": dezenas}
+        ]
+        
+        result = normalize_data(data)
+        assert [draw.contest for draw in result] == [4]
+        assert result[0].date_iso == "2024-01-04"
+    
+    def test_normalize_sorts_numbers(self):
+        """Testa que as dezenas são guardadas em ordem crescente."""
+        data = [{"numero": 1, "dataApuracao": "01/01/2024", "dezenas": ["60", "05", "12", "01"]}]
+        
+        assert normalize_data(data)[0].numbers == (1, 5, 12, 60)
+
+
+class TestIngestPipeline:
+    """Testes do pipeline de ingestão em uma passada."""
+    
+    def test_iter_draws_filters_by_cutoff(self, mock_draw_data):
+        """Testa que payloads vazios e anteriores ao corte são descartados."""
+        cutoff = datetime(2024, 1, 12).toordinal()
+        
+        result = list(iter_draws([None, *mock_draw_data, {}], cutoff=cutoff))
+        
+        assert [draw.contest for draw in result] == [2650, 2649]
+    
+    def test_iter_draws_is_lazy(self):
+        """Testa que cada payload é consumido apenas quando solicitado."""
+        consumed = []
+        
+        def payloads():
+            for num in range(1, 4):
+                consumed.append(num)
+                yield {"numero": num, "dataApuracao": "01/01/2024", "dezenas": ["1", "2", "3", "4"]}
+        
+        draws = iter_draws(payloads())
+        assert next(draws).contest == 1
+        assert consumed == [1]
+    
+    def test_fetch_bounds_requests_in_flight(self, service, mocker):
+        """Testa que a busca mantém no máximo N requisições em andamento."""
+        mocker.patch("app.services.mega_sena_service.settings.ingest_max_in_flight", 3)
+        mocker.patch.object(service, "_fetch_latest", return_value={"numero": 40})
+        today = datetime.now().strftime('%d/%m/%Y')
+        lock = threading.Lock()
+        active = [0, 0]
+        
+        def fetch(num):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.002)
+            with lock:
+                active[0] -= 1
+            return {"numero": num, "dataApuracao": today, "dezenas": ["1", "2", "3", "4", "5", "6"]}
+        
+        mocker.patch.object(service, "_fetch_single_draw", side_effect=fetch)
+        
+        result = service.fetch_historical_data()
+        
+        assert [draw.contest for draw in result] == list(range(1, 41))
+        assert active[1] <= 3
+    
+    def test_fetch_stops_when_circuit_opens(self, service, mocker):
+        """Testa que a ingestão segue com o que chegou quando o circuit breaker abre."""
+        mocker.patch("app.services.mega_sena_service.settings.ingest_max_in_flight", 1)
+        mocker.patch.object(service, "_fetch_latest", return_value={"numero": 10})
+        today = datetime.now().strftime('%d/%m/%Y')
+        
+        def fetch(num):
+            if num > 3:
+                raise CircuitBreakerOpenError()
+            return {"numero": num, "dataApuracao": today, "dezenas": ["1", "2", "3", "4", "5", "6"]}
+        
+        fetch_mock = mocker.patch.object(service, "_fetch_single_draw", side_effect=fetch)
+        
+        result = service.fetch_historical_data()
+        
+        assert [draw.contest for draw in result] == [1, 2, 3]
+        assert fetch_mock.call_count == 4
 
 
 class TestFilterLastTwoYears:
@@ -65,37 +158,29 @@ class TestFilterLastTwoYears:
     
     def test_filter_recent_data(self):
         """Testa que dados recentes são mantidos."""
-        recent_date = (datetime.now() - timedelta(days=30)).strftime('%d/%m/%Y')
-        data = [{
-            "data": recent_date,
-            "numero_concurso": "2650",
-            "numeros": [1, 2, 3, 4, 5, 6]
-        }]
+        recent_date = (datetime.now() - timedelta(days=30)).toordinal()
+        data = [Draw(2650, recent_date, (1, 2, 3, 4, 5, 6))]
         
         result = filter_last_two_years(data)
         assert len(result) == 1
     
     def test_filter_old_data(self):
         """Testa que dados antigos são removidos."""
-        old_date = (datetime.now() - timedelta(days=800)).strftime('%d/%m/%Y')
-        data = [{
-            "data": old_date,
-            "numero_concurso": "2000",
-            "numeros": [1, 2, 3, 4, 5, 6]
-        }]
+        old_date = (datetime.now() - timedelta(days=800)).toordinal()
+        data = [Draw(2000, old_date, (1, 2, 3, 4, 5, 6))]
         
         result = filter_last_two_years(data)
         assert len(result) == 0
     
     def test_filter_mixed_data(self):
         """Testa filtro com dados mistos."""
-        recent = (datetime.now() - timedelta(days=30)).strftime('%d/%m/%Y')
-        old = (datetime.now() - timedelta(days=800)).strftime('%d/%m/%Y')
+        recent = (datetime.now() - timedelta(days=30)).toordinal()
+        old = (datetime.now() - timedelta(days=800)).toordinal()
         
         data = [
-            {"data": recent, "numero_concurso": "2650", "numeros": [1, 2, 3, 4, 5, 6]},
-            {"data": old, "numero_concurso": "2000", "numeros": [1, 2, 3, 4, 5, 6]},
-            {"data": recent, "numero_concurso": "2649", "numeros": [1, 2, 3, 4, 5, 6]}
+            Draw(2650, recent, (1, 2, 3, 4, 5, 6)),
+            Draw(2000, old, (1, 2, 3, 4, 5, 6)),
+            Draw(2649, recent, (1, 2, 3, 4, 5, 6))
         ]
         
         result = filter_last_two_years(data)
@@ -126,11 +211,8 @@ class TestCalculateFrequencies:
     
     def test_calculate_frequencies_bounds(self):
         """Testa que apenas números de 1 a 60 são contados."""
-        data = [{
-            "data": "01/01/2024",
-            "numero_concurso": "1",
-            "numeros": [0, 5, 10, 61, 100]  # Números fora do range
-        }]
+        # Números fora do range
+        data = [Draw(1, datetime(2024, 1, 1).toordinal(), (0, 5, 10, 61, 100))]
         
         result = calculate_frequencies(data)
         assert result[5] == 1
@@ -0,0 +1,53 @@
+"""
+Testes das frequências com decaimento exponencial.
+"""
+
+from datetime import date
+
+from app.analytics.decay import DecayedFrequencies
+from app.utils.draw import Draw
+
+
+class TestDecayedFrequencies:
+    """Testes das frequências com decaimento exponencial."""
+
+    def test_half_life(self):
+        """Testa que o peso cai pela metade a cada meia-vida."""
+        decay = DecayedFrequencies([90])
+        decay.rebuild(
+            [
+                Draw(1, date(2024, 1, 1).toordinal(), (1, 2, 3, 4, 5, 6)),
+                Draw(2, date(2024, 1, 1).toordinal() + 90, (1, 7, 8, 9, 10, 11)),
+            ]
+        )
+
+        scores = decay.strategy_scores()["decay_90"]
+        assert scores[0] == 1.5
+        assert scores[1] == 0.5
+        assert scores[6] == 1.0
+
+    def test_service_updates_online(self, service, mocker, random_draws):
+        """Testa que as estimativas usam o estado incremental a cada concurso novo."""
+        draws = random_draws(30)
+        data = mocker.patch.object(service, "get_processed_data", return_value=draws[:29])
+        service.get_estimates()
+
+        data.return_value = draws
+        service.cache.delete("mega_sena:estimate")
+        sync = mocker.spy(service.decay, "sync")
+        estimates = service.get_estimates()
+
+        assert sync.spy_return == "incremental"
+        assert {"decay_90", "decay_180", "decay_365"} <= set(estimates["strategies"])
+
+    def test_cached_bundle_without_strategy_is_rebuilt(self, service, mocker, random_draws):
+        """Testa que um pacote gerado com outras meias-vidas é recalculado."""
+        mocker.patch.object(service, "get_processed_data", return_value=random_draws(30))
+        estimates = service.get_estimates()
+        del estimates["strategies"]["decay_365"]
+        service.cache.set("mega_sena:estimate", estimates)
+
+        estimate = service.get_estimate("decay_365")
+
+        assert estimate["strategy"] == "decay_365"
+        assert "decay_365" in service.cache.get("mega_sena:estimate")["strategies"]
@@ -0,0 +1,89 @@
+"""
+Testes do registro compacto de concurso.
+"""
+
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import date
+
+import pytest
+
+from app.utils.draw import Draw, DrawStore, parse_date, parse_iso_date
+
+
+class TestParseDate:
+    """Testes da conversão de datas em ordinal."""
+
+    def test_parse_both_formats(self):
+        """Testa que os formatos brasileiro e ISO resultam no mesmo ordinal."""
+        expected = date(2024, 1, 15).toordinal()
+
+        assert parse_date("15/01/2024") == expected
+        assert parse_date("2024-01-15") == expected
+
+    def test_parse_invalid(self):
+        """Testa datas inválidas."""
+        assert parse_date("") is None
+        assert parse_date("31/02/2024") is None
+        assert parse_date("+1/01/2024") is None
+        assert parse_iso_date("15/01/2024") is None
+
+
+class TestDraw:
+    """Testes do tipo Draw."""
+
+    def test_to_api(self):
+        """Testa a conversão para o formato de resposta."""
+        draw = Draw(2650, date(2024, 1, 15).toordinal(), (5, 12, 23, 45, 58, 60))
+
+        assert draw.to_api() == {
+            "data": "15/01/2024",
+            "numero_concurso": "2650",
+            "numeros": [5, 12, 23, 45, 58, 60],
+        }
+        assert draw.date_iso == "2024-01-15"
+
+    def test_immutable_and_slotted(self):
+        """Testa que o registro é imutável e sem __dict__."""
+        draw = Draw(1, 1, (1, 2, 3, 4))
+
+        assert not hasattr(draw, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            draw.contest = 2
+
+    def test_pickle_roundtrip(self):
+        """Testa a serialização usada pelo cache e pelo dataset compartilhado."""
+        draw = Draw(2650, date(2024, 1, 15).toordinal(), (5, 12, 23, 45, 58, 60))
+
+        restored = pickle.loads(pickle.dumps(draw))
+
+        assert restored == draw
+        assert restored.mask == draw.mask
+
+    def test_mask(self):
+        """Testa a máscara de bits das dezenas (bit n-1 = dezena n)."""
+        draw = Draw(1, 1, (1, 2, 60, 61))
+
+        assert draw.mask == 0b11 | 1 << 59
+        assert Draw(1, 1, (1, 2, 3, 4)) == Draw(1, 1, (1, 2, 3, 4))
+
+
+class TestDrawStore:
+    """Testes do armazenamento ordenado de concursos."""
+
+    def test_keeps_order_and_skips_duplicates(self):
+        """Testa a inserção fora de ordem e a rejeição de duplicatas."""
+        store = DrawStore()
+
+        assert store.extend(Draw(n, n, (1, 2, 3, 4)) for n in (5, 2, 9, 2, 7)) == 4
+        assert [draw.contest for draw in store] == [2, 5, 7, 9]
+        assert store.latest_contest == 9
+        assert store.version == 4
+
+    def test_prune_before(self):
+        """Testa a remoção de concursos anteriores à data de corte."""
+        store = DrawStore(Draw(n, n * 10, (1, 2, 3, 4)) for n in range(1, 6))
+
+        assert store.prune_before(30) == 2
+        assert [draw.contest for draw in store] == [3, 4, 5]
+        assert store.add(Draw(1, 10, (1, 2, 3, 4))) is True
@@ -0,0 +1,111 @@
+"""
+Testes dos atributos por concurso e suas distribuições.
+"""
+
+from fastapi import status
+
+from app.analytics.features import FeatureTable, extract_features
+from app.analytics import features as features_module
+from app.services.analytics_service import select_window
+
+
+class TestFeatureTable:
+    """Testes dos atributos por concurso."""
+
+    PRIMES = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59}
+
+    def test_matches_per_draw_computation(self, random_draws):
+        """Testa as colunas contra o cálculo direto das dezenas de cada concurso."""
+        draws = random_draws(200)
+        columns = extract_features(draws)
+
+        for i, draw in enumerate(draws):
+            numbers = draw.numbers
+            assert columns["sum"][i] == sum(numbers)
+            assert columns["odd"][i] == sum(1 for n in numbers if n % 2)
+            assert columns["low"][i] == sum(1 for n in numbers if n <= 30)
+            assert columns["consecutive"][i] == sum(1 for n in numbers if n + 1 in numbers)
+            assert columns["primes"][i] == sum(1 for n in numbers if n in self.PRIMES)
+            assert columns["decades"][i].tolist() == [
+                sum(1 for n in numbers if 10 * d < n <= 10 * (d + 1)) for d in range(6)
+            ]
+
+    def test_sync_extracts_only_new_draws(self, mocker, random_draws):
+        """Testa que concursos já processados não são recalculados."""
+        draws = random_draws(50)
+        table = FeatureTable()
+        table.sync(draws[:40])
+
+        extract = mocker.spy(features_module, "extract_features")
+        table.sync(draws[5:45])
+        table.sync(draws[5:45])
+
+        assert [len(call.args[0]) for call in extract.call_args_list] == [5]
+
+    def test_window_matches_select_window(self, random_draws):
+        """Testa o recorte por data e pelos últimos concursos."""
+        draws = random_draws(100)
+        table = FeatureTable()
+        table.sync(draws)
+        start, end = draws[10].ordinal - 1, draws[60].ordinal
+
+        for last, low, high in (
+            (None, start, end),
+            (20, start, end),
+            (5, None, None),
+            (None, None, end),
+        ):
+            window = select_window(draws, last, low, high)
+            columns = table.window(last, low, high)
+            assert columns["contest"].tolist() == [draw.contest for draw in window]
+
+
+class TestFeaturesEndpoint:
+    """Testes do endpoint /api/analytics/features."""
+
+    def test_get_features(self, client, mocker, mock_normalized_data):
+        """Testa os histogramas do histórico completo."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/features?sum_bin=50")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 3
+        # Somas: 171, 176 e 203
+        assert data["sum"]["bins"] == [
+            {"start": 150, "end": 199, "count": 2},
+            {"start": 200, "end": 249, "count": 1},
+        ]
+        assert data["odd"] == {"0": 0, "1": 0, "2": 0, "3": 2, "4": 1, "5": 0, "6": 0}
+        assert data["primes"]["2"] == 3
+        assert data["decades"][0] == {
+            "decade": "1-10",
+            "mean": 1.3333,
+            "counts": {"0": 0, "1": 2, "2": 1, "3": 0, "4": 0, "5": 0, "6": 0},
+        }
+
+    def test_get_features_window(self, client, mocker, mock_normalized_data):
+        """Testa a janela dos últimos concursos."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/features?last=1")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 1
+        assert data["start"] == data["end"] == "2024-01-15"
+        assert data["sum"]["mean"] == 203
+        assert data["consecutive"]["0"] == 1
+
+    def test_get_features_invalid_date(self, client):
+        """Testa a rejeição de datas inválidas na janela."""
+        response = client.get("/api/analytics/features?end=2024-13-01")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
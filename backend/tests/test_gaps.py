@@ -0,0 +1,83 @@
+"""
+Testes dos atrasos por dezena.
+"""
+
+from fastapi import status
+
+from app.analytics.gaps import GapTracker
+from app.services.analytics_service import AnalyticsService
+
+
+class TestGapTracker:
+    """Testes dos atrasos por dezena."""
+
+    def test_gaps_by_hand(self, make_draw):
+        """Testa atraso atual e máximo em uma sequência conhecida."""
+        draws = [
+            make_draw(1, (1, 2, 3, 4, 5, 6)),
+            make_draw(2, (7, 8, 9, 10, 11, 12)),
+            make_draw(3, (7, 8, 9, 10, 11, 12)),
+            make_draw(4, (1, 8, 9, 10, 11, 12)),
+            make_draw(5, (7, 8, 9, 10, 11, 12)),
+        ]
+        tracker = GapTracker()
+        tracker.rebuild(draws)
+
+        assert tracker.current_gap(1) == 1
+        assert tracker.longest_gap(1) == 2
+        assert tracker.current_gap(2) == 4
+        assert tracker.current_gap(60) == 5
+        assert tracker.to_list()[0]["last_contest"] == 4
+        assert tracker.to_list()[59]["last_contest"] is None
+
+    def test_pruning_keeps_history(self, random_draws):
+        """Testa que concursos podados do início não reconstroem nem reduzem o atraso máximo."""
+        draws = random_draws(300)
+        tracker = GapTracker()
+        tracker.sync(draws[:250])
+
+        assert tracker.sync(draws[100:250]) == "unchanged"
+        assert tracker.sync(draws[100:]) == "incremental"
+
+        expected = GapTracker()
+        expected.rebuild(draws)
+        assert tracker.to_list() == expected.to_list()
+        assert tracker.draws == 300
+
+    def test_service_notifies_on_ingest(self, service, mocker, random_draws):
+        """Testa que a ingestão atualiza os índices fora do caminho da requisição."""
+        analytics = AnalyticsService(service)
+        draws = random_draws(5)
+        mocker.patch.object(service, "_load_fresh_data", return_value=draws)
+
+        service.get_processed_data(force_refresh=True)
+
+        assert analytics.gaps.draws == 5
+        assert len(analytics.cooccurrence) == 5
+
+
+class TestGapsEndpoint:
+    """Testes do endpoint /api/analytics/gaps."""
+
+    def test_get_gaps_sorted_by_current(self, client, mocker, mock_normalized_data):
+        """Testa a ordenação pelo maior atraso atual."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.get("/api/analytics/gaps?sort=current")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["draws"] == 3
+        assert data["latest_contest"] == 2650
+        assert len(data["numbers"]) == 60
+        assert data["numbers"][0]["current_gap"] == 3
+        assert data["numbers"][0]["last_contest"] is None
+
+    def test_get_gaps_invalid_sort(self, client):
+        """Testa a validação da ordenação."""
+        response = client.get("/api/analytics/gaps?sort=foo")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,87 @@
+"""
+Testes do launcher multi-worker e do dataset compartilhado.
+"""
+
+import os
+import random
+
+from app.launcher import Supervisor, resolve_workers, worker_max_requests
+from app.utils.shared_dataset import SHARED_DATASET_ENV, publish_dataset, read_shared_dataset
+
+
+class TestSharedDataset:
+    """Testes da publicação do dataset em memória compartilhada."""
+
+    def test_publish_and_read(self, monkeypatch, mock_normalized_data):
+        """Testa que o worker lê o dataset publicado pelo launcher."""
+        monkeypatch.delenv(SHARED_DATASET_ENV, raising=False)
+        dataset = {
+            "processed_data": mock_normalized_data,
+            "estimate": {"sorte": [1, 2, 3, 4, 5, 6]},
+        }
+
+        segment = publish_dataset(dataset)
+        try:
+            assert read_shared_dataset() == dataset
+        finally:
+            segment.close()
+            segment.unlink()
+            monkeypatch.delenv(SHARED_DATASET_ENV, raising=False)
+
+    def test_no_dataset_published(self, monkeypatch):
+        """Testa a ausência de dataset compartilhado."""
+        monkeypatch.delenv(SHARED_DATASET_ENV, raising=False)
+
+        assert read_shared_dataset() is None
+
+    def test_missing_segment(self):
+        """Testa um segmento que não existe mais."""
+        assert read_shared_dataset("mega-sena-missing-segment") is None
+
+    def test_service_warmup_uses_shared_dataset(self, service, mocker, mock_normalized_data):
+        """Testa que o warmup não acessa a API externa quando há dataset compartilhado."""
+        mocker.patch(
+            "app.services.mega_sena_service.read_shared_dataset",
+            return_value={"processed_data": mock_normalized_data, "estimate": None},
+        )
+        fetch = mocker.patch.object(service, "fetch_historical_data")
+
+        assert service.load_shared_dataset() == len(mock_normalized_data)
+        assert service.get_processed_data() == mock_normalized_data
+        fetch.assert_not_called()
+
+
+class TestLauncher:
+    """Testes das regras do launcher."""
+
+    def test_resolve_workers(self):
+        """Testa que 0 workers significa um por núcleo."""
+        assert resolve_workers(3) == 3
+        assert resolve_workers(0) >= 1
+
+    def test_max_requests_with_jitter(self):
+        """Testa o limite de reciclagem com jitter."""
+        rng = random.Random(1)
+        limits = {worker_max_requests(1000, 100, rng) for _ in range(20)}
+
+        assert all(1000 <= limit <= 1100 for limit in limits)
+        assert len(limits) > 1
+
+    def test_recycling_disabled(self):
+        """Testa que 0 desabilita a reciclagem."""
+        assert worker_max_requests(0, 100, random.Random()) is None
+
+    def test_only_first_generation_reads_shared_dataset(self, mocker, monkeypatch):
+        """Testa que workers substitutos não recebem o snapshot publicado no launch."""
+        monkeypatch.delenv(SHARED_DATASET_ENV, raising=False)
+        seen = []
+        process = mocker.Mock()
+        process.start.side_effect = lambda: seen.append(os.environ.get(SHARED_DATASET_ENV))
+        mocker.patch("app.launcher._context.Process", return_value=process)
+        supervisor = Supervisor(workers=2, host="127.0.0.1", port=0, shared_dataset="segment-1")
+
+        supervisor._spawn(first_generation=True)
+        supervisor._spawn(first_generation=True)
+        supervisor._spawn()
+
+        assert seen == ["segment-1", "segment-1", None]
@@ -0,0 +1,121 @@
+"""
+Testes para o profiler por amostragem e endpoints administrativos.
+"""
+
+import threading
+import time
+
+from fastapi import status
+
+from app.config import settings
+from app.utils.profiler import SamplingProfiler, ProfileStore
+
+
+def busy_loop(stop_event):
+    """Função ocupada usada como alvo da amostragem."""
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler:
+    """Testes para a classe SamplingProfiler."""
+
+    def test_collects_samples_from_other_threads(self):
+        """Testa que pilhas de outras threads são amostradas."""
+        stop_event = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop_event,), name="busy-worker")
+        worker.start()
+
+        with SamplingProfiler(interval=0.001) as profiler:
+            time.sleep(0.1)
+
+        stop_event.set()
+        worker.join()
+
+        assert profiler.sample_count > 0
+        collapsed = profiler.collapsed()
+        assert any(
+            line.startswith("busy-worker;") and "busy_loop" in line
+            for line in collapsed.splitlines()
+        )
+
+    def test_speedscope_export(self):
+        """Testa a estrutura do JSON do speedscope."""
+        stop_event = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop_event,), name="busy-worker")
+        worker.start()
+
+        with SamplingProfiler(interval=0.001) as profiler:
+            time.sleep(0.05)
+
+        stop_event.set()
+        worker.join()
+
+        result = profiler.speedscope()
+        assert result["shared"]["frames"]
+        profile = next(p for p in result["profiles"] if p["name"] == "busy-worker")
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert profile["endValue"] == sum(profile["weights"])
+
+    def test_profile_store_evicts_oldest(self):
+        """Testa que o armazenamento mantém apenas os perfis mais recentes."""
+        store = ProfileStore(max_profiles=2)
+        first = store.add(SamplingProfiler())
+        store.add(SamplingProfiler())
+        store.add(SamplingProfiler())
+
+        assert store.get(first) is None
+        assert len(store.list()) == 2
+
+
+class TestAdminProfileEndpoint:
+    """Testes para os endpoints /api/admin/profile."""
+
+    def test_admin_disabled_without_token(self, client, mocker):
+        """Testa que os endpoints ficam desabilitados sem token configurado."""
+        mocker.patch.object(settings, "admin_token", None)
+
+        response = client.get("/api/admin/profile?seconds=0.01")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_admin_rejects_invalid_token(self, client, mocker):
+        """Testa rejeição de token inválido."""
+        mocker.patch.object(settings, "admin_token", "secret")
+
+        response = client.get("/api/admin/profile?seconds=0.01", headers={"X-Admin-Token": "wrong"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_profile_worker_speedscope(self, client, mocker):
+        """Testa perfil do worker em formato speedscope."""
+        mocker.patch.object(settings, "admin_token", "secret")
+
+        response = client.get(
+            "/api/admin/profile?seconds=0.05&format=speedscope&interval_ms=1",
+            headers={"X-Admin-Token": "secret"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "profiles" in response.json()
+
+    def test_request_profile_header(self, client, mocker):
+        """Testa perfil por requisição via header X-Profile."""
+        mocker.patch.object(settings, "admin_token", "secret")
+        headers = {"X-Admin-Token": "secret", "X-Profile": "1"}
+
+        response = client.get("/api/stats", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        profile_id = response.headers["X-Profile-Id"]
+
+        response = client.get(f"/api/admin/profile/requests/{profile_id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_request_profile_ignored_without_token(self, client, mocker):
+        """Testa que X-Profile sem token válido não gera perfil."""
+        mocker.patch.object(settings, "admin_token", "secret")
+
+        response = client.get("/api/stats", headers={"X-Profile": "1"})
+
+        assert "X-Profile-Id" not in response.headers
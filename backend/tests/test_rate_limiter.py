@@ -0,0 +1,241 @@
+"""
+Testes para o rate limiter GCRA.
+"""
+
+import threading
+
+import pytest
+from fastapi import status
+
+from app.exceptions import RateLimitExceededError
+from app.utils.rate_limiter import (
+    MemoryRateLimitBackend,
+    RateLimit,
+    RateLimiter,
+    RedisRateLimitBackend,
+)
+
+
+class CountingBackend(MemoryRateLimitBackend):
+    """Backend em memória que conta as reservas."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def reserve(self, key, limit, tokens):
+        self.calls += 1
+        return super().reserve(key, limit, tokens)
+
+
+class TestMemoryRateLimitBackend:
+    """Testes para o GCRA em memória."""
+
+    def test_allows_burst_up_to_limit(self):
+        """Testa que a rajada inicial é igual ao limite."""
+        backend = MemoryRateLimitBackend()
+        limit = RateLimit("test", 5)
+
+        granted = [backend.reserve("client", limit, 1)[0] for _ in range(6)]
+
+        assert granted == [1, 1, 1, 1, 1, 0]
+
+    def test_retry_after_when_exhausted(self):
+        """Testa o tempo de espera quando o limite é atingido."""
+        backend = MemoryRateLimitBackend()
+        limit = RateLimit("test", 60)
+
+        assert backend.reserve("client", limit, 60)[0] == 60
+        granted, retry_after = backend.reserve("client", limit, 1)
+
+        assert granted == 0
+        # Tolerância para o arredondamento de ponto flutuante
+        assert 0 < retry_after <= 1.0 + 1e-6
+
+    def test_partial_batch(self):
+        """Testa que um lote maior que o saldo recebe apenas o disponível."""
+        backend = MemoryRateLimitBackend()
+        limit = RateLimit("test", 3)
+
+        assert backend.reserve("client", limit, 10)[0] == 3
+
+
+class TestRateLimiter:
+    """Testes para o RateLimiter com pré-reserva local."""
+
+    def test_prefetch_reduces_backend_calls(self):
+        """Testa que os tokens reservados são consumidos localmente."""
+        backend = CountingBackend()
+        limiter = RateLimiter(backend, prefetch=5, lease_seconds=60)
+        limit = RateLimit("test", 600)
+
+        for _ in range(10):
+            limiter.hit(limit, "client")
+
+        assert backend.calls == 2
+
+    def test_tight_limits_do_not_prefetch(self):
+        """Testa que limites baixos reservam um token por vez."""
+        backend = CountingBackend()
+        limiter = RateLimiter(backend, prefetch=5, lease_seconds=5)
+        limit = RateLimit("test", 10)
+
+        for _ in range(3):
+            limiter.hit(limit, "client")
+
+        assert backend.calls == 3
+
+    def test_default_limits_prefetch_over_lease_window(self):
+        """Testa que o lote é o que o limite repõe durante a reserva."""
+        limiter = RateLimiter(MemoryRateLimitBackend(), prefetch=5, lease_seconds=5)
+
+        assert limiter._batch_size(RateLimit("test", 60)) == 5
+        assert limiter._batch_size(RateLimit("test", 24)) == 2
+        assert limiter._batch_size(RateLimit("test", 2)) == 1
+
+    def test_raises_when_exceeded(self):
+        """Testa a exceção com retry_after quando o limite é excedido."""
+        limiter = RateLimiter(MemoryRateLimitBackend())
+        limit = RateLimit("test", 2)
+
+        limiter.hit(limit, "client")
+        limiter.hit(limit, "client")
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.hit(limit, "client")
+
+        assert exc_info.value.retry_after >= 1
+
+    def test_falls_back_when_backend_fails(self):
+        """Testa o fallback local quando o backend compartilhado falha."""
+
+        class BrokenBackend(MemoryRateLimitBackend):
+            def reserve(self, key, limit, tokens):
+                raise ConnectionError("down")
+
+        limiter = RateLimiter(BrokenBackend())
+        limiter.hit(RateLimit("test", 1), "client")
+
+        with pytest.raises(RateLimitExceededError):
+            limiter.hit(RateLimit("test", 1), "client")
+
+    def test_backend_cooldown_after_failure(self):
+        """Testa que, após uma falha, o backend só é consultado de novo depois do cooldown."""
+
+        class BrokenBackend(CountingBackend):
+            def reserve(self, key, limit, tokens):
+                super().reserve(key, limit, tokens)
+                raise ConnectionError("down")
+
+        backend = BrokenBackend()
+        limiter = RateLimiter(backend, cooldown_seconds=60)
+        for _ in range(3):
+            limiter.hit(RateLimit("test", 10), "client")
+
+        assert backend.calls == 1
+
+        limiter._backend_down_until = 0.0
+        limiter.hit(RateLimit("test", 10), "client")
+        assert backend.calls == 2
+
+    async def test_blocking_backend_runs_off_event_loop(self):
+        """Testa que a ida ao Redis não roda na thread do event loop."""
+        loop_thread = threading.current_thread()
+        threads = []
+
+        class RemoteBackend(MemoryRateLimitBackend):
+            blocking = True
+
+            def reserve(self, key, limit, tokens):
+                threads.append(threading.current_thread())
+                return super().reserve(key, limit, tokens)
+
+        limiter = RateLimiter(RemoteBackend())
+        await limiter.ahit(RateLimit("test", 10), "client")
+
+        assert threads and threads[0] is not loop_thread
+
+
+class TestRedisRateLimitBackend:
+    """Testes para o GCRA no Redis (via fakeredis)."""
+
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        import redis
+
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server)
+        )
+        return RedisRateLimitBackend("redis://fakeredis")
+
+    def test_shared_state_in_redis(self, backend):
+        """Testa que a reserva em lote respeita o limite global."""
+        limit = RateLimit("test", 5)
+
+        assert backend.reserve("client", limit, 3) == (3, 0.0)
+        assert backend.reserve("client", limit, 3)[0] == 2
+        granted, retry_after = backend.reserve("client", limit, 1)
+
+        assert granted == 0
+        assert retry_after > 0
+
+
+class TestRateLimitedRoutes:
+    """Testes de integração do rate limiting nas rotas."""
+
+    def test_cache_clear_is_limited(self, client):
+        """Testa que /api/cache/clear retorna 429 com Retry-After."""
+        responses = [client.post("/api/cache/clear") for _ in range(3)]
+
+        assert [r.status_code for r in responses[:2]] == [status.HTTP_200_OK] * 2
+        assert responses[2].status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in responses[2].headers
+        assert responses[2].json()["error_code"] == "RATE_LIMIT_EXCEEDED"
+
+    def test_uncached_estimate_has_tighter_limit(self, client, mocker):
+        """Testa que estimativas sem cache usam o limite restrito."""
+        mocker.patch(
+            "app.routes.api.service.get_estimate",
+            return_value={
+                "data": "2024-01-15",
+                "quadra": [5, 12, 23, 45],
+                "quina": [5, 12, 23, 45, 58],
+                "sorte": [5, 12, 23, 45, 58, 60],
+            },
+        )
+        mocker.patch("app.routes.api.service.is_estimate_cached", return_value=False)
+        mocker.patch("app.routes.api.settings.rate_limit_uncached_per_minute", 2)
+
+        codes = [client.get("/api/estimate").status_code for _ in range(3)]
+
+        assert codes == [200, 200, 429]
+
+    def test_uncached_predicate_runs_off_event_loop(self, client, mocker):
+        """Testa que a consulta ao cache do predicado não roda na thread do event loop."""
+        threads = []
+
+        def is_estimate_cached():
+            threads.append(threading.current_thread())
+            return True
+
+        mocker.patch("app.routes.api.service.is_estimate_cached", side_effect=is_estimate_cached)
+        mocker.patch("app.routes.api.service.get_estimate", side_effect=RuntimeError("stop"))
+
+        client.get("/api/estimate")
+
+        assert threads and threads[0].name.startswith("asyncio_")
+
+    def test_backtest_has_its_own_bucket(self, client, mocker, mock_normalized_data):
+        """Testa que o backtest esgota apenas o próprio limite, não o das demais análises."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+        mocker.patch("app.routes.analytics.settings.rate_limit_backtest_per_minute", 1)
+
+        codes = [client.get("/api/analytics/backtest?windows=2").status_code for _ in range(2)]
+
+        assert codes == [200, 429]
+        assert client.get("/api/analytics/gaps").status_code == 200
@@ -0,0 +1,148 @@
+"""
+Testes do agendador de atualização baseado no calendário de sorteios.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from app.services.refresh_scheduler import BRASILIA_TZ, DrawSchedule, RefreshScheduler
+from app.utils.draw import Draw
+
+
+def brt(year, month, day, hour, minute=0) -> datetime:
+    """Cria um datetime no horário de Brasília."""
+    return datetime(year, month, day, hour, minute, tzinfo=BRASILIA_TZ)
+
+
+class TestDrawSchedule:
+    """Testes do calendário de sorteios."""
+
+    def test_inside_window_on_draw_day(self):
+        """Testa que a noite de sorteio está dentro da janela."""
+        schedule = DrawSchedule()
+
+        # 2024-01-16 é uma terça-feira
+        assert schedule.current_window(brt(2024, 1, 16, 21)) is not None
+        assert schedule.current_window(brt(2024, 1, 16, 19, 50)) is not None
+
+    def test_outside_window(self):
+        """Testa horários fora da janela."""
+        schedule = DrawSchedule()
+
+        assert schedule.current_window(brt(2024, 1, 16, 12)) is None
+        # Quarta-feira não tem sorteio regular
+        assert schedule.current_window(brt(2024, 1, 17, 20)) is None
+
+    def test_window_crossing_midnight(self):
+        """Testa que a janela continua após a meia-noite."""
+        schedule = DrawSchedule(window_after=timedelta(hours=6))
+
+        assert schedule.current_window(brt(2024, 1, 17, 1)) is not None
+
+    def test_next_window_start(self):
+        """Testa o início da próxima janela."""
+        schedule = DrawSchedule(window_before=timedelta(minutes=15))
+
+        # Quarta ao meio-dia -> quinta às 19:45
+        assert schedule.next_window_start(brt(2024, 1, 17, 12)) == brt(2024, 1, 18, 19, 45)
+        # Sábado à noite -> terça às 19:45
+        assert schedule.next_window_start(brt(2024, 1, 20, 21)) == brt(2024, 1, 23, 19, 45)
+
+    def test_handles_utc_input(self):
+        """Testa que horários em UTC são convertidos."""
+        schedule = DrawSchedule()
+
+        # 23:30 UTC = 20:30 em Brasília
+        assert (
+            schedule.current_window(datetime(2024, 1, 16, 23, 30, tzinfo=timezone.utc)) is not None
+        )
+
+    def test_poll_interval_inside_window(self):
+        """Testa que dentro da janela usa o intervalo de consulta."""
+        schedule = DrawSchedule()
+
+        assert schedule.seconds_until_next_check(brt(2024, 1, 16, 21), 300, 21600) == 300
+
+    def test_sleeps_until_window_capped_by_safety(self):
+        """Testa que fora da janela dorme até ela, limitado pelo intervalo de segurança."""
+        schedule = DrawSchedule(window_before=timedelta(minutes=15))
+
+        assert schedule.seconds_until_next_check(brt(2024, 1, 18, 19), 300, 21600) == 45 * 60
+        assert schedule.seconds_until_next_check(brt(2024, 1, 17, 2), 300, 21600) == 21600
+
+
+class TestRefreshScheduler:
+    """Testes da detecção de novos concursos."""
+
+    def test_no_ingest_when_contest_unchanged(self):
+        """Testa que nada é buscado sem concurso novo."""
+        service = Mock()
+        service.fetch_latest_contest.return_value = 2700
+        service.get_latest_cached_contest.return_value = 2700
+
+        scheduler = RefreshScheduler(service)
+
+        assert scheduler.check_once() is False
+        service.ingest_new_draws.assert_not_called()
+
+    def test_ingest_on_new_contest(self):
+        """Testa a ingestão incremental quando há concurso novo."""
+        service = Mock()
+        service.fetch_latest_contest.return_value = 2701
+        service.get_latest_cached_contest.return_value = 2700
+        service.ingest_new_draws.return_value = 1
+
+        scheduler = RefreshScheduler(service)
+
+        assert scheduler.check_once() is True
+        service.ingest_new_draws.assert_called_once_with(2701)
+        assert scheduler.refreshes == 1
+
+    def test_upstream_error_is_recorded(self):
+        """Testa que falhas na consulta não interrompem o agendador."""
+        service = Mock()
+        service.fetch_latest_contest.side_effect = RuntimeError("down")
+
+        scheduler = RefreshScheduler(service)
+
+        assert scheduler.check_once() is False
+        assert scheduler.last_error == "down"
+
+
+class TestIncrementalIngest:
+    """Testes da ingestão incremental no serviço."""
+
+    def test_ingest_fetches_only_new_contests(self, service, mocker):
+        """Testa que apenas os concursos novos são buscados."""
+        today = datetime.now().strftime("%d/%m/%Y")
+        service.cache.set(
+            "mega_sena:processed_data",
+            [
+                Draw(2699, datetime.now().toordinal(), (1, 2, 3, 4, 5, 6)),
+                Draw(2700, datetime.now().toordinal(), (7, 8, 9, 10, 11, 12)),
+            ],
+        )
+        fetch = mocker.patch.object(
+            service,
+            "_fetch_single_draw",
+            side_effect=lambda num: {
+                "numero": num,
+                "dataApuracao": today,
+                "listaDezenas": ["13", "14", "15", "16", "17", "18"],
+            },
+        )
+
+        assert service.ingest_new_draws(2701) == 1
+
+        fetch.assert_called_once()
+        assert fetch.call_args[0][0] == 2701
+        assert service.get_latest_cached_contest() == 2701
+        assert service.cache.get("mega_sena:estimate") is not None
+
+    def test_ingest_without_cache_runs_full_load(self, service, mocker, mock_normalized_data):
+        """Testa a carga completa quando não há dados em cache."""
+        full = mocker.patch.object(service, "get_processed_data", return_value=mock_normalized_data)
+        mocker.patch.object(service, "get_estimate")
+
+        assert service.ingest_new_draws(2701) == len(mock_normalized_data)
+        full.assert_any_call(force_refresh=True)
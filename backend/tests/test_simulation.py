@@ -0,0 +1,128 @@
+"""
+Testes da simulação Monte Carlo das estratégias.
+"""
+
+import threading
+import time
+
+import numpy as np
+from fastapi import status
+
+from app.analytics.simulation import run_simulation, sample_draws, theoretical_distribution
+from app.services.analytics_service import AnalyticsService
+
+
+class TestSimulation:
+    """Testes da simulação de Monte Carlo."""
+
+    def test_samples_are_valid_draws(self):
+        """Testa que cada sorteio tem 6 dezenas distintas entre 0 e 59."""
+        drawn = sample_draws(np.random.default_rng(1), 1000)
+
+        assert drawn.shape == (1000, 6)
+        assert drawn.min() >= 0 and drawn.max() <= 59
+        assert all(len(set(row)) == 6 for row in drawn.tolist())
+
+    def test_distribution_matches_theory(self):
+        """Testa que a frequência de acertos converge para a hipergeométrica."""
+        draws = 200_000
+        counts = run_simulation([[1, 2, 3, 4, 5, 6]], draws, seed=3, chunk_size=50_000)
+
+        assert counts.shape == (2, 7)
+        assert (counts.sum(axis=1) == draws).all()
+        theory = theoretical_distribution()
+        for row in counts:
+            for k in range(3):
+                assert abs(row[k] / draws - theory[k]) < 0.005
+
+    def test_reproducible_and_sharded(self):
+        """Testa que a semente fixa o resultado e que as fatias somam o total."""
+        tickets = [[1, 2, 3, 4, 5, 6], [10, 20, 30, 40, 50, 60]]
+
+        first = run_simulation(tickets, 5000, seed=9)
+        assert np.array_equal(first, run_simulation(tickets, 5000, seed=9))
+
+        sharded = run_simulation(tickets, 5000, seed=9, workers=2)
+        assert (sharded.sum(axis=1) == 5000).all()
+
+    def test_service_runs_job_in_background(self, service, mocker, mock_normalized_data):
+        """Testa o job em background e o reaproveitamento do resultado em cache."""
+        mocker.patch("app.services.analytics_service.settings.simulation_workers", 1)
+        mocker.patch.object(service, "get_processed_data", return_value=mock_normalized_data[::-1])
+        analytics = AnalyticsService(service)
+
+        job = analytics.submit_simulation(2000, seed=1)
+        deadline = time.monotonic() + 10
+        while analytics.get_simulation(job["id"])["status"] in ("pending", "running"):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        finished = analytics.get_simulation(job["id"])
+        assert finished["status"] == "done"
+        names = [item["name"] for item in finished["result"]["strategies"]]
+        assert names == [*service.strategy_names(), "random"]
+        assert {5, 12, 23, 45, 58} <= set(finished["params"]["strategies"]["frequency"])
+
+        # Outro worker encontra o resultado pelo cache
+        other = AnalyticsService(service)
+        assert other.submit_simulation(2000, seed=1)["status"] == "done"
+        assert other.get_simulation(job["id"])["result"] == finished["result"]
+        analytics.close()
+
+    def test_concurrent_submissions_schedule_one_job(self, service, mocker, mock_normalized_data):
+        """Testa que submissões idênticas simultâneas não duplicam o job."""
+        mocker.patch.object(service, "get_processed_data", return_value=mock_normalized_data[::-1])
+        analytics = AnalyticsService(service)
+        run = mocker.patch.object(analytics, "_run_simulation")
+        # Alarga a janela entre a primeira consulta e o agendamento
+        lookup = service.cache.get
+        mocker.patch.object(
+            service.cache, "get", side_effect=lambda key: time.sleep(0.05) or lookup(key)
+        )
+
+        barrier = threading.Barrier(4)
+
+        def submit():
+            barrier.wait()
+            return analytics.submit_simulation(2000, seed=3)
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        analytics._executor.shutdown(wait=True)
+
+        assert run.call_count == 1
+
+
+class TestSimulationEndpoint:
+    """Testes dos endpoints /api/analytics/simulations."""
+
+    def test_submit_and_poll(self, client, mocker, mock_normalized_data):
+        """Testa o agendamento (202) e a consulta do job."""
+        mocker.patch("app.services.analytics_service.settings.simulation_workers", 1)
+        mocker.patch(
+            "app.routes.api.service.get_processed_data",
+            return_value=sorted(mock_normalized_data, key=lambda draw: draw.contest),
+        )
+
+        response = client.post("/api/analytics/simulations?draws=1000&seed=12345")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job_id = response.json()["id"]
+        assert client.get(f"/api/analytics/simulations/{job_id}").status_code == status.HTTP_200_OK
+
+    def test_rejects_too_many_draws(self, client, mocker):
+        """Testa o limite de sorteios por simulação."""
+        mocker.patch("app.routes.analytics.settings.simulation_max_draws", 5000)
+
+        response = client.post("/api/analytics/simulations?draws=10000")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_job(self, client):
+        """Testa a consulta de um job inexistente."""
+        response = client.get("/api/analytics/simulations/unknown")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
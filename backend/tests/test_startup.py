@@ -0,0 +1,120 @@
+"""
+Testes do estado de inicialização e dos endpoints de liveness/readiness.
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from app.utils.startup import StartupPhase, StartupState, get_startup_state
+
+
+def wait_for_phase(phase: str, timeout: float = 2.0) -> None:
+    """Aguarda o estado global atingir a fase informada."""
+    deadline = time.perf_counter() + timeout
+    while get_startup_state().phase != phase and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+
+class TestStartupState:
+    """Testes do StartupState."""
+
+    def test_initial_state_is_not_ready(self):
+        """Testa que o estado inicial não está pronto."""
+        state = StartupState()
+
+        assert state.phase == StartupPhase.STARTING
+        assert state.is_ready() is False
+
+    def test_steps_record_duration_and_details(self):
+        """Testa o registro de etapas concluídas."""
+        state = StartupState()
+
+        state.begin("processed_data")
+        state.end("processed_data", draws=10)
+
+        step = state.to_dict()["steps"]["processed_data"]
+        assert step["status"] == "ok"
+        assert step["draws"] == 10
+        assert step["duration_ms"] >= 0
+
+    def test_failed_step_sets_last_error(self):
+        """Testa o registro de falhas."""
+        state = StartupState()
+
+        state.begin("estimate")
+        state.fail("estimate", RuntimeError("boom"))
+
+        data = state.to_dict()
+        assert data["steps"]["estimate"]["status"] == "error"
+        assert data["last_error"] == "estimate: boom"
+
+    def test_ready_clears_last_error(self):
+        """Testa que ficar pronto limpa o último erro."""
+        state = StartupState()
+        state.fail("estimate", RuntimeError("boom"))
+
+        state.set_phase(StartupPhase.READY)
+
+        data = state.to_dict()
+        assert data["ready"] is True
+        assert data["ready_at"] is not None
+        assert data["last_error"] is None
+
+
+class TestHealthEndpoints:
+    """Testes dos endpoints de liveness e readiness."""
+
+    def test_liveness_does_not_depend_on_warmup(self, client):
+        """Testa que liveness responde mesmo sem warmup."""
+        get_startup_state().reset()
+
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+
+    def test_readiness_is_503_before_warmup(self, client):
+        """Testa que readiness retorna 503 antes do warmup."""
+        get_startup_state().reset()
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+        assert response.json()["phase"] == StartupPhase.STARTING
+
+    def test_readiness_after_successful_warmup(self, mocker, mock_normalized_data):
+        """Testa que o worker fica pronto após o warmup."""
+        from app.main import app
+
+        mocker.patch("app.routes.api.service.get_processed_data", return_value=mock_normalized_data)
+
+        with TestClient(app) as client:
+            wait_for_phase(StartupPhase.READY)
+            response = client.get("/health/ready")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["draws_loaded"] == len(mock_normalized_data)
+        assert "estimate" in data["artifacts"]
+        assert data["steps"]["cache_connect"]["status"] == "ok"
+        assert data["steps"]["processed_data"]["status"] == "ok"
+
+    def test_readiness_degraded_when_warmup_fails(self, mocker):
+        """Testa que falhas no warmup mantêm o worker fora do balanceamento."""
+        from app.main import app
+
+        mocker.patch(
+            "app.routes.api.service.get_processed_data", side_effect=RuntimeError("upstream down")
+        )
+
+        with TestClient(app) as client:
+            wait_for_phase(StartupPhase.DEGRADED)
+            response = client.get("/health/ready")
+
+        data = response.json()
+        assert response.status_code == 503
+        assert data["phase"] == StartupPhase.DEGRADED
+        assert data["warmup_attempts"] >= 1
+        assert "upstream down" in data["last_error"]
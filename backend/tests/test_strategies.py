@@ -0,0 +1,96 @@
+"""
+Testes das estratégias de estimativa.
+"""
+
+from fastapi import status
+
+from app.analytics.gaps import GapTracker
+from app.analytics.strategies import STRATEGIES, build_features, compute_estimates
+from app.services import mega_sena_service
+from app.utils.data_processor import calculate_frequencies, generate_estimates
+
+
+class TestStrategies:
+    """Testes do registro de estratégias de estimativa."""
+
+    def test_frequency_matches_generate_estimates(self, mock_normalized_data, random_draws):
+        """Testa que a estratégia padrão reproduz generate_estimates (inclusive empates)."""
+        for draws in (mock_normalized_data, random_draws(40)):
+            expected = generate_estimates(calculate_frequencies(draws))
+
+            assert compute_estimates(build_features(draws))["frequency"] == expected
+
+    def test_gap_and_cold(self, random_draws):
+        """Testa as estratégias de atraso e de dezenas frias."""
+        draws = random_draws(200)
+        features = build_features(draws)
+        tracker = GapTracker()
+        tracker.rebuild(draws)
+        frequencies = calculate_frequencies(draws)
+
+        assert features.current_gap.tolist() == [tracker.current_gap(n) for n in range(1, 61)]
+        result = compute_estimates(build_features(draws))
+        assert result["gap"]["sorte"] == sorted(
+            sorted(range(1, 61), key=lambda n: (-tracker.current_gap(n), n))[:6]
+        )
+        assert result["cold"]["sorte"] == sorted(
+            sorted(range(1, 61), key=lambda n: (frequencies[n], n))[:6]
+        )
+
+    def test_recency_prefers_recent_draws(self, make_draw):
+        """Testa que a frequência ponderada favorece os concursos recentes."""
+        old, recent = (1, 2, 3, 4, 5, 6), (7, 8, 9, 10, 11, 12)
+        draws = [make_draw(n, old) for n in range(1, 4)]
+        draws += [make_draw(n, (13, 14, 15, 16, 17, 18)) for n in range(4, 200)]
+        draws += [make_draw(n, recent) for n in range(200, 202)]
+        features = build_features(draws)
+
+        assert features.counts[0] > features.counts[6]
+        assert STRATEGIES["recency"](features)[6] > STRATEGIES["recency"](features)[0]
+
+    def test_estimates_computed_once(self, service, mocker, mock_normalized_data):
+        """Testa que todas as estratégias saem de um único cálculo em cache."""
+        mocker.patch.object(service, "get_processed_data", return_value=mock_normalized_data)
+        spy = mocker.spy(mega_sena_service, "compute_estimates")
+
+        results = [service.get_estimate(name) for name in STRATEGIES]
+
+        assert spy.call_count == 1
+        assert [result["strategy"] for result in results] == list(STRATEGIES)
+        assert (
+            results[0]["sorte"]
+            == generate_estimates(calculate_frequencies(mock_normalized_data))["sorte"]
+        )
+
+
+class TestEstimateStrategyEndpoint:
+    """Testes do parâmetro `strategy` de /api/estimate."""
+
+    def test_get_estimate_by_strategy(self, client, mocker, mock_normalized_data):
+        """Testa a escolha de uma estratégia pré-calculada."""
+        mocker.patch("app.routes.api.service.get_processed_data", return_value=mock_normalized_data)
+
+        response = client.get("/api/estimate?strategy=cold")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["strategy"] == "cold"
+        assert 23 not in data["sorte"]
+
+    def test_get_decayed_estimate(self, client, mocker, mock_normalized_data):
+        """Testa a estimativa por frequências com decaimento."""
+        mocker.patch(
+            "app.routes.api.service.get_processed_data", return_value=mock_normalized_data[::-1]
+        )
+
+        response = client.get("/api/estimate?strategy=decay_90")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {23, 45, 58} <= set(response.json()["sorte"])
+
+    def test_unknown_strategy(self, client):
+        """Testa a rejeição de estratégias não registradas."""
+        response = client.get("/api/estimate?strategy=magic")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error_code"] == "INVALID_STRATEGY"
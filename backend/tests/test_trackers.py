@@ -0,0 +1,105 @@
+"""
+Testes comuns aos acumuladores incrementais sobre os concursos.
+"""
+
+import numpy as np
+import pytest
+
+from app.analytics.cooccurrence import CooccurrenceIndex
+from app.analytics.decay import DecayedFrequencies
+from app.analytics.features import FeatureTable
+from app.analytics.gaps import GapTracker
+from app.analytics.window import SlidingWindowFeatures
+
+
+def _window_state(window):
+    features = window.features()
+    return {
+        "counts": features.counts,
+        "current_gap": features.current_gap,
+        "recency": features.recency,
+    }
+
+
+# Nome -> (fábrica, estado comparável como arrays)
+TRACKERS = {
+    "gaps": (
+        GapTracker,
+        lambda gaps: {
+            "current": gaps.current,
+            "max_gap": gaps.max_gap,
+            "last_contest": gaps.last_contest,
+        },
+    ),
+    "window": (SlidingWindowFeatures, _window_state),
+    "decay": (lambda: DecayedFrequencies([30, 180]), lambda decay: decay.strategy_scores()),
+    "features": (FeatureTable, lambda table: table.window()),
+    "cooccurrence": (
+        CooccurrenceIndex,
+        lambda index: {"pairs": index.pairs, "triples": index.triples},
+    ),
+}
+
+# Acumuladores que descartam os concursos que saem da janela
+# (GapTracker mantém o histórico; ver test_gaps)
+SLIDING = ["window", "decay", "features", "cooccurrence"]
+
+# Acumuladores cujo `sync` informa o modo da atualização
+MODES = ["gaps", "window", "decay", "features"]
+
+
+def _assert_same_state(tracker, expected, state):
+    current, wanted = state(tracker), state(expected)
+    assert current.keys() == wanted.keys()
+    for name, values in wanted.items():
+        assert np.allclose(current[name], values), name
+
+
+class TestTrackers:
+    """Testes da atualização incremental contra a reconstrução completa."""
+
+    @pytest.mark.parametrize("name", list(TRACKERS))
+    def test_incremental_matches_rebuild(self, name, random_draws):
+        """Testa que somar os concursos novos equivale a recalcular tudo."""
+        factory, state = TRACKERS[name]
+        draws = random_draws(300)
+        tracker = factory()
+        tracker.sync(draws[:200])
+        tracker.sync(draws)
+
+        expected = factory()
+        expected.sync(draws)
+        _assert_same_state(tracker, expected, state)
+
+    @pytest.mark.parametrize("name", SLIDING)
+    def test_sliding_matches_rebuild(self, name, random_draws):
+        """Testa que subtrair os concursos que saem da janela equivale a recalcular."""
+        factory, state = TRACKERS[name]
+        draws = random_draws(300)
+        tracker = factory()
+        tracker.sync(draws[:200])
+
+        for start in (1, 20, 21, 80):
+            tracker.sync(draws[start : start + 200])
+
+            expected = factory()
+            expected.sync(draws[start : start + 200])
+            _assert_same_state(tracker, expected, state)
+
+    @pytest.mark.parametrize("name", MODES)
+    def test_sync_modes(self, name, random_draws):
+        """Testa quando o estado é estendido, mantido ou reconstruído."""
+        factory, state = TRACKERS[name]
+        draws = random_draws(50)
+        tracker = factory()
+
+        assert tracker.sync([]) == "unchanged"
+        assert tracker.sync(draws[:40]) == "rebuild"
+        assert tracker.sync(draws) == "incremental"
+        assert tracker.sync(draws) == "unchanged"
+        # Dados que não continuam os concursos incorporados
+        assert tracker.sync(draws[:30]) == "rebuild"
+
+        expected = factory()
+        expected.sync(draws[:30])
+        _assert_same_state(tracker, expected, state)
@@ -0,0 +1,65 @@
+"""
+Testes da janela de frequências mantida de forma incremental.
+"""
+
+import numpy as np
+
+from app.analytics.strategies import build_features
+from app.analytics.window import SlidingWindowFeatures
+from app.services import mega_sena_service
+from app.utils.data_processor import calculate_frequencies, generate_estimates
+
+
+class TestSlidingWindowFeatures:
+    """Testes da janela de frequências mantida de forma incremental."""
+
+    def _assert_matches_scan(self, window, draws):
+        expected = build_features(draws)
+        current = window.features()
+        assert current.draws == expected.draws
+        assert current.counts.tolist() == expected.counts.tolist()
+        assert current.current_gap.tolist() == expected.current_gap.tolist()
+        assert np.allclose(current.recency, expected.recency)
+
+    def test_counts_change_by_draw(self, random_draws):
+        """Testa que um concurso novo soma 6 contagens e o que sai subtrai 6."""
+        draws = random_draws(11)
+        window = SlidingWindowFeatures()
+        window.sync(draws[:10])
+        before = window.counts.copy()
+
+        window.sync(draws[1:])
+
+        delta = window.counts - before
+        assert int(delta.sum()) == 0
+        assert sorted(np.flatnonzero(delta > 0).tolist()) == sorted(
+            set(n - 1 for n in draws[10].numbers) - set(n - 1 for n in draws[0].numbers)
+        )
+
+    def test_periodic_verification_repairs_drift(self, random_draws):
+        """Testa que a verificação periódica corrige um estado divergente."""
+        draws = random_draws(30)
+        window = SlidingWindowFeatures(verify_every=2)
+        window.sync(draws[:20])
+        window.counts[0] += 5
+
+        window.sync(draws[:21])
+        assert window.integrity_failures == 0
+        window.sync(draws[:22])
+
+        assert window.integrity_failures == 1
+        self._assert_matches_scan(window, draws[:22])
+
+    def test_service_updates_without_scan(self, service, mocker, random_draws):
+        """Testa que um concurso novo atualiza a estimativa sem varrer a janela."""
+        draws = random_draws(60)
+        data = mocker.patch.object(service, "get_processed_data", return_value=draws[:59])
+        service.get_estimate()
+        scan = mocker.spy(mega_sena_service.SlidingWindowFeatures, "rebuild")
+
+        data.return_value = draws[1:]
+        service.cache.delete("mega_sena:estimate")
+        result = service.get_estimate()
+
+        assert scan.call_count == 0
+        assert result["sorte"] == generate_estimates(calculate_frequencies(draws[1:]))["sorte"]
@@ -0,0 +1,3 @@
+"""
+Ferramentas de desenvolvimento: simulador da API da Caixa e teste de carga.
+"""
@@ -0,0 +1,287 @@
+"""
+Teste de carga ponta a ponta da API contra um upstream local.
+
+Sobe o simulador da API da Caixa, inicia a aplicação com uvicorn apontando
+para ele e dispara tráfego misto (estimativa, busca por data, limpeza de
+cache e cold starts) com concorrência configurável. Ao final, reporta RPS,
+p50/p95/p99, erros e chamadas ao upstream por cenário.
+
+Uso:
+    python -m tools.loadtest --concurrency 50 --duration 30 --workers 2
+    python -m tools.loadtest --scenarios warm,cold --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from tools.upstream_simulator import PAYLOAD_SHAPES, PROFILES, FaultProfile, UpstreamSimulator
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Pesos de cada tipo de requisição por cenário
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "warm": {"estimate": 70, "draw": 30},
+    "mixed": {"estimate": 60, "draw": 35, "cache_clear": 1, "cold_start": 4},
+    "cold": {"cold_start": 1},
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil pelo método do vizinho mais próximo."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class ScenarioResult:
+    """Acumula latências e erros de um cenário."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.elapsed = 0.0
+        self.upstream_calls: Dict[str, int] = {}
+
+    def record(self, kind: str, latency: float, ok: bool) -> None:
+        self.latencies[kind].append(latency)
+        if not ok:
+            self.errors[kind] += 1
+
+    def summary(self) -> Dict:
+        kinds = {}
+        for kind, values in sorted(self.latencies.items()):
+            kinds[kind] = {
+                "requests": len(values),
+                "rps": round(len(values) / self.elapsed, 2) if self.elapsed else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "errors": self.errors[kind],
+                "error_rate": round(self.errors[kind] / len(values), 4) if values else 0.0,
+            }
+
+        total = sum(len(values) for values in self.latencies.values())
+        return {
+            "scenario": self.name,
+            "duration_s": round(self.elapsed, 2),
+            "requests": total,
+            "rps": round(total / self.elapsed, 2) if self.elapsed else 0.0,
+            "upstream_calls": self.upstream_calls,
+            "kinds": kinds,
+        }
+
+
+class LoadTester:
+    """Dispara tráfego misto contra a API."""
+
+    def __init__(self, base_url: str, draw_dates: List[str], concurrency: int, seed: int = 7):
+        self.base_url = base_url
+        self.draw_dates = draw_dates
+        self.concurrency = concurrency
+        self.rng = random.Random(seed)
+
+    async def _request(self, client: httpx.AsyncClient, kind: str) -> bool:
+        if kind == "estimate":
+            response = await client.get("/api/estimate")
+        elif kind == "draw":
+            response = await client.get(f"/api/draw/{self.rng.choice(self.draw_dates)}")
+        elif kind == "cache_clear":
+            response = await client.post("/api/cache/clear")
+        elif kind == "cold_start":
+            await client.post("/api/cache/clear", params={"rewarm": "false"})
+            response = await client.get("/api/estimate")
+        else:
+            raise ValueError(f"Unknown request kind: {kind}")
+        return response.status_code < 400 or response.status_code == 404
+
+    async def run(
+        self, name: str, mix: Dict[str, int], duration: float, requests: Optional[int]
+    ) -> ScenarioResult:
+        result = ScenarioResult(name)
+        kinds = list(mix)
+        weights = [mix[kind] for kind in kinds]
+        deadline = time.perf_counter() + duration
+        remaining = [requests] if requests else None
+
+        async def worker(client: httpx.AsyncClient):
+            while time.perf_counter() < deadline:
+                if remaining is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+
+                kind = self.rng.choices(kinds, weights)[0]
+                start = time.perf_counter()
+                try:
+                    ok = await self._request(client, kind)
+                except httpx.HTTPError:
+                    ok = False
+                result.record(kind, time.perf_counter() - start, ok)
+
+        limits = httpx.Limits(
+            max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+        )
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=60, limits=limits) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(worker(client) for _ in range(self.concurrency)))
+            result.elapsed = time.perf_counter() - start
+
+        return result
+
+
+def start_app(
+    port: int, upstream_url: str, workers: int, cache_type: str, cache_ttl: int
+) -> subprocess.Popen:
+    """Inicia a aplicação com uvicorn apontando para o upstream local."""
+    env = dict(
+        os.environ,
+        MEGA_SENA_API_URL=upstream_url,
+        CACHE_TYPE=cache_type,
+        CACHE_TTL=str(cache_ttl),
+        LOG_LEVEL="WARNING",
+        RATE_LIMIT_ENABLED="false",
+    )
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+
+
+def wait_until_up(base_url: str, timeout: float = 60.0) -> None:
+    """Aguarda a aplicação terminar o warmup (/health/ready)."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health/ready", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Application did not start at {base_url}")
+
+
+def print_report(summaries: List[Dict]) -> None:
+    """Imprime o relatório em formato de tabela."""
+    header = f"{'kind':<12} {'reqs':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    for summary in summaries:
+        print(
+            f"\n== {summary['scenario']}: {summary['requests']} requests in "
+            f"{summary['duration_s']}s ({summary['rps']} rps)"
+        )
+        print(f"   upstream calls: {summary['upstream_calls']}")
+        print(header)
+        for kind, stats in summary["kinds"].items():
+            print(
+                f"{kind:<12} {stats['requests']:>7} {stats['rps']:>9} {stats['p50_ms']:>9} "
+                f"{stats['p95_ms']:>9} {stats['p99_ms']:>9} {stats['errors']:>7}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga da API Mega-Sena")
+    parser.add_argument(
+        "--scenarios",
+        default="warm,mixed,cold",
+        help=f"Cenários separados por vírgula ({', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=15.0, help="Duração de cada cenário (s)")
+    parser.add_argument(
+        "--requests", type=int, default=None, help="Limite de requisições por cenário"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Workers do uvicorn")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-type", default="memory")
+    parser.add_argument("--cache-ttl", type=int, default=3600)
+    parser.add_argument("--contests", type=int, default=2800)
+    parser.add_argument(
+        "--upstream-port", type=int, default=0, help="Porta do simulador (0 = aleatória)"
+    )
+    parser.add_argument(
+        "--upstream-profile",
+        choices=sorted(PROFILES),
+        default="ideal",
+        help="Perfil de latência/falhas do simulador",
+    )
+    parser.add_argument("--upstream-shape", choices=PAYLOAD_SHAPES, default="listaDezenas")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Usa uma aplicação já em execução, apontada para o simulador em --upstream-port",
+    )
+    parser.add_argument("--json", dest="json_path", default=None, help="Salva o relatório em JSON")
+    args = parser.parse_args(argv)
+
+    simulator = UpstreamSimulator(
+        port=args.upstream_port,
+        contests=args.contests,
+        shape=args.upstream_shape,
+        profile=FaultProfile(**PROFILES[args.upstream_profile]),
+    ).start()
+    draw_dates = [
+        datetime.strptime(draw["dataApuracao"], "%d/%m/%Y").strftime("%Y-%m-%d")
+        for draw in simulator.dataset[-180:]
+    ]
+
+    process = None
+    base_url = args.base_url
+    if base_url is None:
+        base_url = f"http://127.0.0.1:{args.port}"
+        process = start_app(args.port, simulator.url, args.workers, args.cache_type, args.cache_ttl)
+
+    try:
+        wait_until_up(base_url)
+        tester = LoadTester(base_url, draw_dates, args.concurrency)
+
+        summaries = []
+        for name in args.scenarios.split(","):
+            name = name.strip()
+            simulator.reset_stats()
+            result = asyncio.run(tester.run(name, SCENARIOS[name], args.duration, args.requests))
+            result.upstream_calls = simulator.stats()
+            summaries.append(result.summary())
+
+        print_report(summaries)
+
+        if args.json_path:
+            report = {
+                "timestamp": datetime.now().isoformat(),
+                "config": vars(args),
+                "scenarios": summaries,
+            }
+            Path(args.json_path).write_text(json.dumps(report, indent=2))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,559 @@
+"""
+Simulador local da API de loterias da Caixa (Mega-Sena).
+Serve os endpoints `megasena` e `megasena/{num}` com um conjunto de
+concursos sintéticos, para testes de carga sem acessar servicebus2.caixa.gov.br.
+
+Permite injetar latência com diferentes distribuições, rajadas de 429/5xx,
+throttling, timeouts e respostas lentas (slow drip), além de gravar
+respostas reais e reproduzi-las depois.
+
+Uso:
+    python -m tools.upstream_simulator --port 9000 --contests 2800
+    python -m tools.upstream_simulator --profile flaky --shape mixed --seed 1
+    python -m tools.upstream_simulator --profile-file perfil.json
+    python -m tools.upstream_simulator --record gravacao.json --upstream-url https://servicebus2.caixa.gov.br/portaldeloterias/api/megasena
+    python -m tools.upstream_simulator --replay gravacao.json
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+BASE_PATH = "/portaldeloterias/api/megasena"
+
+# Dias de sorteio da Mega-Sena: terça, quinta e sábado
+DRAW_WEEKDAYS = (1, 3, 5)
+
+# Formatos de payload aceitos por normalize_data
+PAYLOAD_SHAPES = ("listaDezenas", "dezenas", "mixed")
+
+
+def generate_dataset(
+    contests: int, seed: int = 2024, last_date: Optional[date] = None, shape: str = "listaDezenas"
+) -> List[Dict]:
+    """
+    Gera concursos sintéticos em ordem crescente, terminando em `last_date`.
+
+    Args:
+        contests: Quantidade de concursos
+        seed: Semente para geração determinística
+        last_date: Data do último concurso (padrão: último dia de sorteio até hoje)
+        shape: Formato das dezenas ('listaDezenas', 'dezenas' ou 'mixed')
+
+    Returns:
+        Lista de concursos no formato da API da Caixa
+    """
+    if shape not in PAYLOAD_SHAPES:
+        raise ValueError(f"Unknown payload shape: {shape}")
+
+    rng = random.Random(seed)
+    current = last_date or date.today()
+    while current.weekday() not in DRAW_WEEKDAYS:
+        current -= timedelta(days=1)
+
+    dates = []
+    while len(dates) < contests:
+        if current.weekday() in DRAW_WEEKDAYS:
+            dates.append(current)
+        current -= timedelta(days=1)
+    dates.reverse()
+
+    population = range(1, 61)
+    dataset = []
+    for num, draw_date in enumerate(dates, start=1):
+        numbers = [f"{n:02d}" for n in sorted(rng.sample(population, 6))]
+
+        if shape == "mixed":
+            key = "dezenas" if num % 2 else "listaDezenas"
+        else:
+            key = shape
+
+        draw: Dict[str, Any] = {
+            "numero": num,
+            "dataApuracao": draw_date.strftime("%d/%m/%Y"),
+            key: numbers,
+        }
+        if key == "dezenas":
+            # Formato legado: número do concurso em outro campo
+            draw["numeroConcurso"] = draw.pop("numero")
+        dataset.append(draw)
+
+    return dataset
+
+
+class LatencyDistribution:
+    """
+    Distribuição de latência em milissegundos.
+
+    Especificações aceitas:
+        none
+        fixed:MS
+        uniform:MIN:MAX
+        normal:MEAN:STD
+        lognormal:MEDIAN:SIGMA
+    """
+
+    def __init__(self, spec: str = "none"):
+        self.spec = spec
+        kind, *params = spec.split(":")
+        self.kind = kind
+        self.params = [float(p) for p in params]
+
+        expected = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if kind not in expected or len(self.params) != expected[kind]:
+            raise ValueError(f"Invalid latency spec: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        """Sorteia uma latência em segundos."""
+        if self.kind == "none":
+            ms = 0.0
+        elif self.kind == "fixed":
+            ms = self.params[0]
+        elif self.kind == "uniform":
+            ms = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            ms = rng.gauss(*self.params)
+        else:
+            median, sigma = self.params
+            ms = rng.lognormvariate(0.0, sigma) * median
+        return max(0.0, ms) / 1000
+
+
+class FaultProfile:
+    """Perfil de falhas e latência aplicado a cada requisição."""
+
+    FIELDS = {
+        "latency": "none",  # Distribuição de latência (ver LatencyDistribution)
+        "error_rate": 0.0,  # Probabilidade de iniciar uma rajada de erros
+        "error_burst": 1,  # Tamanho da rajada (requisições seguidas com erro)
+        "error_statuses": [500, 502, 503],
+        "throttle_rps": 0.0,  # Limite de requisições/s (0 = sem limite); excedente recebe 429
+        "retry_after": 1,  # Valor do header Retry-After nas respostas 429
+        "timeout_rate": 0.0,  # Probabilidade de segurar a resposta por `hang_seconds`
+        "hang_seconds": 120.0,
+        "drip_rate": 0.0,  # Probabilidade de enviar o corpo em pedaços lentos
+        "drip_chunk": 16,  # Bytes por pedaço
+        "drip_interval_ms": 50.0,  # Intervalo entre pedaços
+    }
+
+    def __init__(self, **kwargs):
+        unknown = set(kwargs) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown profile fields: {sorted(unknown)}")
+
+        for field, default in self.FIELDS.items():
+            setattr(self, field, kwargs.get(field, default))
+        self.latency_distribution = LatencyDistribution(self.latency)
+
+    @classmethod
+    def from_file(cls, path: str) -> "FaultProfile":
+        """Carrega um perfil de um arquivo JSON."""
+        return cls(**json.loads(Path(path).read_text()))
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+# Perfis pré-definidos
+PROFILES: Dict[str, Dict] = {
+    "ideal": {},
+    "realistic": {"latency": "lognormal:80:0.5"},
+    "slow": {"latency": "lognormal:800:0.6", "drip_rate": 0.05},
+    "flaky": {
+        "latency": "lognormal:120:0.7",
+        "error_rate": 0.02,
+        "error_burst": 5,
+        "timeout_rate": 0.005,
+    },
+    "throttled": {"latency": "fixed:50", "throttle_rps": 20, "retry_after": 2},
+    "degraded": {
+        "latency": "normal:1500:400",
+        "error_rate": 0.1,
+        "error_burst": 20,
+        "error_statuses": [429, 502, 503, 504],
+        "timeout_rate": 0.02,
+        "drip_rate": 0.1,
+    },
+}
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP do simulador.
+
+    Rotas `/__*` controlam o simulador (estatísticas e perfil de falhas);
+    as demais passam pelo plano de falhas e são resolvidas como a API da Caixa.
+    """
+
+    protocol_version = "HTTP/1.1"
+    simulator: "UpstreamSimulator"
+
+    # Rotas de controle -> nome do método que as atende
+    GET_ROUTES = {
+        "/__stats": "_get_stats",
+        "/__reset": "_reset_stats",
+        "/__profile": "_get_profile",
+    }
+    POST_ROUTES = {"/__profile": "_set_profile"}
+
+    def _route(self) -> str:
+        return self.path.split("?", 1)[0].rstrip("/")
+
+    def _dispatch(self, routes: Dict[str, str]) -> None:
+        handler = routes.get(self._route())
+        if handler is None:
+            return self._send_json(404, {"message": "Not found"})
+        getattr(self, handler)()
+
+    def _send_json(
+        self, status: int, payload: Any, drip: bool = False, headers: Optional[Dict] = None
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+
+        if drip:
+            self._drip(body)
+        else:
+            self.wfile.write(body)
+
+    def _drip(self, body: bytes) -> None:
+        """Envia o corpo em pedaços espaçados (slow drip)."""
+        profile = self.simulator.profile
+        try:
+            for start in range(0, len(body), profile.drip_chunk):
+                self.wfile.write(body[start : start + profile.drip_chunk])
+                self.wfile.flush()
+                time.sleep(profile.drip_interval_ms / 1000)
+        except (BrokenPipeError, ConnectionResetError):
+            # Cliente desistiu (timeout de leitura), comportamento esperado
+            self.close_connection = True
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/__"):
+            return self._dispatch(self.GET_ROUTES)
+
+        plan = self.simulator.plan_fault()
+        if plan["delay"]:
+            time.sleep(plan["delay"])
+
+        status = plan.get("status")
+        if status == 429:
+            return self._send_json(
+                429,
+                {"message": "Too Many Requests"},
+                headers={"Retry-After": self.simulator.profile.retry_after},
+            )
+        if status:
+            return self._send_json(status, {"message": "Simulated upstream error"})
+
+        status, payload = self.simulator.resolve(self.path)
+        self._send_json(status, payload, drip=plan.get("drip", False))
+
+    def do_POST(self) -> None:
+        self._dispatch(self.POST_ROUTES)
+
+    def _get_stats(self) -> None:
+        self._send_json(200, self.simulator.stats())
+
+    def _reset_stats(self) -> None:
+        self.simulator.reset_stats()
+        self._send_json(200, {"message": "Stats reset"})
+
+    def _get_profile(self) -> None:
+        self._send_json(200, self.simulator.profile.to_dict())
+
+    def _set_profile(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length) or b"{}")
+        try:
+            if "name" in data:
+                profile = FaultProfile(**PROFILES[data["name"]])
+            else:
+                profile = FaultProfile(**data)
+        except (KeyError, ValueError) as e:
+            return self._send_json(400, {"message": str(e)})
+
+        self.simulator.set_profile(profile)
+        self._send_json(200, profile.to_dict())
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UpstreamSimulator:
+    """Servidor HTTP que imita a API da Mega-Sena da Caixa."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        contests: int = 2800,
+        seed: int = 2024,
+        shape: str = "listaDezenas",
+        profile: Optional[FaultProfile] = None,
+        replay_path: Optional[str] = None,
+        record_path: Optional[str] = None,
+        upstream_url: Optional[str] = None,
+    ):
+        self.profile = profile or FaultProfile()
+        self.record_path = record_path
+        self.upstream_url = upstream_url.rstrip("/") if upstream_url else None
+        self.recordings: Dict[str, Tuple[int, Any]] = {}
+
+        if record_path and not self.upstream_url:
+            raise ValueError("Recording requires upstream_url")
+
+        if replay_path:
+            self.recordings = self._load_recordings(replay_path)
+            self.dataset = [body for status, body in self.recordings.values() if status == 200]
+        else:
+            self.dataset = generate_dataset(contests, seed, shape=shape)
+
+        self._by_number = {self._contest_number(draw): draw for draw in self.dataset}
+        self._latest = max(self.dataset, key=self._contest_number) if self.dataset else {}
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls: Counter = Counter()
+        self._faults: Counter = Counter()
+        self._burst_remaining = 0
+        self._throttle_window = 0
+        self._throttle_count = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _contest_number(draw: Dict) -> int:
+        return int(draw.get("numero", draw.get("numeroConcurso", 0)))
+
+    @property
+    def url(self) -> str:
+        """URL base equivalente a `settings.mega_sena_api_url`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    @property
+    def latest(self) -> Dict:
+        """Último concurso disponível."""
+        return self._latest
+
+    def set_profile(self, profile: FaultProfile) -> None:
+        """Troca o perfil de falhas em tempo de execução."""
+        with self._lock:
+            self.profile = profile
+            self._burst_remaining = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Contagem de chamadas por endpoint e de falhas injetadas."""
+        with self._lock:
+            return {**self._calls, "faults": dict(self._faults)}
+
+    def total_calls(self) -> int:
+        """Total de chamadas recebidas."""
+        with self._lock:
+            return sum(self._calls.values())
+
+    def reset_stats(self) -> None:
+        """Zera os contadores."""
+        with self._lock:
+            self._calls.clear()
+            self._faults.clear()
+
+    def _count(self, endpoint: str) -> None:
+        with self._lock:
+            self._calls[endpoint] += 1
+
+    def plan_fault(self) -> Dict[str, Any]:
+        """
+        Decide, de forma determinística pela semente, o que acontece com a
+        próxima requisição: latência, erro, throttling, timeout ou slow drip.
+        """
+        with self._lock:
+            profile = self.profile
+            plan: Dict[str, Any] = {"delay": profile.latency_distribution.sample(self._rng)}
+
+            if profile.throttle_rps:
+                window = int(time.monotonic())
+                if window != self._throttle_window:
+                    self._throttle_window = window
+                    self._throttle_count = 0
+                self._throttle_count += 1
+                if self._throttle_count > profile.throttle_rps:
+                    self._faults["throttled"] += 1
+                    plan["status"] = 429
+                    return plan
+
+            if (
+                self._burst_remaining == 0
+                and profile.error_rate
+                and self._rng.random() < profile.error_rate
+            ):
+                self._burst_remaining = max(1, int(profile.error_burst))
+            if self._burst_remaining > 0:
+                self._burst_remaining -= 1
+                plan["status"] = self._rng.choice(profile.error_statuses)
+                self._faults[f"status_{plan['status']}"] += 1
+                return plan
+
+            if profile.timeout_rate and self._rng.random() < profile.timeout_rate:
+                self._faults["timeout"] += 1
+                plan["delay"] += profile.hang_seconds
+            elif profile.drip_rate and self._rng.random() < profile.drip_rate:
+                self._faults["slow_drip"] += 1
+                plan["drip"] = True
+
+            return plan
+
+    def resolve(self, path: str) -> Tuple[int, Any]:
+        """
+        Resolve um caminho para (status, payload).
+
+        Returns:
+            Tupla com status HTTP e corpo (dict) da resposta
+        """
+        path = path.split("?", 1)[0].rstrip("/")
+
+        if path == BASE_PATH:
+            self._count("latest")
+            if self.upstream_url:
+                return self._proxy(path)
+            if self.recordings and path in self.recordings:
+                return self.recordings[path]
+            return 200, self.latest
+
+        if path.startswith(BASE_PATH + "/"):
+            self._count("contest")
+            if self.upstream_url:
+                return self._proxy(path)
+            if self.recordings and path in self.recordings:
+                return self.recordings[path]
+            try:
+                num = int(path[len(BASE_PATH) + 1 :])
+            except ValueError:
+                return 400, {"message": "Número de concurso inválido"}
+            draw = self._by_number.get(num)
+            if draw is None:
+                return 404, {"message": f"Concurso {num} não encontrado"}
+            return 200, draw
+
+        return 404, {"message": "Not found"}
+
+    def _proxy(self, path: str) -> Tuple[int, Any]:
+        """Encaminha a requisição ao upstream real e grava a resposta."""
+        url = self.upstream_url + path[len(BASE_PATH) :]
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                status, body = response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            status, body = e.code, {"message": str(e)}
+        except (urllib.error.URLError, ValueError) as e:
+            status, body = 502, {"message": f"Upstream error: {e}"}
+
+        if status == 200:
+            with self._lock:
+                self.recordings[path] = (status, body)
+        return status, body
+
+    @staticmethod
+    def _load_recordings(path: str) -> Dict[str, Tuple[int, Any]]:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return {key: (entry["status"], entry["body"]) for key, entry in data.items()}
+
+    def save_recordings(self, path: Optional[str] = None) -> int:
+        """Salva as respostas gravadas em JSON. Retorna a quantidade salva."""
+        path = path or self.record_path
+        if not path:
+            return 0
+        with self._lock:
+            data = {
+                key: {"status": status, "body": body}
+                for key, (status, body) in sorted(self.recordings.items())
+            }
+        Path(path).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return len(data)
+
+    def _make_handler(self) -> type:
+        return type("Handler", (SimulatorHandler,), {"simulator": self})
+
+    def start(self) -> "UpstreamSimulator":
+        """Inicia o servidor em uma thread daemon."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="upstream-simulator", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Para o servidor e salva as gravações, se houver."""
+        self._server.shutdown()
+        self._server.server_close()
+        self.save_recordings()
+
+    def serve_forever(self) -> None:
+        """Executa o servidor na thread atual."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.save_recordings()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulador local da API da Mega-Sena")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--contests", type=int, default=2800)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--shape", choices=PAYLOAD_SHAPES, default="listaDezenas")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="ideal")
+    parser.add_argument("--profile-file", default=None, help="Perfil de falhas em JSON")
+    parser.add_argument("--latency", default=None, help="Sobrescreve a latência do perfil")
+    parser.add_argument(
+        "--record", default=None, help="Grava as respostas do upstream real neste arquivo"
+    )
+    parser.add_argument("--upstream-url", default=None, help="URL real usada na gravação")
+    parser.add_argument("--replay", default=None, help="Reproduz respostas gravadas")
+    args = parser.parse_args(argv)
+
+    if args.profile_file:
+        profile = FaultProfile.from_file(args.profile_file)
+    else:
+        profile = FaultProfile(**PROFILES[args.profile])
+    if args.latency:
+        profile = FaultProfile(**{**profile.to_dict(), "latency": args.latency})
+
+    simulator = UpstreamSimulator(
+        args.host,
+        args.port,
+        args.contests,
+        args.seed,
+        shape=args.shape,
+        profile=profile,
+        replay_path=args.replay,
+        record_path=args.record,
+        upstream_url=args.upstream_url,
+    )
+    print(f"Upstream simulator listening on {simulator.url} (profile: {profile.to_dict()})")
+    simulator.serve_forever()
+
+
+if __name__ == "__main__":
+    main()